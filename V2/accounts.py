@@ -0,0 +1,161 @@
+import configparser
+import json
+import logging
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+DEFAULT_ACCOUNT = 'default'
+
+
+class Account:
+    """One set of JOBKOREA credentials with its own cookie store, daily budget and health state."""
+
+    def __init__(self, name, username, password, session_file, daily_budget):
+        self.name = name
+        self.username = username
+        self.password = password
+        self.session_file = session_file
+        self.daily_budget = daily_budget  # Detail/contact actions per day; 0 means unlimited
+        self.used = 0  # Actions spent on `day`
+        self.day = date.today().isoformat()
+        self.failures = 0  # Consecutive failures
+        self.cooldown_until = 0.0
+        self.last_used = 0.0
+
+    def remaining(self):
+        """Actions left today (a large number when the budget is unlimited)."""
+        today = date.today().isoformat()
+        if self.day != today:
+            self.day, self.used = today, 0
+        if not self.daily_budget:
+            return float('inf')
+        return max(0, self.daily_budget - self.used)
+
+    def available(self, now=None):
+        return self.remaining() > 0 and (now or time.time()) >= self.cooldown_until
+
+
+class AccountPool:
+    """Spreads per-account work over several logins, least recently used first, skipping spent or cooling accounts.
+
+    Accounts are listed in [accounts] `names`; each has a `[account:<name>]` section with
+    `username`, `password`, `session_file` and an optional `daily_budget`. The `default`
+    account is the [web] login with `session.json`.
+    """
+
+    def __init__(self, config_path='config.ini'):
+        self.config = configparser.ConfigParser()
+        self.config.read(config_path)
+        self.logger = logging.getLogger(__name__)
+        self.state_file = Path(self.config.get('accounts', 'state_file', fallback='accounts.json'))
+        self.cooldown = self.config.getint('accounts', 'cooldown_seconds', fallback=600)
+        self.max_failures = self.config.getint('accounts', 'max_failures', fallback=3)
+        default_budget = self.config.getint('accounts', 'daily_budget', fallback=0)
+        names = [n.strip() for n in self.config.get('accounts', 'names', fallback=DEFAULT_ACCOUNT).split(',')
+                 if n.strip()]
+        self.accounts = {}
+        for name in names or [DEFAULT_ACCOUNT]:
+            if name == DEFAULT_ACCOUNT:
+                section, session_file = 'web', 'session.json'
+            else:
+                section, session_file = f'account:{name}', f'session_{name}.json'
+            if not self.config.has_section(section):
+                self.logger.error(f"Account '{name}' has no [{section}] section, skipping it")
+                continue
+            self.accounts[name] = Account(
+                name,
+                self.config.get(section, 'username'),
+                self.config.get(section, 'password'),
+                self.config.get(section, 'session_file', fallback=session_file),
+                self.config.getint(section, 'daily_budget', fallback=default_budget)
+            )
+        self._cond = threading.Condition()
+        self._load_state()
+
+    def __len__(self):
+        return len(self.accounts)
+
+    def get(self, name=None):
+        """The named account, or the default one."""
+        return self.accounts.get(name or DEFAULT_ACCOUNT) or next(iter(self.accounts.values()))
+
+    def _load_state(self):
+        if not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Failed to load account state, starting fresh: {e}")
+            return
+        for name, saved in state.items():
+            account = self.accounts.get(name)
+            if account is not None and saved.get('day') == account.day:
+                account.used = saved.get('used', 0)
+            if account is not None:
+                account.cooldown_until = saved.get('cooldown_until', 0.0)
+
+    def _save_state(self):
+        state = {name: {'day': a.day, 'used': a.used, 'cooldown_until': a.cooldown_until}
+                 for name, a in self.accounts.items()}
+        try:
+            tmp_path = self.state_file.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+            tmp_path.replace(self.state_file)
+        except OSError as e:
+            self.logger.error(f"Failed to save account state: {e}")
+
+    def acquire(self, stop_event=None, timeout=None):
+        """Take the least recently used account with budget left; waits while all are cooling down.
+
+        Returns None when every account has spent its daily budget, on stop, or on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while stop_event is None or not stop_event.is_set():
+                now = time.time()
+                ready = [a for a in self.accounts.values() if a.available(now)]
+                if ready:
+                    # Oldest use first; among equals, the one with the most budget left
+                    account = min(ready, key=lambda a: (a.last_used, -a.remaining()))
+                    account.last_used = now
+                    return account
+                if not any(a.remaining() > 0 for a in self.accounts.values()):
+                    self.logger.warning("Every account has spent its daily budget")
+                    return None
+                wait = min(a.cooldown_until for a in self.accounts.values() if a.remaining() > 0) - now
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        return None
+                # Short waits so a stop request is noticed promptly
+                self._cond.wait(min(max(wait, 0.1), 1.0))
+        return None
+
+    def record(self, account, ok):
+        """Charge a finished action to an account; repeated failures put it on an escalating cool-down."""
+        with self._cond:
+            account.remaining()
+            if ok:
+                account.used += 1
+                account.failures = 0
+            else:
+                account.failures += 1
+                if account.failures >= self.max_failures:
+                    factor = 2 ** (account.failures - self.max_failures)
+                    account.cooldown_until = time.time() + self.cooldown * factor
+                    self.logger.warning(f"Account '{account.name}' failed {account.failures} times, "
+                                        f"cooling down for {self.cooldown * factor}s")
+            self._save_state()
+            self._cond.notify_all()
+
+    def status(self):
+        """Per-account summary: remaining budget, consecutive failures, seconds of cool-down left."""
+        now = time.time()
+        with self._cond:
+            return {name: {'remaining': a.remaining(), 'failures': a.failures,
+                           'cooldown': max(0, round(a.cooldown_until - now))}
+                    for name, a in self.accounts.items()}
@@ -0,0 +1,277 @@
+import asyncio
+import configparser
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from backends import stage_backend
+from contact import NOT_FOUND, ContactClient, extract_contact
+from detail_parser import parse_page
+from driver_pool import get_pool
+from listing import ListingFetcher
+from metrics import get_metrics
+from parse_pool import get_parse_pool
+from ratelimit import TokenBucket
+from scheduler import AdaptiveScheduler
+from search_conditions import SearchCompiler, select_condition
+from seen_index import get_seen_index
+
+_DONE = object()  # Sentinel that tells a stage worker its input is exhausted
+
+class AsyncSiteCrawler(threading.Thread):
+    """Asyncio crawl engine running listing → detail → contact → parse → sink as a staged pipeline.
+
+    Exposes the same constructor, callbacks and `stop()` as `SiteCrawler`, so
+    `CrawlerThread` can run either engine. The shard coordinator passes its own
+    `condition`, seen-ID view and rate limiter to each worker's crawlers.
+    """
+
+    def __init__(self, config_path='config.ini', on_new_callback=None, on_status_callback=None,
+                 condition=None, known_post_ids=None, rate_limiter=None):
+        super().__init__(daemon=True)
+        self.config = configparser.ConfigParser()
+        self.config.read(config_path)
+        self.config_path = config_path
+        self.on_new_callback = on_new_callback
+        self.on_status_callback = on_status_callback
+        self._stop_event = threading.Event()
+        if known_post_ids is None:
+            known_post_ids = get_seen_index(config_path)  # Persistent, shared with the GUI
+        self.known_post_ids = known_post_ids
+        self.logger = logging.getLogger(__name__)
+        self.fetcher = ListingFetcher(config_path)
+        self.contact_client = None
+        if stage_backend(self.config, 'contact') == 'http':
+            self.contact_client = ContactClient(config_path, self.fetcher)
+        self.rate_limiter = rate_limiter or TokenBucket.from_config(self.config)
+        self.concurrency = {
+            stage: self.config.getint('async', f'{stage}_concurrency', fallback=default)
+            for stage, default in (('listing', 2), ('detail', 8), ('contact', 4), ('parse', 2))
+        }
+        self.queue_size = self.config.getint('async', 'queue_size', fallback=100)
+        self.sink_batch_size = self.config.getint('async', 'sink_batch_size', fallback=10)
+        self.condition = condition or select_condition(self.config)
+        self.listing_params = None
+        if self.condition is not None:
+            self.listing_params = SearchCompiler.from_config(self.config).compile(self.condition.condition)
+        if condition is not None:
+            self.search_key = condition.name
+        else:
+            self.search_key = self.config.get('crawling', 'search_key',
+                                              fallback=self.condition.name if self.condition else 'default')
+        self.scheduler = None
+        if self.config.getboolean('scheduler', 'adaptive', fallback=False):
+            self.scheduler = AdaptiveScheduler.from_config(self.config)
+        self.cycle_new_posts = 0
+        self.metrics = get_metrics(self.config)
+        # With [parse] `processes` set, the parse stage runs on worker processes instead of threads.
+        # Shard workers are daemon processes, which cannot start children; they parse on threads.
+        self.parse_pool = None
+        if not multiprocessing.current_process().daemon:
+            self.parse_pool = get_parse_pool(config_path)
+        self.start()
+
+    def _status(self, message):
+        if self.on_status_callback:
+            self.on_status_callback(message)
+
+    def _refresh_session(self):
+        """Borrow a pooled, logged-in driver so session.json holds fresh cookies."""
+        with get_pool(self.config_path).lease():
+            pass
+        self.fetcher.load_cookies()
+
+    def _next_interval(self, new_count):
+        """Seconds until the next cycle: adaptive when [scheduler] is enabled, else `refresh_interval`."""
+        if self.scheduler is None:
+            return self.config.getint('web', 'refresh_interval', fallback=300)
+        self.scheduler.record(self.search_key, new_count)
+        interval = self.scheduler.next_interval(self.search_key)
+        latency = self.scheduler.expected_latency(self.search_key)
+        self.logger.info(f"{new_count} new posts this cycle, next refresh in {interval}s "
+                         f"(expected detection latency ~{latency:.0f}s)")
+        if self.on_status_callback:
+            self.on_status_callback(f"Next refresh in {interval}s, expected detection latency ~{latency:.0f}s")
+        return interval
+
+    def run(self):
+        """Run the pipeline on this thread's own event loop."""
+        try:
+            asyncio.run(self._main())
+        except Exception as e:
+            self.logger.error(f"Crawler initialization error: {str(e)}")
+        finally:
+            self.fetcher.close()
+            self.logger.info("Crawler stopped")
+
+    async def _main(self):
+        # Blocking HTTP and parse calls run on a pool sized for every stage at full concurrency
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=sum(self.concurrency.values()) + 1))
+
+        with self.metrics.span('login'):
+            await asyncio.to_thread(self._refresh_session)
+        self.logger.info("Starting async crawler")
+        self._status("Crawler started")
+
+        while not self._stop_event.is_set():
+            try:
+                self.cycle_new_posts = 0
+                await self._run_cycle()
+                self.metrics.inc('cycles_total')
+            except Exception as e:
+                self.logger.error(f"Crawler loop error: {str(e)}")
+                self.metrics.inc('cycle_errors_total')
+                await asyncio.to_thread(self._stop_event.wait, 10)
+                continue
+            if self._stop_event.is_set():
+                break
+            interval = self._next_interval(self.cycle_new_posts)
+            self.logger.info(f"Finished crawling all pages, waiting {interval} seconds")
+            await asyncio.to_thread(self._stop_event.wait, interval)
+
+    async def _run_cycle(self):
+        """Crawl every listing page once through the bounded stage queues."""
+        with self.metrics.span('listing_load', backend='http'):
+            first_records, total_pages = await asyncio.to_thread(self.fetcher.fetch_posts, 1, self.listing_params)
+        self.logger.info(f"Total pages detected: {total_pages}")
+
+        pages = asyncio.Queue()
+        for page in range(2, total_pages + 1):
+            pages.put_nowait(page)
+        details = asyncio.Queue(self.queue_size)
+        contacts = asyncio.Queue(self.queue_size)
+        parses = asyncio.Queue(self.queue_size)
+        sink = asyncio.Queue(self.queue_size)
+
+        stages = [
+            (pages, self._listing_stage, details, self.concurrency['listing']),
+            (details, self._detail_stage, contacts, self.concurrency['detail']),
+            (contacts, self._contact_stage, parses, self.concurrency['contact']),
+            (parses, self._parse_stage, sink, self.concurrency['parse']),
+        ]
+        workers = [
+            [asyncio.create_task(self._worker(inbox, handler, outbox)) for _ in range(count)]
+            for inbox, handler, outbox, count in stages
+        ]
+        sink_task = asyncio.create_task(self._sink(sink))
+
+        await self._enqueue_records(first_records, details)
+        # Close each stage in order: once its input is drained, its workers are told to finish
+        for (inbox, _, _, _), tasks in zip(stages, workers):
+            for _ in tasks:
+                await inbox.put(_DONE)
+            await asyncio.gather(*tasks)
+        await sink.put(_DONE)
+        await sink_task
+
+    async def _worker(self, inbox, handler, outbox):
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+            if self._stop_event.is_set():
+                continue  # Drain without working so the cycle can wind down
+            try:
+                await handler(item, outbox)
+            except Exception as e:
+                self.logger.error(f"Pipeline stage {handler.__name__} failed: {str(e)}")
+
+    async def _enqueue_records(self, records, outbox):
+        for record in records:
+            if record['id'] in self.known_post_ids:
+                self.logger.info(f"Post {record['id']} already processed, skipping")
+                self.metrics.inc('posts_skipped_total', reason='known')
+            elif not record.get('has_contact'):
+                self.logger.info(f"Post {record['id']}: No contact button, skipping")
+                self.metrics.inc('posts_skipped_total', reason='no_contact')
+            else:
+                await outbox.put(record)
+
+    async def _listing_stage(self, page, outbox):
+        with self.metrics.span('listing_load', backend='http'):
+            records, _ = await asyncio.to_thread(self.fetcher.fetch_posts, page, self.listing_params)
+        await self._enqueue_records(records, outbox)
+
+    async def _detail_stage(self, record, outbox):
+        if not await asyncio.to_thread(self.rate_limiter.acquire, 1, self._stop_event):
+            return
+        with self.metrics.span('detail_open', backend='http'):
+            source = await asyncio.to_thread(self.fetcher.fetch_url, record['details_url'])
+        await outbox.put((record, source))
+
+    async def _contact_stage(self, item, outbox):
+        record, source = item
+        with self.metrics.span('contact_reveal', backend='http'):
+            name, phone, email = await self.reveal_contact(record, source)
+        await outbox.put((record, source, name, phone, email))
+
+    async def reveal_contact(self, record, source):
+        """Return (name, phone, email) for a post via the contact endpoint, else from the details page itself."""
+        if self.contact_client is not None:
+            contact = await asyncio.to_thread(self.contact_client.reveal, record)
+            if contact != (NOT_FOUND, NOT_FOUND, NOT_FOUND):
+                return contact
+        return await asyncio.to_thread(extract_contact, source)
+
+    async def _parse_stage(self, item, outbox):
+        record, source, name, phone, email = item
+        post = {
+            'id': record['id'],
+            'title': record['title'],
+            'company': record['company'],
+            'details': record['details'],
+            'details_url': record['details_url'],
+            'manager_info': "Not found",
+            'recruitment_details': {}
+        }
+        if phone == NOT_FOUND and email == NOT_FOUND and name == NOT_FOUND:
+            # Not delivered and not marked seen, so a later cycle tries the post again
+            self.logger.info(f"Post {record['id']} - Extracted contact info: Not found")
+            return
+        post['manager_info'] = f"Name: {name}, Phone: {phone}, Email: {email}"
+        with self.metrics.span('parse'):
+            post['recruitment_details'] = await self._parse(source, record['id'])
+        await outbox.put(post)
+
+    async def _parse(self, source, post_id):
+        """Parse on the pool when there is one and it works, else on a thread."""
+        pool = self.parse_pool
+        if pool is not None and not pool.broken:
+            try:
+                # `parse_concurrency` already bounds how many pages are in flight
+                return await asyncio.wait_for(
+                    asyncio.get_running_loop().run_in_executor(pool.executor, parse_page, source, post_id),
+                    pool.timeout)
+            except BrokenProcessPool as e:
+                pool.mark_broken(e)
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Post {post_id} - Parse took over {pool.timeout:.0f}s on the pool, parsing inline")
+        return await asyncio.to_thread(parse_page, source, post_id)
+
+    async def _sink(self, inbox):
+        batch = []
+        while True:
+            post = await inbox.get()
+            if post is not _DONE and post['id'] not in self.known_post_ids:
+                self.known_post_ids.add(post['id'])
+                self.cycle_new_posts += 1
+                self.metrics.inc('posts_fetched_total')
+                batch.append(post)
+                self.logger.info(f"Post {post['id']} extracted successfully")
+            if batch and (post is _DONE or len(batch) >= self.sink_batch_size):
+                if self.on_new_callback:
+                    with self.metrics.span('callback'):
+                        await asyncio.to_thread(self.on_new_callback, batch)
+                self.metrics.inc('posts_delivered_total', len(batch))
+                self.logger.info(f"Delivered {len(batch)} new posts")
+                batch = []
+            if post is _DONE:
+                return
+
+    def stop(self):
+        """Stop the crawler; in-flight requests finish and queued work is dropped."""
+        self._stop_event.set()
+        self.logger.info("Crawler stop requested")
@@ -7,26 +7,23 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('crawler.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+from lean import LeanProfile
+from listing import BASE_URL
+from replay import get_recorder
 
 
 class AuthManager:
-    """Handles JOBKOREA login with session caching."""
+    """Handles JOBKOREA login with session caching, for the [web] login or an `accounts.Account`."""
 
-    def __init__(self, config_path='config.ini'):
+    def __init__(self, config_path='config.ini', account=None):
         self.config = configparser.ConfigParser()
         self.config.read(config_path)
-        self.session_file = Path('session.json')
+        self.account = account
+        self.session_file = Path(account.session_file if account else 'session.json')
         self.driver = None
+        self.lean = LeanProfile(self.config)
+        self.base_url = self.config.get('web', 'base_url', fallback=BASE_URL).rstrip('/')
+        self.recorder = get_recorder(self.config)
         self.logger = logging.getLogger(__name__)
 
     def _init_driver(self, headless=True):
@@ -34,7 +31,9 @@ class AuthManager:
         options = Options()
         # if headless:
             # options.add_argument("--headless=new")
+        self.lean.apply_options(options)
         self.driver = webdriver.Chrome(options=options)
+        self.lean.apply(self.driver)
         self.logger.info("WebDriver initialized")
 
     def _save_session(self):
@@ -43,14 +42,14 @@ class AuthManager:
             cookies = self.driver.get_cookies()
             with open(self.session_file, 'w') as f:
                 json.dump(cookies, f)
-            self.logger.info("Session cookies saved to session.json")
+            self.logger.info(f"Session cookies saved to {self.session_file}")
 
     def _load_session(self):
         """Load session cookies from file."""
         if self.session_file.exists():
             try:
                 self._init_driver(headless=True)
-                self.driver.get("https://www.jobkorea.co.kr/")  # Navigate to base URL to set cookies
+                self.driver.get(f"{self.base_url}/")  # Navigate to base URL to set cookies
                 with open(self.session_file, 'r') as f:
                     cookies = json.load(f)
                 for cookie in cookies:
@@ -86,6 +85,8 @@ class AuthManager:
             url = self.config.get('web', 'url')
             self.logger.info(f"Navigating to login page: {url}")
             self.driver.get(url)
+            if self.recorder is not None:
+                self.recorder.add_page(url, self.driver.page_source)
 
             # Select Individual Member tab
             self.logger.info("Selecting Individual Member tab")
@@ -94,8 +95,11 @@ class AuthManager:
             ).click()
 
             # Enter credentials
-            username = self.config.get('web', 'username')
-            password = self.config.get('web', 'password')
+            if self.account is not None:
+                username, password = self.account.username, self.account.password
+            else:
+                username = self.config.get('web', 'username')
+                password = self.config.get('web', 'password')
             self.logger.info("Entering login credentials")
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.ID, 'M_ID'))
@@ -109,6 +113,8 @@ class AuthManager:
                 EC.presence_of_element_located((By.XPATH, '//a[contains(text(), "로그아웃")]'))
             )
             self.logger.info("Login successful")
+            if self.recorder is not None:
+                self.recorder.add_page(self.driver.current_url, self.driver.page_source)
 
             # Save session cookies
             self._save_session()
@@ -121,6 +127,21 @@ class AuthManager:
                 self.driver.quit()
             raise
 
+    def is_logged_in(self, timeout=5):
+        """Probe for the logout link, loading the home page if the current page lacks it."""
+        if not self.driver:
+            return False
+        try:
+            if self.driver.find_elements(By.XPATH, '//a[contains(text(), "로그아웃")]'):
+                return True
+            self.driver.get(f"{self.base_url}/")
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, '//a[contains(text(), "로그아웃")]'))
+            )
+            return True
+        except Exception:
+            return False
+
     def close(self):
         """Close the WebDriver."""
         if self.driver:
@@ -0,0 +1,211 @@
+import abc
+import asyncio
+import configparser
+import json
+import logging
+import threading
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from listing import ListingFetcher, USER_AGENT
+
+BACKENDS = ('selenium', 'playwright', 'http')
+
+
+class BackendUnsupported(Exception):
+    """Raised when a backend cannot perform an operation (e.g. clicking over plain HTTP)."""
+
+
+class FetchBackend(abc.ABC):
+    """Operations a crawl stage needs from whatever fetches its pages."""
+
+    name = None
+    interactive = False  # True when the backend can click and run scripts
+
+    @abc.abstractmethod
+    def open_page(self, url):
+        """Load a URL and return its HTML."""
+
+    @abc.abstractmethod
+    def get_html(self):
+        """HTML of the page currently open."""
+
+    def click_and_wait(self, selector, timeout=10):
+        """Click the CSS `selector`, then wait until it is gone (or hidden) from the page."""
+        raise BackendUnsupported(f"{self.name} backend cannot click")
+
+    def run_script(self, script, *args):
+        """Run JavaScript in the page and return its result."""
+        raise BackendUnsupported(f"{self.name} backend cannot run scripts")
+
+    def load_cookies(self, cookies):
+        """Adopt a Selenium-format cookie list; backends that share the driver ignore it."""
+
+    def close(self):
+        """Release the backend's resources."""
+
+
+class SeleniumBackend(FetchBackend):
+    """Backend over a Selenium WebDriver (typically a `DriverPool` lease)."""
+
+    name = 'selenium'
+    interactive = True
+
+    def __init__(self, driver, lease=None):
+        self.driver = driver
+        self.lease = lease
+
+    def open_page(self, url):
+        self.driver.get(url)
+        WebDriverWait(self.driver, 20).until(EC.presence_of_element_located((By.XPATH, '//body')))
+        return self.driver.page_source
+
+    def get_html(self):
+        return self.driver.page_source
+
+    def click_and_wait(self, selector, timeout=10):
+        element = WebDriverWait(self.driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+        try:
+            element.click()
+        except Exception:
+            self.driver.execute_script("arguments[0].click();", element)
+        WebDriverWait(self.driver, timeout).until(EC.invisibility_of_element_located((By.CSS_SELECTOR, selector)))
+
+    def run_script(self, script, *args):
+        return self.driver.execute_script(script, *args)
+
+    def close(self):
+        if self.lease is not None:
+            self.lease.release()
+            self.lease = None
+
+
+class PlaywrightBackend(FetchBackend):
+    """Async Playwright (Chromium) driven from its own event loop thread, exposed synchronously."""
+
+    name = 'playwright'
+    interactive = True
+
+    def __init__(self, config_path='config.ini', session_file='session.json'):
+        config = configparser.ConfigParser()
+        config.read(config_path)
+        self.headless = config.getboolean('crawling', 'headless', fallback=True)
+        self.session_file = Path(session_file)
+        self.logger = logging.getLogger(__name__)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='playwright-loop', daemon=True)
+        self._thread.start()
+        self._playwright = self._browser = self._context = self._page = None
+        self._call(self._start())
+
+    def _call(self, coroutine, timeout=60):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    async def _start(self):
+        from playwright.async_api import async_playwright
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        self._context = await self._browser.new_context(user_agent=USER_AGENT)
+        if self.session_file.exists():
+            with open(self.session_file, 'r') as f:
+                await self._add_cookies(json.load(f))
+        self._page = await self._context.new_page()
+        self.logger.info("Playwright backend started")
+
+    async def _add_cookies(self, cookies):
+        converted = []
+        for cookie in cookies:
+            item = {'name': cookie['name'], 'value': cookie['value'],
+                    'domain': cookie.get('domain', '.jobkorea.co.kr'), 'path': cookie.get('path', '/'),
+                    'httpOnly': cookie.get('httpOnly', False), 'secure': cookie.get('secure', False)}
+            if 'expiry' in cookie:
+                item['expires'] = cookie['expiry']
+            if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+                item['sameSite'] = cookie['sameSite']
+            converted.append(item)
+        await self._context.add_cookies(converted)
+
+    async def _open(self, url):
+        await self._page.goto(url, wait_until='domcontentloaded')
+        return await self._page.content()
+
+    async def _click_and_wait(self, selector, timeout):
+        await self._page.click(selector, timeout=timeout * 1000)
+        await self._page.wait_for_selector(selector, state='hidden', timeout=timeout * 1000)
+
+    def open_page(self, url):
+        return self._call(self._open(url))
+
+    def get_html(self):
+        return self._call(self._page.content())
+
+    def click_and_wait(self, selector, timeout=10):
+        self._call(self._click_and_wait(selector, timeout), timeout + 5)
+
+    def run_script(self, script, *args):
+        # Wrapped in a plain function so scripts written for Selenium can keep using `arguments[0]`
+        return self._call(self._page.evaluate(f"function () {{ {script} }}", args[0] if args else None))
+
+    def load_cookies(self, cookies):
+        self._call(self._add_cookies(cookies))
+
+    def close(self):
+        async def _stop():
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        try:
+            self._call(_stop())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+
+
+class HttpBackend(FetchBackend):
+    """Plain HTTP backend over the pooled, cookie-authenticated `ListingFetcher` session."""
+
+    name = 'http'
+
+    def __init__(self, fetcher):
+        self.fetcher = fetcher
+        self._html = ""
+
+    def open_page(self, url):
+        self._html = self.fetcher.fetch_url(url)
+        return self._html
+
+    def get_html(self):
+        return self._html
+
+    def load_cookies(self, cookies):
+        self.fetcher.load_cookies(cookies)
+
+
+def stage_backend(config, stage):
+    """Backend name configured for a crawl stage (`listing`, `detail` or `contact`)."""
+    legacy = {
+        'listing': config.get('crawling', 'listing_backend', fallback='selenium'),
+        'detail': 'selenium',
+        'contact': 'http' if config.get('contact', 'backend', fallback='browser') == 'http' else 'selenium',
+    }
+    name = config.get('backends', stage, fallback=legacy[stage]).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown {stage} backend '{name}', expected one of {', '.join(BACKENDS)}")
+    return name
+
+
+def create_backend(name, config_path='config.ini', fetcher=None, driver_pool=None):
+    """Build a backend by name; Selenium backends lease a driver from `driver_pool`."""
+    if name == 'http':
+        return HttpBackend(fetcher or ListingFetcher(config_path))
+    if name == 'playwright':
+        return PlaywrightBackend(config_path)
+    if name == 'selenium':
+        lease = driver_pool.lease()
+        return SeleniumBackend(lease.driver, lease)
+    raise ValueError(f"Unknown backend '{name}'")
@@ -0,0 +1,295 @@
+"""Offline crawler benchmarks over a recorded archive (see replay.py), compared with a committed baseline.
+
+    python bench.py                                   # writes bench_results.json, compares with bench_baseline.json
+    python bench.py recordings.zip --update-baseline  # accepts the current numbers as the new baseline
+
+The default archive, bench_recordings.zip, is the fixed corpus built by bench_corpus.py; it is committed
+together with the bench_baseline.json recorded against it. Without a baseline file the run fails until
+one is written with --update-baseline.
+"""
+import argparse
+import configparser
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import psutil
+except ImportError:  # Peak RSS comes from `resource` where available
+    psutil = None
+
+from async_crawler import AsyncSiteCrawler
+from contact import extract_contact
+from crawler import SiteCrawler, parse_detail_page
+from export import DataExporter
+from listing import ListingParser
+from log_setup import setup_logging
+from replay import Archive, ReplayServer
+
+# Metric -> True when a higher value is better
+METRICS = {
+    'listing_parse_ms_per_page': False,
+    'detail_parse_ms_per_post': False,
+    'cycle_wall_s': False,
+    'posts_per_minute': True,
+    'site_cycle_wall_s': False,
+    'site_posts_per_minute': True,
+    'export_ms': False,
+    'peak_rss_mb': False,
+}
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB, or None when it cannot be measured."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KB elsewhere
+    except ImportError:
+        pass
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)  # Peak working set on Windows
+    return None
+
+
+def _time_per_item(func, items, repeat):
+    """Median over `repeat` runs of the mean milliseconds `func` takes per item."""
+    if not items:
+        return None
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for item in items:
+            func(item)
+        runs.append((time.perf_counter() - started) * 1000 / len(items))
+    return statistics.median(runs)
+
+
+def bench_parsers(archive, repeat):
+    """Listing and detail parse times over every recorded `_GI_List` and `GI_Read` body."""
+    listings = [m['body'].decode('utf-8', errors='replace') for m in archive.exchanges.values()
+                if '_GI_List' in m['url'] and m['status'] == 200]
+    details = [m['body'].decode('utf-8', errors='replace') for m in archive.exchanges.values()
+               if 'GI_Read' in m['url'] and 'Charge' not in m['url'] and m['status'] == 200]
+    parser = ListingParser()
+
+    def parse_listing(source):
+        parser.parse(source)
+        parser.total_pages(source)
+
+    def parse_detail(source):
+        extract_contact(source)
+        parse_detail_page(source)
+
+    # Per-post info lines and per-field "not found" warnings would dominate the timing
+    quiet = {name: logging.getLogger(name).level for name in ('detail_parser', 'contact')}
+    for name in quiet:
+        logging.getLogger(name).setLevel(logging.ERROR)
+    try:
+        return {
+            'listing_pages': len(listings),
+            'detail_posts': len(details),
+            'listing_parse_ms_per_page': _time_per_item(parse_listing, listings, repeat),
+            'detail_parse_ms_per_post': _time_per_item(parse_detail, details, repeat),
+        }
+    finally:
+        for name, level in quiet.items():
+            logging.getLogger(name).setLevel(level)
+
+
+class _BenchCrawler(AsyncSiteCrawler):
+    """One pipeline cycle against the replay server: no browser login, no refresh wait."""
+
+    def _refresh_session(self):
+        self.fetcher.load_cookies([])
+
+    def _next_interval(self, new_count):
+        self._stop_event.set()
+        return 0
+
+
+class _NoBrowser:
+    """Stands in for the listing driver when every `SiteCrawler` stage runs over HTTP; the cookies come from session.json."""
+
+    current_url = 'about:blank'
+    current_window_handle = 'bench'
+
+    class switch_to:
+        @staticmethod
+        def window(handle):
+            pass
+
+    def get(self, url):
+        pass
+
+    def get_cookies(self):
+        return []
+
+
+class _BenchSiteCrawler(SiteCrawler):
+    """One `SiteCrawler` cycle with HTTP listing, detail and contact backends: no browser login, no refresh wait."""
+
+    def _refresh_session(self):
+        return _NoBrowser()
+
+    def _next_interval(self, new_count):
+        self._stop_event.set()
+        return 0
+
+
+def _bench_config(config_path, origin, workdir):
+    """config.ini pointed at the replay server, with state files in `workdir`, HTTP backends, the empty search
+    condition and no pacing or caching."""
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    overrides = {
+        'web': {'base_url': origin, 'url': f"{origin}/Login/Logout.asp"},
+        'crawling': {'detail_rate_per_minute': '1000000', 'detail_burst': '1000', 'incremental': 'False',
+                     'frontier_file': str(workdir / 'frontier.db')},
+        'backends': {'listing': 'http', 'detail': 'http', 'contact': 'http'},
+        'accounts': {'names': 'default'},
+        'seen_index': {'path': str(workdir / 'seen.idx')},
+        'cache': {'enabled': 'False'},
+        'scheduler': {'adaptive': 'False'},
+        'replay': {'record': ''},
+    }
+    # Always the empty condition, whose listing requests are plain `_GI_List?Page=N`: the requests then match
+    # the archive whatever search config.ini selects (record live archives for bench with an empty condition too)
+    conditions_file = workdir / 'bench_conditions.json'
+    conditions_file.write_text(json.dumps([{'name': 'bench', 'condition': {}}]), encoding='utf-8')
+    overrides['search'] = {'conditions_file': str(conditions_file), 'condition': '', 'extra_params': '',
+                           'skip_controls': 'sort, exclude_viewed'}
+    for section, values in overrides.items():
+        if not config.has_section(section):
+            config.add_section(section)
+        for key, value in values.items():
+            config.set(section, key, value)
+    path = workdir / 'bench_config.ini'
+    with open(path, 'w') as f:
+        config.write(f)
+    return str(path)
+
+
+def bench_cycle(archive, config_path, latency_ms, repeat):
+    """Wall time and throughput of one full async crawl cycle, plus exporting what it found (median of `repeat`)."""
+    server = ReplayServer(archive, port=0, latency_ms=latency_ms, seed=0)
+    server.start_background()
+    posts = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            crawler_config = _bench_config(config_path, server.origin, workdir)
+            started = time.perf_counter()
+            crawler = _BenchCrawler(config_path=crawler_config, on_new_callback=posts.extend)
+            crawler.join()
+            wall = time.perf_counter() - started
+            crawler.known_post_ids.close()
+
+            exporter = DataExporter(workdir / 'output')
+            export_ms = _time_per_item(lambda batch: exporter.export_to_excel(batch, 'bench.xlsx'), [posts], repeat)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return {
+        'posts': len(posts),
+        'cycle_wall_s': wall,
+        'posts_per_minute': len(posts) / wall * 60 if wall else None,
+        'export_ms': export_ms,
+        'replay': dict(server.stats),
+    }
+
+
+def bench_site_cycle(archive, config_path, latency_ms):
+    """Wall time and throughput of one `SiteCrawler` cycle with every stage over HTTP."""
+    server = ReplayServer(archive, port=0, latency_ms=latency_ms, seed=0)
+    server.start_background()
+    posts = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            crawler_config = _bench_config(config_path, server.origin, Path(tmp))
+            started = time.perf_counter()
+            crawler = _BenchSiteCrawler(config_path=crawler_config, on_new_callback=posts.extend)
+            crawler.join()
+            wall = time.perf_counter() - started
+            crawler.known_post_ids.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+    return {
+        'site_posts': len(posts),
+        'site_cycle_wall_s': wall,
+        'site_posts_per_minute': len(posts) / wall * 60 if wall else None,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print each metric against the baseline; returns the metrics that regressed beyond `tolerance`."""
+    regressions = []
+    print(f"{'metric':<28}{'baseline':>12}{'current':>12}{'change':>10}")
+    for metric, higher_is_better in METRICS.items():
+        current, previous = results.get(metric), baseline.get(metric)
+        if current is None or not previous:
+            print(f"{metric:<28}{'-' if previous is None else f'{previous:.2f}':>12}"
+                  f"{'-' if current is None else f'{current:.2f}':>12}")
+            continue
+        change = (current - previous) / previous
+        worse = -change if higher_is_better else change
+        flag = "  REGRESSION" if worse > tolerance else ""
+        print(f"{metric:<28}{previous:>12.2f}{current:>12.2f}{change:>+10.1%}{flag}")
+        if flag:
+            regressions.append(metric)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the crawler offline against a recorded archive.")
+    parser.add_argument('archive', nargs='?', default='bench_recordings.zip')
+    parser.add_argument('--config', default='config.ini')
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per parse and export benchmark (median is reported)")
+    parser.add_argument('--latency-ms', type=int, default=0, help="Replay server latency for the cycle benchmark")
+    parser.add_argument('--results', default='bench_results.json')
+    parser.add_argument('--baseline', default='bench_baseline.json')
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative slowdown before failing")
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args()
+
+    setup_logging(args.config)
+    logging.getLogger().setLevel(logging.WARNING)  # Keep per-post progress lines off the results table
+    archive = Archive(args.archive)
+    results = {'archive': args.archive, 'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    results.update(bench_parsers(archive, args.repeat))
+    results.update(bench_cycle(archive, args.config, args.latency_ms, args.repeat))
+    results.update(bench_site_cycle(archive, args.config, args.latency_ms))
+    results['peak_rss_mb'] = peak_rss_mb()
+
+    with open(args.results, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.results}")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --update-baseline to accept these numbers")
+        return 2
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('archive') != results['archive']:
+        print(f"Warning: baseline was recorded against {baseline.get('archive')}")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"Regressed beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Builds the fixed archive bench.py runs against: synthetic listing, details and reveal pages in the live markup.
+
+    python bench_corpus.py                  # writes bench_recordings.zip
+    python bench_corpus.py other.zip --pages 5 --posts-per-page 40
+
+The pages come from a fixed seed, so rebuilding gives the same corpus; bench_baseline.json is
+recorded against it and only changes with it.
+Recordings of the live site (see replay.py) can be benchmarked too, by passing them to bench.py.
+"""
+import argparse
+import random
+from pathlib import Path
+
+from listing import BASE_URL, listing_url
+from replay import Recorder
+
+CHARGE_PATH = '/Recruit/GI_Read_Charge_Info'  # [contact] endpoint default
+REGIONS = ['서울 강남구', '서울 마포구', '경기 성남시', '부산 해운대구', '인천 연수구']
+INDUSTRIES = ['솔루션·SI·ERP·CRM', '웹에이전시', '제조·생산', '유통·무역', '광고·마케팅']
+FORMS = ['중소기업', '중견기업', '벤처기업', '외국계']
+# Navigation and footer markup standing in for the rest of a live page, so parse times see a realistic tree
+_FILLER = ''.join(f'<li class="navItem"><a href="/Recruit/Home/_GI_List?menu={n}">메뉴 {n}</a></li>' for n in range(400))
+
+
+def _listing_row(post_id, rng):
+    return f"""<tr class="devloopArea" data-info="{post_id}">
+<th scope="row"><input type="checkbox" name="chk" value="{post_id}"></th>
+<td class="tplCo"><a href="/Recruit/Co_Read/C/{post_id % 9000 + 1000}" class="link normalLog">회사 {post_id % 97}</a></td>
+<td class="tplTit"><div class="titBx"><strong><a class="link normalLog" href="/Recruit/GI_Read/{post_id}?Oem_Code=C1"
+ title="채용 공고 {post_id}">채용 공고 {post_id}</a></strong>
+<p class="etc"><span class="cell">경력{rng.randint(1, 10)}년↑</span><span class="cell">대졸↑</span>
+<span class="cell">{rng.choice(REGIONS)}</span><span class="cell">정규직</span></p></div></td>
+<td class="odd"><span class="time dotum">{rng.randint(1, 59)}분 전 등록</span>
+<button type="button" class="tplBtn tplBtn_1 tplBtnBlue devOpenCharge">담당자 연락처</button></td>
+</tr>"""
+
+
+def listing_page(post_ids, page, pages, rng):
+    rows = '\n'.join(_listing_row(post_id, rng) for post_id in post_ids)
+    links = ''.join(f'<li><a href="/Recruit/_GI_List?Page={n}">{n}</a></li>' for n in range(1, pages + 1))
+    return f"""<div id="dev-gi-list"><table class="tplList"><tbody>
+{rows}
+</tbody></table></div>
+<div class="tplPagination"><ul>{links}</ul></div>"""
+
+
+def manager_block(post_id):
+    return f"""<div class="manager">
+<dl><dt>담당자</dt><dd>담당자{post_id % 100}</dd></dl>
+<dl><dt>전화</dt><dd class="devTplLyClick"><span class="tahoma">02-{post_id % 9000 + 1000}-{post_id % 10000:04d}</span></dd></dl>
+<dl><dt>이메일</dt><dd><a href="mailto:hr{post_id}@example.com">hr{post_id}@example.com</a></dd></dl>
+</div>"""
+
+
+def details_page(post_id, rng):
+    return f"""<!DOCTYPE html><html lang="ko"><head><title>채용 공고 {post_id}</title></head><body>
+<header><ul class="navList">{_FILLER}</ul></header>
+<section class="secReadSummary"><div class="tbRow clear">
+<div class="tbCol"><dl class="tbList">
+<dt>경력</dt><dd><strong class="col_1">경력{rng.randint(1, 10)}년↑</strong></dd>
+<dt>학력</dt><dd><strong class="col_1">대졸↑</strong></dd>
+<dt>고용형태</dt><dd><ul class="addList"><li><strong class="col_1">정규직</strong> 수습 3개월</li></ul></dd>
+</dl></div>
+<div class="tbCol"><dl class="tbList">
+<dt>급여</dt><dd>회사내규에 따름</dd>
+<dt>지역</dt><dd><a href="#">{rng.choice(REGIONS)}</a></dd>
+<dt>시간</dt><dd>주 5일(월~금) 09:00~18:00</dd>
+</dl></div>
+<div class="tbCol tbCoInfo"><dl class="tbList">
+<dt>산업</dt><dd><text>{rng.choice(INDUSTRIES)}</text></dd>
+<dt>설립</dt><dd><text><span class="tahoma">{rng.randint(1980, 2022)}</span>년</text></dd>
+<dt>기업형태</dt><dd>{rng.choice(FORMS)}</dd>
+</dl></div>
+</div></section>
+<section class="secReadManager">{manager_block(post_id)}</section>
+<footer><ul class="footList">{_FILLER}</ul><p>고객센터 1588-9350</p></footer>
+</body></html>"""
+
+
+def build(path, pages=3, posts_per_page=20, seed=0):
+    """Write the corpus to `path`, replacing any archive already there; returns the number of posts."""
+    path = Path(path)
+    path.unlink(missing_ok=True)
+    rng = random.Random(seed)
+    recorder = Recorder(str(path))
+    post_id = 48000000
+    for page in range(1, pages + 1):
+        post_ids = list(range(post_id, post_id + posts_per_page))
+        post_id += posts_per_page
+        recorder.add_page(listing_url(BASE_URL, page), listing_page(post_ids, page, pages, rng))
+        for number in post_ids:
+            recorder.add_page(f"{BASE_URL}/Recruit/GI_Read/{number}?Oem_Code=C1", details_page(number, rng))
+            recorder.add_page(f"{BASE_URL}{CHARGE_PATH}", manager_block(number), 'POST', f"Gno={number}")
+    recorder.close()
+    return pages * posts_per_page
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the synthetic archive the benchmarks run against.")
+    parser.add_argument('archive', nargs='?', default='bench_recordings.zip')
+    parser.add_argument('--pages', type=int, default=3)
+    parser.add_argument('--posts-per-page', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    posts = build(args.archive, args.pages, args.posts_per_page, args.seed)
+    print(f"Wrote {posts} posts on {args.pages} listing pages to {args.archive}")
+
+
+if __name__ == '__main__':
+    main()
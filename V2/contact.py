@@ -0,0 +1,149 @@
+import configparser
+import json
+import logging
+import re
+from urllib.parse import urljoin
+
+from lxml import etree, html
+
+from listing import ListingFetcher
+
+NOT_FOUND = "Not found"
+
+# Contact fields as rendered on a `GI_Read` page (or the fragment the reveal request returns)
+_manager_name = etree.XPath('(//div[contains(@class, "manager")]//dt)[1]/following-sibling::dd[1]')
+_manager_phones = etree.XPath(
+    '//dd[contains(@class, "devTplLyClick")]//span[contains(@class, "tahoma") and not(contains(@class, "tplHide"))]')
+_manager_email = etree.XPath('//dd[not(contains(@class, "tplHide"))]//a[contains(@href, "mailto:")]')
+
+# Markup of the manager block; a reveal reply without it (a login, error or whole page) is not a contact
+_manager_markup = etree.XPath('boolean(//div[contains(@class, "manager")] | //dd[contains(@class, "devTplLyClick")])')
+_FULL_DOCUMENT = re.compile(r'^\s*(?:<!doctype[^>]*>\s*)?<html[\s>]', re.IGNORECASE)
+
+_PHONE = re.compile(r'\b0\d{1,2}-\d{3,4}-\d{4}\b')
+_EMAIL = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+
+
+def extract_contact(source):
+    """Return (name, phone, email) from a details page, "Not found" for missing fields."""
+    if not source or not source.strip():
+        return NOT_FOUND, NOT_FOUND, NOT_FOUND
+    tree = html.fromstring(source)
+    names = _manager_name(tree)
+    phones = [elem.text_content().strip() for elem in _manager_phones(tree)]
+    emails = _manager_email(tree)
+    name = names[0].text_content().strip() if names else NOT_FOUND
+    phone = ", ".join(phones) if phones else NOT_FOUND
+    email = emails[0].text_content().strip() if emails else NOT_FOUND
+    return name, phone, email
+
+
+# Manager fields of a JSON reveal response, by exact key (compared case-insensitively); [contact]
+# `name_keys`, `phone_keys` and `email_keys` replace a list when the response uses other names
+JSON_KEYS = {
+    'name': ('ChargeName', 'ChargeNm', 'MngrName', 'ManagerName'),
+    'phone': ('ChargeTel', 'ChargePhone', 'ChargeHp', 'ChargeHPhone', 'MngrTel', 'MngrHp', 'ManagerPhone'),
+    'email': ('ChargeEmail', 'ChargeMail', 'MngrEmail', 'ManagerEmail'),
+}
+
+
+def json_keys(config):
+    """`JSON_KEYS` with the lists overridden in [contact]."""
+    keys = dict(JSON_KEYS)
+    for field in keys:
+        value = config.get('contact', f'{field}_keys', fallback='')
+        if value.strip():
+            keys[field] = tuple(k.strip() for k in value.split(',') if k.strip())
+    return keys
+
+
+def _from_json(data, keys=JSON_KEYS):
+    """Pick name/phone/email out of a JSON reveal response by the keys in `keys`; every phone field is kept."""
+    fields = {key.lower(): field for field, names in keys.items() for key in names}
+    found = {'name': [], 'phone': [], 'email': []}
+
+    def walk(value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if isinstance(item, (dict, list)):
+                    walk(item)
+                elif item and str(key).lower() in fields:
+                    text = str(item).strip()
+                    values = found[fields[str(key).lower()]]
+                    if text and text not in values:
+                        values.append(text)
+        elif isinstance(value, list):
+            for item in value:
+                walk(item)
+
+    walk(data)
+    name = found['name'][0] if found['name'] else NOT_FOUND
+    phone = ", ".join(found['phone']) if found['phone'] else NOT_FOUND
+    email = found['email'][0] if found['email'] else NOT_FOUND
+    return name, phone, email
+
+
+def parse_contact_response(text, keys=JSON_KEYS):
+    """Parse the reveal response, JSON or an HTML fragment of the manager block, into (name, phone, email).
+
+    Anything else (a whole `<html>` document, a login or error page) is all "Not found", so the
+    caller falls back to the details page instead of taking footer numbers for the contact.
+    """
+    try:
+        return _from_json(json.loads(text), keys)
+    except ValueError:
+        pass
+    if not text or not text.strip() or _FULL_DOCUMENT.match(text) or not _manager_markup(html.fromstring(text)):
+        return NOT_FOUND, NOT_FOUND, NOT_FOUND
+    name, phone, email = extract_contact(text)
+    if phone == NOT_FOUND:
+        phones = _PHONE.findall(text)
+        phone = ", ".join(dict.fromkeys(phones)) if phones else NOT_FOUND
+    if email == NOT_FOUND:
+        emails = _EMAIL.findall(text)
+        email = emails[0] if emails else NOT_FOUND
+    return name, phone, email
+
+
+def reveal_request(config, base_url, post_id):
+    """(method, url, form fields) of the request behind `button.devOpenCharge`, as set in [contact].
+
+    `{post_id}` in the endpoint or the form fields is replaced with the post's GI_Read number.
+    """
+    endpoint = config.get('contact', 'endpoint', fallback='/Recruit/GI_Read_Charge_Info')
+    form = config.get('contact', 'form', fallback='Gno={post_id}')
+    url = urljoin(base_url, endpoint.format(post_id=post_id))
+    data = dict(pair.split('=', 1) for pair in form.format(post_id=post_id).split('&') if '=' in pair)
+    return config.get('contact', 'method', fallback='POST').upper(), url, data
+
+
+class ContactClient:
+    """Calls the request behind `button.devOpenCharge` directly over the authenticated HTTP session."""
+
+    def __init__(self, config_path='config.ini', fetcher=None):
+        self.config = configparser.ConfigParser()
+        self.config.read(config_path)
+        self.fetcher = fetcher or ListingFetcher(config_path)
+        self.method = self.config.get('contact', 'method', fallback='POST').upper()
+        self.json_keys = json_keys(self.config)
+        self.logger = logging.getLogger(__name__)
+
+    def _request(self, record):
+        _, url, data = reveal_request(self.config, self.fetcher.base_url, record['id'])
+        headers = {'Referer': record['details_url'], 'X-Requested-With': 'XMLHttpRequest'}
+        if self.method == 'GET':
+            response = self.fetcher.session.get(url, params=data, headers=headers, timeout=15)
+        else:
+            response = self.fetcher.session.post(url, data=data, headers=headers, timeout=15)
+        response.raise_for_status()
+        return response.text
+
+    def reveal(self, record):
+        """Return (name, phone, email) for a listing record; "Not found" fields when the reveal fails."""
+        try:
+            name, phone, email = parse_contact_response(self._request(record), self.json_keys)
+        except Exception as e:
+            self.logger.error(f"Post {record['id']} - Contact reveal request failed: {e}")
+            return NOT_FOUND, NOT_FOUND, NOT_FOUND
+        self.logger.info(f"Post {record['id']} - Revealed contact: Name: {name}, Phone: {phone}, Email: {email}")
+        return name, phone, email
@@ -0,0 +1,180 @@
+import configparser
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+
+from log_setup import forward_logs, setup_logging
+from ratelimit import TokenBucket
+from search_conditions import load_conditions
+from seen_index import SeenIndex, get_seen_index
+
+
+def _shard_worker(worker_id, config_path, workers, commands, results, log_queue):
+    """Worker process: one `AsyncSiteCrawler` per assigned condition, posts sent back on `results`."""
+    # Records go to the coordinator's log file instead of each process rotating it
+    setup_logging(config_path, log_queue)
+    # Imported here so the spawned process pays for the crawler imports only in the worker
+    from async_crawler import AsyncSiteCrawler
+
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    conditions = {c.name: c for c in load_conditions(
+        config.get('search', 'conditions_file', fallback='search_conditions.json'))}
+    # The coordinator owns the seen index; workers read a snapshot of it, reloaded every `refresh_seconds`,
+    # and remember their own posts in memory
+    seen = SeenIndex.from_config(config_path, readonly=True)
+    # The detail rate is per account, so the workers split it between them
+    per_minute = config.getfloat('crawling', 'detail_rate_per_minute', fallback=6) / workers
+    limiter = TokenBucket(per_minute / 60.0, config.getint('crawling', 'detail_burst', fallback=1))
+    crawlers = {}
+
+    while True:
+        command, name = commands.get()
+        if command == 'stop':
+            break
+        if command == 'add' and name not in crawlers and name in conditions:
+            crawlers[name] = AsyncSiteCrawler(
+                config_path=config_path,
+                on_new_callback=lambda posts, name=name: results.put(('posts', worker_id, name, posts)),
+                on_status_callback=lambda message, name=name: results.put(('status', worker_id, name, message)),
+                condition=conditions[name],
+                known_post_ids=seen,
+                rate_limiter=limiter
+            )
+    for crawler in crawlers.values():
+        crawler.stop()
+    for crawler in crawlers.values():
+        crawler.join(timeout=30)
+    seen.close()
+
+
+class ShardCoordinator(threading.Thread):
+    """Spreads saved search conditions over worker processes and merges their posts into one deduplicated stream.
+
+    Exposes the same constructor, callbacks and `stop()` as `SiteCrawler`, so `CrawlerThread`
+    can run it as the `sharded` engine.
+    """
+
+    def __init__(self, config_path='config.ini', on_new_callback=None, on_status_callback=None):
+        super().__init__(daemon=True)
+        self.config = configparser.ConfigParser()
+        self.config.read(config_path)
+        self.config_path = config_path
+        self.on_new_callback = on_new_callback
+        self.on_status_callback = on_status_callback
+        self._stop_event = threading.Event()
+        self.logger = logging.getLogger(__name__)
+        self.known_post_ids = get_seen_index(config_path)  # Persistent, shared with the GUI
+        self.conditions = self._node_conditions()
+        self.worker_count = max(1, min(self.config.getint('shards', 'workers', fallback=os.cpu_count() or 1),
+                                       len(self.conditions) or 1))
+        # Spawn everywhere: the GUI runs on Windows, and forking a process with Qt/Chrome threads is unsafe
+        self._context = multiprocessing.get_context('spawn')
+        self._results = self._context.Queue()
+        self._log_queue = self._context.Queue()
+        self.workers = {}  # worker_id -> (process, command queue)
+        self.assignments = {}  # worker_id -> condition names
+        self.start()
+
+    def _node_conditions(self):
+        """Condition names this node crawls: [shards] `conditions` (all when empty), split across nodes."""
+        available = [c.name for c in load_conditions(
+            self.config.get('search', 'conditions_file', fallback='search_conditions.json'))]
+        wanted = [name.strip() for name in self.config.get('shards', 'conditions', fallback='').split(',')
+                  if name.strip()]
+        names = [name for name in available if not wanted or name in wanted]
+        for name in set(wanted) - set(available):
+            self.logger.warning(f"Shard condition '{name}' not found in the conditions file")
+        # Several machines share the list by index: node i takes every node_count-th condition
+        node_count = self.config.getint('shards', 'node_count', fallback=1)
+        node_index = self.config.getint('shards', 'node_index', fallback=0)
+        return names[node_index::node_count]
+
+    def _status(self, message):
+        if self.on_status_callback:
+            self.on_status_callback(message)
+
+    def _spawn(self, worker_id):
+        commands = self._context.Queue()
+        process = self._context.Process(
+            target=_shard_worker,
+            args=(worker_id, self.config_path, self.worker_count, commands, self._results, self._log_queue),
+            name=f'shard-{worker_id}',
+            daemon=True
+        )
+        process.start()
+        self.workers[worker_id] = (process, commands)
+        self.assignments[worker_id] = []
+
+    def _assign(self, worker_id, name):
+        self.assignments[worker_id].append(name)
+        self.workers[worker_id][1].put(('add', name))
+
+    def _rebalance(self):
+        """Hand the conditions of dead workers to the live workers with the fewest conditions."""
+        for worker_id, (process, _) in list(self.workers.items()):
+            if process.is_alive():
+                continue
+            orphaned = self.assignments.pop(worker_id)
+            del self.workers[worker_id]
+            self.logger.error(f"Shard worker {worker_id} died (exit code {process.exitcode}), "
+                              f"reassigning {len(orphaned)} conditions")
+            if not self.workers:
+                # Nothing left to absorb the work; start a replacement instead
+                self._spawn(worker_id)
+            for name in orphaned:
+                target = min(self.assignments, key=lambda w: len(self.assignments[w]))
+                self._assign(target, name)
+            self._status(f"Shard worker {worker_id} died, conditions rebalanced over {len(self.workers)} workers")
+
+    def _deliver(self, name, posts):
+        # Workers overlap when conditions do; the shared index keeps the stream unique
+        new_posts = [post for post in posts if self.known_post_ids.add(post['id'])]
+        if new_posts and self.on_new_callback:
+            self.on_new_callback(new_posts)
+        self.logger.info(f"Condition '{name}': {len(new_posts)} new posts of {len(posts)} delivered")
+
+    def run(self):
+        """Start the workers, deal out conditions round-robin, then merge results until stopped."""
+        log_listener = forward_logs(self._log_queue)
+        try:
+            if not self.conditions:
+                self.logger.error("No search conditions to shard")
+                self._status("No search conditions to crawl")
+                return
+            for worker_id in range(self.worker_count):
+                self._spawn(worker_id)
+            for i, name in enumerate(self.conditions):
+                self._assign(i % self.worker_count, name)
+            self.logger.info(f"Sharding {len(self.conditions)} conditions over {self.worker_count} worker processes")
+            self._status(f"Crawler started ({len(self.conditions)} conditions, {self.worker_count} workers)")
+
+            while not self._stop_event.is_set():
+                self._rebalance()
+                try:
+                    kind, worker_id, name, payload = self._results.get(timeout=1)
+                except queue.Empty:
+                    continue
+                if kind == 'posts':
+                    self._deliver(name, payload)
+                elif kind == 'status':
+                    self._status(f"[{name}] {payload}")
+        except Exception as e:
+            self.logger.error(f"Shard coordinator error: {str(e)}")
+        finally:
+            for process, commands in self.workers.values():
+                commands.put(('stop', None))
+            for process, _ in self.workers.values():
+                process.join(timeout=60)
+                if process.is_alive():
+                    self.logger.warning(f"Shard worker {process.name} did not stop, terminating it")
+                    process.terminate()
+            log_listener.stop()
+            self.logger.info("Crawler stopped")
+
+    def stop(self):
+        """Stop the coordinator; workers finish their in-flight requests and exit."""
+        self._stop_event.set()
+        self.logger.info("Crawler stop requested")
@@ -1,5 +1,4 @@
 from selenium.webdriver.support.ui import Select
-from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -9,25 +8,74 @@ from selenium.common.exceptions import ElementClickInterceptedException, Timeout
 import time
 
 import configparser
+import json
 import logging
 import threading
 import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from urllib.parse import urlencode
 
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from auth import AuthManager
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('crawler.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+from accounts import DEFAULT_ACCOUNT, AccountPool
+from backends import HttpBackend, SeleniumBackend, create_backend, stage_backend
+from contact import NOT_FOUND, ContactClient, extract_contact, reveal_request
+import detail_parser
+from detail_pool import DetailWorkerPool
+from driver_pool import get_pool
+from frontier import Frontier
+from lean import LeanProfile
+from listing import BASE_URL, ListingFetcher, ListingParser, listing_url
+from metrics import get_metrics
+from parse_pool import get_parse_pool
+from ratelimit import TokenBucket
+from replay import get_recorder
+from scheduler import AdaptiveScheduler
+from search_conditions import SearchCompiler, select_condition
+from seen_index import get_seen_index
+from steps import Step, StepRunner, listing_refreshed
+from watermark import WatermarkStore
+
+# Listing rows; a step that reloads the listing is ready once these are replaced
+LISTING_ROWS = (By.XPATH, '//div[@id="dev-gi-list"]//tr[contains(@class, "devloopArea")]')
+
+# Returns every listing row as plain JSON so the per-post loop never touches live elements
+LISTING_SNAPSHOT_SCRIPT = """
+var records = [];
+document.querySelectorAll('#dev-gi-list tr.devloopArea').forEach(function (row) {
+    if (!row.querySelector('th[scope="row"] input[type="checkbox"]')) return;
+    var link = row.querySelector('a[href*="GI_Read"]');
+    if (!link) return;
+    var title = row.querySelector('a.link.normalLog[href*="GI_Read"]');
+    var company = row.querySelector('a[href*="Co_Read"]');
+    var registered = row.querySelector('span.time');
+    records.push({
+        href: link.href,
+        title: title ? (title.getAttribute('title') || '').trim() : '',
+        company: company ? company.innerText.trim() : '',
+        details: Array.prototype.map.call(row.querySelectorAll('p.etc > span.cell'),
+            function (cell) { return cell.innerText.trim(); }),
+        has_contact: !!row.querySelector('button.tplBtn_1'),
+        registered: registered ? registered.innerText.trim() : ''
+    });
+});
+return JSON.stringify(records);
+"""
+
+def parse_job_details(source, post_id=""):
+    """Extract recruitment details from the `div.tbRow` HTML of a details page."""
+    return detail_parser.parse_fragment(source, post_id)
+
+
+def parse_detail_page(source, post_id=""):
+    """Extract recruitment details from a whole `GI_Read` page (its first `div.tbRow`)."""
+    return detail_parser.parse_page(source, post_id)
+
 
 class SiteCrawler(threading.Thread):
     """Background crawler for JOBKOREA job listings."""
@@ -38,16 +86,164 @@ class SiteCrawler(threading.Thread):
         self.config.read(config_path)
         self.on_new_callback = on_new_callback
         self.on_status_callback = on_status_callback
-        self._stop = threading.Event()
-        self.known_post_ids = set()  # Track processed post IDs
-        self.auth = AuthManager(config_path)
+        self._stop_event = threading.Event()
+        self.known_post_ids = get_seen_index(config_path)  # Persistent, shared with the GUI
+        self.driver_pool = get_pool(config_path)
+        self.lease = None
         self.logger = logging.getLogger(__name__)
+        self.lean = LeanProfile(self.config)
+        # Spans and counters per crawl stage, exported per [metrics]
+        self.metrics = get_metrics(self.config)
+        # Pages the browser renders go into the [replay] archive next to the HTTP exchanges
+        self.recorder = get_recorder(self.config)
+        # Recruitment details are parsed on worker processes when [parse] `processes` is set
+        self.parse_pool = get_parse_pool(config_path)
+        # Each crawl stage (listing, detail, contact) names its fetch backend in [backends]
+        self.backend_names = {stage: stage_backend(self.config, stage) for stage in ('listing', 'detail', 'contact')}
+        self.config_path = config_path
+        self.listing_fetcher = None
+        self.total_pages = None  # Set by a non-browser listing backend from the page it fetched
+        if 'http' in self.backend_names.values():
+            self.listing_fetcher = ListingFetcher(config_path)
+        # With the HTTP contact backend, contact reveals never touch the browser
+        self.contact_client = None
+        if self.backend_names['contact'] == 'http':
+            self.contact_client = ContactClient(config_path, self.listing_fetcher)
+        # Details go through tabs of the listing driver only when both detail and contact use Selenium
+        self.browser_details = self.backend_names['detail'] == 'selenium' and self.backend_names['contact'] == 'selenium'
+        self.listing_backend = None
+        self.detail_backend = None
+        # [web] base_url also points the crawler at a local replay server (see replay.py)
+        self.base_url = self.config.get('web', 'base_url', fallback=BASE_URL).rstrip('/')
+        self.listing_parser = ListingParser(self.base_url)
+        # A saved condition compiled to request parameters replaces the browser filter steps
+        self.condition = select_condition(self.config)
+        self.listing_params = None
+        if self.backend_names['listing'] != 'selenium' and self.condition is not None:
+            self.listing_params = SearchCompiler.from_config(self.config).compile(self.condition.condition)
+        # Incremental mode stops paginating at the first page older than the search's high-water mark
+        self.search_key = self.config.get('crawling', 'search_key',
+                                          fallback=self.condition.name if self.condition else 'default')
+        self.watermarks = None
+        if self.config.getboolean('crawling', 'incremental', fallback=False):
+            self.watermarks = WatermarkStore(self.config.get('crawling', 'watermark_file', fallback='watermarks.json'))
+        # Durable record of the cycle's pages and posts so a restart resumes where it stopped
+        self.frontier = Frontier.from_config(self.config)
+        self.page_records = []  # Listing records of the page last scanned
+        self.step_runner = StepRunner()
+        self.scheduler = None
+        if self.config.getboolean('scheduler', 'adaptive', fallback=False):
+            self.scheduler = AdaptiveScheduler.from_config(self.config)
+        # One bucket paces every detail-page open, whichever driver performs it
+        self.rate_limiter = TokenBucket.from_config(self.config)
+        # With several accounts, every detail fetch and contact reveal goes through the account pool
+        self.accounts = AccountPool(config_path)
+        self.multi_account = len(self.accounts) > 1
+        self._account_lock = threading.Lock()
+        self._account_fetchers = {}
+        self._account_clients = {}
+        self.detail_pool = None
+        detail_workers = self.config.getint('crawling', 'detail_workers', fallback=1)
+        if self.multi_account:
+            # Room for the listing driver plus one idle driver per account, so rotating accounts
+            # does not evict (and log in again) on every post
+            self.driver_pool.size = max(self.driver_pool.size, len(self.accounts) + 1)
+        if detail_workers > 1 and self.multi_account:
+            # Room for the listing driver plus one driver per detail worker
+            self.driver_pool.size = max(self.driver_pool.size, detail_workers + 1)
+            playwright = self.backend_names['detail'] == 'playwright'
+            self.detail_pool = DetailWorkerPool(
+                make_worker=lambda: self._create_backend('playwright') if playwright else None,
+                handle=lambda backend, record: self._fetch_post_detail_as(record, backend),
+                size=detail_workers,
+                limiter=self.rate_limiter,
+                stop_event=self._stop_event,
+                close_worker=lambda backend: backend.close() if backend is not None else None
+            )
+        elif detail_workers > 1 and not self.browser_details:
+            if self.backend_names['detail'] == 'selenium':
+                # Room for the listing driver plus one driver per detail worker
+                self.driver_pool.size = max(self.driver_pool.size, detail_workers + 1)
+            self.detail_pool = DetailWorkerPool(
+                make_worker=lambda: self._create_backend(self.backend_names['detail']),
+                handle=self._fetch_post_detail_backend,
+                size=detail_workers,
+                limiter=self.rate_limiter,
+                stop_event=self._stop_event,
+                close_worker=lambda backend: backend.close()
+            )
+        elif detail_workers > 1:
+            # Room for the listing driver plus one driver per detail worker
+            self.driver_pool.size = max(self.driver_pool.size, detail_workers + 1)
+            self.detail_pool = DetailWorkerPool(
+                make_worker=self.driver_pool.lease,
+                handle=lambda lease, record: self._fetch_post_detail(
+                    lease.driver, record, lease.driver.current_window_handle),
+                size=detail_workers,
+                limiter=self.rate_limiter,
+                stop_event=self._stop_event,
+                close_worker=lambda lease: lease.release()
+            )
         self.start()
 
+    def _navigation_steps(self):
+        """The per-cycle navigation to a filtered, sorted listing, each step with its readiness condition."""
+        return [
+            Step('open listing',
+                 lambda driver: driver.get(f"{self.base_url}/recruit/joblist?menucode=local&localorder=1"),
+                 EC.element_to_be_clickable((By.ID, "devSearchedTerms")), 20),
+            Step('apply filters', self._apply_filters,
+                 EC.element_to_be_clickable((By.ID, "dev-btn-search")), 10),
+            Step('search', self._click_search_button, listing_refreshed(LISTING_ROWS), 15),
+            Step('sort by registration date', self.select_registration_date_sort, listing_refreshed(LISTING_ROWS), 10),
+            Step('exclude viewed posts', self.apply_exclude_viewed_filter, listing_refreshed(LISTING_ROWS), 10),
+        ]
+
+    def _page_step(self, page):
+        """Browser pagination to `page` as a step: ready once that page's rows replace the current ones."""
+        return Step(f'go to page {page}', lambda driver: self._goto_listing_page(driver, page),
+                    listing_refreshed(LISTING_ROWS), 20)
+
+    def _create_backend(self, name):
+        """A fetch backend by name, sharing this crawler's HTTP session and driver pool."""
+        return create_backend(name, self.config_path, self.listing_fetcher, self.driver_pool)
+
+    def _goto_listing_page(self, driver, page):
+        """Load a listing page in the browser and wait for its rows."""
+        next_page_url = f"{self.base_url}/recruit/joblist?menucode=local&localorder=1#anchorGICnt_{page}"
+        self.logger.info(f"Navigating to page {page}: {next_page_url}")
+        driver.get(next_page_url)
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_all_elements_located(
+                (By.XPATH,
+                 '//div[@id="dev-gi-list"]//tr[contains(@class, "devloopArea") and .//th[@scope="row"]//input[@type="checkbox"]]')
+            )
+        )
+
+    def _refresh_session(self):
+        """Lease the logged-in driver the crawl runs on; the HTTP backends pick up its cookies on each first page."""
+        # Leasing the first driver is where the browser starts and logs in
+        with self.metrics.span('login'):
+            self.lease = self.driver_pool.lease()
+        return self.lease.driver
+
+    def _next_interval(self, new_count):
+        """Seconds until the next cycle: adaptive when [scheduler] is enabled, else `refresh_interval`."""
+        if self.scheduler is None:
+            return self.config.getint('web', 'refresh_interval', fallback=300)
+        self.scheduler.record(self.search_key, new_count)
+        interval = self.scheduler.next_interval(self.search_key)
+        latency = self.scheduler.expected_latency(self.search_key)
+        self.logger.info(f"{new_count} new posts this cycle, next refresh in {interval}s "
+                         f"(expected detection latency ~{latency:.0f}s)")
+        if self.on_status_callback:
+            self.on_status_callback(f"Next refresh in {interval}s, expected detection latency ~{latency:.0f}s")
+        return interval
+
     def _stoppable_sleep(self, seconds):
         """Sleep for the specified time, checking for stop signal."""
         start_time = time.time()
-        while time.time() - start_time < seconds and not self._stop.is_set():
+        while time.time() - start_time < seconds and not self._stop_event.is_set():
             time.sleep(0.1)  # Sleep in small increments to allow stop checks
 
     def _apply_filters(self, driver):
@@ -153,10 +349,87 @@ class SiteCrawler(threading.Thread):
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.common.by import By
 
-    def _scan_posts(self, driver):
+    def _snapshot_listing(self, driver):
+        """Read every listing row in one `execute_script` round trip (fallback for the HTTP listing)."""
+        try:
+            WebDriverWait(driver, 20).until(
+                EC.presence_of_all_elements_located(
+                    (By.XPATH,
+                     '//div[@id="dev-gi-list"]//tr[contains(@class, "devloopArea") and .//th[@scope="row"]//input[@type="checkbox"]]')
+                )
+            )
+            rows = json.loads(driver.execute_script(LISTING_SNAPSHOT_SCRIPT))
+            self.logger.info(f"Found {len(rows)} job posts")
+        except Exception as e:
+            self.logger.error(f"Failed to load job posts: {e}")
+            return []
+
+        records = []
+        for i, row in enumerate(rows, 1):
+            try:
+                post_id = row['href'].split('GI_Read/')[1].split('?')[0]
+            except IndexError:
+                self.logger.error(f"Post {i} - No job link found")
+                continue
+            records.append({
+                'id': post_id,
+                'title': row['title'],
+                'company': row['company'],
+                'details': row['details'],
+                'details_url': row['href'],
+                'has_contact': row['has_contact'],
+                'registered': row['registered'],
+            })
+        return records
+
+    def _list_posts(self, driver, page):
+        """Return the listing records for a page, over HTTP when configured, else through WebDriver."""
+        if self.listing_backend is not None:
+            try:
+                if page == 1:
+                    # Pick up the cookies of the live, logged-in session for this cycle
+                    self.listing_backend.load_cookies(driver.get_cookies())
+                with self.metrics.span('listing_load', backend=self.listing_backend.name):
+                    source = self.listing_backend.open_page(
+                        listing_url(self.listing_parser.base_url, page, self.listing_params))
+                with self.metrics.span('row_extraction'):
+                    records = self.listing_parser.parse(source)
+                    self.total_pages = self.listing_parser.total_pages(source, page)
+                if records:
+                    return records
+                self.logger.warning(f"{self.listing_backend.name} listing returned no posts for page {page}, "
+                                    f"falling back to WebDriver")
+            except Exception as e:
+                self.logger.error(f"{self.listing_backend.name} listing failed for page {page}, "
+                                  f"falling back to WebDriver: {e}")
+            self.total_pages = None
+        return self._browser_listing(driver, page)
+
+    def _browser_listing(self, driver, page):
+        """WebDriver listing: make sure the browser shows `page` of this search, then read its rows."""
+        if self.listing_params is not None:
+            # No filter steps ran, so the browser loads the compiled-condition listing itself
+            url = listing_url(self.base_url, page, self.listing_params)
+            self.logger.info(f"Loading listing page {page} in the browser: {url}")
+            with self.metrics.span('listing_load', backend='selenium'):
+                driver.get(url)
+            with self.metrics.span('row_extraction'):
+                source = driver.page_source
+                self.total_pages = self.listing_parser.total_pages(source, page)
+                return self.listing_parser.parse(source)
+        if page > 1 and self.listing_backend is not None:
+            # Pagination went through the listing backend; the browser is still on an earlier page
+            with self.metrics.span('pagination'):
+                self._goto_listing_page(driver, page)
+        with self.metrics.span('row_extraction'):
+            return self._snapshot_listing(driver)
+
+    def _scan_posts(self, driver, page=1):
         """Scan job listings, open details URL in a new tab, check for contact info, close tab, and return to continue processing."""
         posts_data = []
+        pending = deque()  # Fetched posts whose recruitment details may still be parsing
         original_url = ""
+        candidates = []
 
         try:
             # Store the original page URL and window handle
@@ -168,432 +441,69 @@ class SiteCrawler(threading.Thread):
                 self.logger.error("Failed to store original URL or window handle")
                 return []
 
-            # Wait for job listing elements to load
-            try:
-                posts = WebDriverWait(driver, 20).until(
-                    EC.presence_of_all_elements_located(
-                        (By.XPATH,
-                         '//div[@id="dev-gi-list"]//tr[contains(@class, "devloopArea") and .//th[@scope="row"]//input[@type="checkbox"]]')
-                    )
-                )
-                self.logger.info(f"Found {len(posts)} job posts")
-            except:
+            records = self._list_posts(driver, page)
+            self.page_records = records
+            original_url = driver.current_url  # The WebDriver fallback may have moved the browser
+            if not records:
                 self.logger.error("Failed to load job posts")
                 driver.get(original_url)
                 return []
 
-            for i, post in enumerate(posts, 1):  # Process all posts
-                if self._stop.is_set():
+            candidates = []
+            for record in records:
+                post_id = record['id']
+                # Check if post ID is already processed
+                if post_id in self.known_post_ids:
+                    self.logger.info(f"Post {post_id} already processed, skipping")
+                    self.metrics.inc('posts_skipped_total', reason='known')
+                    continue
+                if not record.get('has_contact'):
+                    self.logger.info(f"Post {post_id}: No contact button, skipping")
+                    self.metrics.inc('posts_skipped_total', reason='no_contact')
+                    continue
+                candidates.append(record)
+            if self.frontier is not None:
+                # Only posts the frontier has not fetched yet; a crash mid-page resumes from here
+                candidates = self.frontier.claim_details(self.search_key, page, candidates)
+
+            if self.detail_pool is not None:
+                # Worker drivers open the detail pages; this driver keeps the listing
+                for post in self.detail_pool.map(candidates):
+                    pending.append(post)
+                    self._settle(pending, posts_data, block=False)
+                self._settle(pending, posts_data)
+                if not self._stop_event.is_set():
+                    fetched = {post['id'] for post in posts_data}
+                    for record in candidates:
+                        if record['id'] not in fetched:
+                            self._detail_failed(record['id'])
+                return posts_data
+
+            for i, record in enumerate(candidates, 1):  # Process all posts
+                if self._stop_event.is_set() or not self.rate_limiter.acquire(stop_event=self._stop_event):
                     self.logger.info("Stop signal received during post scanning")
-                    return posts_data
+                    return self._settle(pending, posts_data)
 
-                self._stoppable_sleep(0.5)
+                post_id = record['id']
                 try:
-                    # Re-fetch post to avoid stale element references
-                    try:
-                        posts = WebDriverWait(driver, 20).until(
-                            EC.presence_of_all_elements_located(
-                                (By.XPATH, '//tr[contains(@class, "devloopArea")]')
-                            )
-                        )
-                        post = posts[i - 1]
-                        self.logger.info(f"Re-fetched post {i}")
-                    except:
-                        self.logger.error(f"Post {i} - Failed to re-fetch post")
-                        continue
-
-                    # Extract post ID and details URL from the job link
-                    post_id = ""
-                    details_url = ""
-                    try:
-                        job_link = WebDriverWait(post, 15).until(
-                            EC.presence_of_element_located((By.XPATH, './/a[contains(@href, "GI_Read")]'))
-                        )
-                        href = job_link.get_attribute('href')
-                        post_id = href.split('GI_Read/')[1].split('?')[0]
-                        details_url = href
-                        self.logger.info(f"Extracted post ID: {post_id}, Details URL: {details_url}")
-                    except:
-                        self.logger.error(f"Post {i} - No job link found")
-                        continue
-
-                    # Check if post ID is already processed
-                    try:
-                        if post_id in self.known_post_ids:
-                            self.logger.info(f"Post {post_id} already processed, skipping")
-                            continue
-                    except:
-                        self.logger.error(f"Post {i} - Failed to check processed posts")
-                        continue
-
-                    # Check for contact button (using apply button as proxy)
-                    try:
-                        contact_button = post.find_elements(By.XPATH, './/button[contains(@class, "tplBtn_1")]')
-                        if not contact_button:
-                            self.logger.info(f"Post {post_id}: No contact button, skipping")
-                            continue
-                    except:
-                        self.logger.error(f"Post {i} - No contact button found")
-                        continue
-
-                    # Extract title
-                    title = ""
-                    try:
-                        title_element = WebDriverWait(post, 15).until(
-                            EC.presence_of_element_located(
-                                (By.XPATH, './/a[contains(@class, "link normalLog") and contains(@href, "GI_Read")]')
-                            )
-                        )
-                        title = title_element.get_attribute('title').strip()
-                        self.logger.info(f"Post {i} - Extracted title: {title}")
-                    except:
-                        self.logger.error(f"Post {i} - No title found")
-                        continue
-
-                    # Extract company name
-                    company = ""
-                    try:
-                        company_element = WebDriverWait(post, 15).until(
-                            EC.presence_of_element_located(
-                                (By.XPATH, './/a[contains(@href, "Co_Read")]')
-                            )
-                        )
-                        company = company_element.text.strip()
-                        self.logger.info(f"Post {i} - Extracted company: {company}")
-                    except:
-                        self.logger.error(f"Post {i} - No company name found")
-                        continue
-
-                    # Extract additional details
-                    details = []
-                    try:
-                        details_elements = post.find_elements(By.XPATH, './/p[@class="etc"]/span[@class="cell"]')
-                        details = [elem.text.strip() for elem in details_elements]
-                        self.logger.info(f"Post {i} - Extracted details: {details}")
-                    except:
-                        self.logger.error(f"Post {i} - No additional details found")
-
-                    # Open details URL in a new tab
-                    try:
-                        self.logger.info(f"Post {post_id} - Opening details URL in new tab: {details_url}")
-                        driver.execute_script(f"window.open('{details_url}', '_blank');")
-                        WebDriverWait(driver, 10).until(EC.number_of_windows_to_be(2))
-                        new_window = [handle for handle in driver.window_handles if handle != original_window][0]
-                        driver.switch_to.window(new_window)
-                        WebDriverWait(driver, 20).until(
-                            EC.presence_of_element_located((By.XPATH, '//body'))
-                        )
-                        self.logger.info(f"Post {post_id} - Successfully switched to new tab")
-                    except:
-                        self.logger.error(f"Post {post_id} - Failed to open or switch to new tab")
-                        try:
-                            driver.switch_to.window(original_window)
-                            self.logger.info(f"Post {post_id} - Switched back to original window")
-                        except:
-                            self.logger.error(f"Post {post_id} - Failed to switch back to original window")
-                        continue
-
-                    manager_info = "Not found"
-                    try:
-                        contact_section = WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located(
-                                (By.XPATH,
-                                 '//dd[contains(@class, "devTplLyClick") and .//button[contains(@class, "devOpenCharge")]]')
-                            )
-                        )
-                        self.logger.info(f"Post {post_id} - Contact information section found")
-
-                        # Scroll to the contact section
-                        try:
-                            ActionChains(driver).move_to_element(contact_section).perform()
-                            self.logger.info(f"Post {post_id} - Scrolled to contact section")
-                        except:
-                            self.logger.error(f"Post {post_id} - Failed to scroll to contact section")
-
-                        # Click the "Check your contact information" button
-                        try:
-                            contact_button = WebDriverWait(contact_section, 10).until(
-                                EC.element_to_be_clickable((By.XPATH, './/button[contains(@class, "devOpenCharge")]'))
-                            )
-                            ActionChains(driver).move_to_element(contact_button).click().perform()
-                            self.logger.info(
-                                f"Post {post_id} - Clicked 'Check your contact information' button via ActionChains")
-                            WebDriverWait(driver, 10).until(
-                                EC.invisibility_of_element((By.XPATH, './/button[contains(@class, "devOpenCharge")]'))
-                            )
-                            self.logger.info(f"Post {post_id} - Contact button hidden, assuming contact info loaded")
-                        except (ElementClickInterceptedException, TimeoutException, WebDriverException) as e:
-                            self.logger.error(f"Post {post_id} - ActionChains click failed: {str(e)}")
-                            try:
-                                driver.execute_script("arguments[0].click();", contact_button)
-                                self.logger.info(
-                                    f"Post {post_id} - Clicked 'Check your contact information' button via JavaScript")
-                                WebDriverWait(driver, 10).until(
-                                    EC.invisibility_of_element(
-                                        (By.XPATH, './/button[contains(@class, "devOpenCharge")]'))
-                                )
-                                self.logger.info(
-                                    f"Post {post_id} - Contact button hidden, assuming contact info loaded")
-                            except:
-                                self.logger.error(
-                                    f"Post {post_id} - JavaScript click failed, proceeding with available data")
-
-                        # Extract contact information after clicking
-                        try:
-                            phone = "Not found"
-                            email = "Not found"
-                            name = "Not found"
-                            department = "Not found"
-
-                            # Try to get name
-                            try:
-                                name_element = driver.find_element(By.XPATH,
-                                                                   '(//div[contains(@class, "manager")]//dt)[1]/following-sibling::dd[1]')
-                                name = name_element.text.strip()
-                                self.logger.info(f"Post {post_id} - Extracted name: {name}")
-
-                            except:
-                                self.logger.warning(f"Post {post_id} - Name not found")
-                                print("Name: Not found")
-
-                            # Try to get phone numbers
-                            try:
-                                phone_elements = contact_section.find_elements(By.XPATH,
-                                                                               './/span[contains(@class, "tahoma") and not(contains(@class, "tplHide"))]')
-                                phone = ", ".join([elem.text.strip() for elem in phone_elements])
-                                self.logger.info(f"Post {post_id} - Extracted phone: {phone}")
-                                print(f"Phone: {phone}")
-                            except:
-                                self.logger.warning(f"Post {post_id} - Phone number not found")
-
-
-                            # Try to get email
-                            try:
-                                email_element = WebDriverWait(driver, 5).until(
-                                    EC.presence_of_element_located((By.XPATH,
-                                                                    '//dd[not(contains(@class, "tplHide"))]//a[contains(@href, "mailto:")]'))
-                                )
-                                email = email_element.text.strip()
-                                self.logger.info(f"Post {post_id} - Extracted email: {email}")
-
-                            except:
-                                self.logger.warning(f"Post {post_id} - Email not found")
-                                print("Email: Not found")
-
-                            # Check if any contact info was found and extract job details if present
-                            if phone != "Not found" or email != "Not found" or name != "Not found":
-
-                                job_details = {}
-
-                                try:
-                                    tb_row_element = driver.find_element(By.XPATH, '(//div[@class="tbRow clear"])[1]')
-
-
-
-                                    # Assuming tb_row_element is a Selenium WebElement
-                                    source = tb_row_element.get_attribute("outerHTML")
-                                    soup = BeautifulSoup(source, 'html.parser')
-
-                                    # Extract Experience
-                                    try:
-                                        experience = soup.select_one(
-                                            'div.tbCol dl.tbList dt:-soup-contains("경력") + dd').text.strip()
-                                        job_details["experience"] = experience
-                                        self.logger.info(f"Post {post_id} - Extracted experience: {experience}")
-                                        print(f"Experience: {experience}")
-                                    except AttributeError:
-                                        job_details["experience"] = "Not found"
-                                        self.logger.warning(f"Post {post_id} - Experience requirement not found")
-
-
-                                    # Extract Education
-                                    try:
-                                        education = soup.select_one(
-                                            'div.tbCol dl.tbList dt:-soup-contains("학력") + dd').text.strip()
-                                        job_details["education"] = education
-                                        self.logger.info(f"Post {post_id} - Extracted education: {education}")
-                                        print(f"Education: {education}")
-                                    except AttributeError:
-                                        job_details["education"] = "Not found"
-                                        self.logger.warning(f"Post {post_id} - Education requirement not found")
-
-
-                                    # Extract Employment Type
-                                    try:
-                                        employment_types = soup.select(
-                                            'div.tbCol dl.tbList dt:-soup-contains("고용형태") + dd ul.addList li')
-                                        employment_type = ", ".join([elem.text.strip() for elem in employment_types])
-                                        job_details["employment_type"] = employment_type
-                                        self.logger.info(
-                                            f"Post {post_id} - Extracted employment type: {employment_type}")
-                                        print(f"Employment Type: {employment_type}")
-                                    except AttributeError:
-                                        job_details["employment_type"] = "Not found"
-                                        self.logger.warning(f"Post {post_id} - Employment type not found")
-
-
-                                    # Extract Salary
-                                    try:
-                                        salary = soup.select_one(
-                                            'div.tbCol dl.tbList dt:-soup-contains("급여") + dd').text.strip()
-                                        job_details["salary"] = salary
-                                        self.logger.info(f"Post {post_id} - Extracted salary: {salary}")
-                                        print(f"Salary: {salary}")
-                                    except AttributeError:
-                                        job_details["salary"] = "Not found"
-                                        self.logger.warning(f"Post {post_id} - Salary not found")
-
-
-                                    # Extract Region
-                                    try:
-                                        region_elements = soup.select(
-                                            'div.tbCol dl.tbList dt:-soup-contains("지역") + dd a')
-                                        region = ", ".join([elem.text.strip() for elem in region_elements])
-                                        job_details["region"] = region
-                                        self.logger.info(f"Post {post_id} - Extracted region: {region}")
-                                        print(f"Region: {region}")
-                                    except AttributeError:
-                                        job_details["region"] = "Not found"
-                                        self.logger.warning(f"Post {post_id} - Region not found")
-
-
-                                    # Extract Working Hours
-                                    try:
-                                        working_hours = soup.select_one(
-                                            'div.tbCol dl.tbList dt:-soup-contains("시간") + dd').text.strip()
-                                        job_details["working_hours"] = working_hours
-                                        self.logger.info(f"Post {post_id} - Extracted working hours: {working_hours}")
-                                        print(f"Working Hours: {working_hours}")
-                                    except AttributeError:
-                                        job_details["working_hours"] = "Not found"
-                                        self.logger.warning(f"Post {post_id} - Working hours not found")
-
-
-                                    # Extract Corporate Form
-                                    try:
-                                        corporate_form = soup.select_one(
-                                            'div.tbCol.tbCoInfo dl.tbList dt:-soup-contains("기업형태") + dd').text.strip()
-                                        job_details["corporate_form"] = corporate_form
-                                        self.logger.info(f"Post {post_id} - Extracted corporate form: {corporate_form}")
-                                        print(f"Corporate Form: {corporate_form}")
-                                    except AttributeError:
-                                        job_details["corporate_form"] = "Not found"
-                                        self.logger.warning(f"Post {post_id} - Corporate form not found")
-
-
-                                    # Add job details to posts_data
-                                    posts_data.append({
-                                        'id': post_id,
-                                        'title': title,
-                                        'company': company,
-                                        'details': details,
-                                        'details_url': details_url,
-                                        'manager_info': f"Name: {name}, Phone: {phone}, Email: {email}",
-                                        'recruitment_details': job_details
-                                    })
-                                    self.known_post_ids.add(post_id)
-                                    self.logger.info(f"Post {post_id} extracted successfully")
-
-                                except Exception as e:
-                                    self.logger.error(f"Post {post_id} - Failed to extract job details: {str(e)}")
-                                    posts_data.append({
-                                        'id': post_id,
-                                        'title': title,
-                                        'company': company,
-                                        'details': details,
-                                        'details_url': details_url,
-                                        'manager_info': f"Name: {name}, Phone: {phone}, Email: {email}",
-                                        'recruitment_details': {}
-                                    })
-                                    self.known_post_ids.add(post_id)
-                                    self.logger.info(f"Post {post_id} - Appended with partial data due to error")
-
-                            else:
-                                manager_info = "Not found"
-                                try:
-                                    dom_snippet = driver.find_element(By.XPATH,
-                                                                      '//div[contains(@class, "manager")]').get_attribute(
-                                        'outerHTML')
-                                    self.logger.debug(f"Post {post_id} - DOM snippet of manager section: {dom_snippet}")
-                                except:
-                                    self.logger.debug(f"Post {post_id} - Failed to capture DOM snippet")
-                                self.logger.info(
-                                    f"Post {post_id} - Extracted contact info (post-click): {manager_info}")
-                                print(f"Manager Info: {manager_info}")
-
-                            # Wait for 10 seconds as per instructions
-                            self._stoppable_sleep(10)
-                            self.logger.info(f"Post {post_id} - Waited for 10 seconds")
-
-                        except:
-                            self.logger.error(f"Post {post_id} - Failed to extract contact info after clicking")
-                            try:
-                                dom_snippet = driver.find_element(By.XPATH,
-                                                                  '//div[contains(@class, "manager")]').get_attribute(
-                                    'outerHTML')
-                                self.logger.debug(f"Post {post_id} - DOM snippet of manager section: {dom_snippet}")
-                            except:
-                                self.logger.debug(f"Post {post_id} - Failed to capture DOM snippet")
-                            manager_info = "Not found"
-                            print(f"Manager Info: {manager_info}")
-
-                    except:
-                        self.logger.info(f"Post {post_id} - No contact information section found, closing new tab")
-                        manager_info = "Not found"
-
-
-                    # Close the new tab and switch back to the original window
-                    try:
-                        driver.close()
-                        self.logger.info(f"Post {post_id} - Closed new tab")
-                        driver.switch_to.window(original_window)
-                        WebDriverWait(driver, 20).until(
-                            EC.presence_of_all_elements_located(
-                                (By.XPATH, '//tr[contains(@class, "devloopArea")]')
-                            )
-                        )
-                        self.logger.info(f"Post {post_id} - Switched back to original window")
-                    except:
-                        self.logger.error(f"Post {post_id} - Failed to close new tab or switch back")
-                        try:
-                            driver.switch_to.window(original_window)
-                            WebDriverWait(driver, 20).until(
-                                EC.presence_of_all_elements_located(
-                                    (By.XPATH, '//tr[contains(@class, "devloopArea")]')
-                                )
-                            )
-                            self.logger.info(f"Post {post_id} - Recovered to original window")
-                        except:
-                            self.logger.error(f"Post {post_id} - Failed to recover to original window")
-                            continue
-
-                    # Append data to posts_data (for cases where no job details are extracted)
-                    if manager_info == "Not found":
-                        try:
-                            posts_data.append({
-                                'id': post_id,
-                                'title': title,
-                                'company': company,
-                                'details': details,
-                                'details_url': details_url,
-                                'manager_info': "Not found",
-                                'recruitment_details': {}  # Use empty dict instead of empty string
-                            })
-                            self.known_post_ids.add(post_id)
-                            self.logger.info(f"Post {post_id} extracted successfully")
-                        except:
-                            self.logger.error(f"Post {i} - Failed to append post data")
-
+                    if self.multi_account:
+                        post = self._fetch_post_detail_as(record)
+                    elif not self.browser_details:
+                        post = self._fetch_post_detail_backend(self.detail_backend, record)
+                    else:
+                        post = self._fetch_post_detail(driver, record, original_window)
+                    if post:
+                        # The driver moves on while the details parse; finished posts are collected in order
+                        pending.append(post)
+                        self._settle(pending, posts_data, block=False)
+                    else:
+                        self._detail_failed(post_id)
                 except:
                     self.logger.error(f"Post {i} - General processing error")
+                    self._detail_failed(post_id)
                     try:
                         driver.switch_to.window(original_window)
                         driver.get(original_url)
-                        WebDriverWait(driver, 20).until(
-                            EC.presence_of_all_elements_located(
-                                (By.XPATH, '//tr[contains(@class, "devloopArea")]')
-                            )
-                        )
                         self.logger.info(f"Post {i} - Recovered to original window and listings page")
                     except:
                         self.logger.error(f"Post {i} - Failed to recover to original window or listings page")
@@ -606,7 +516,7 @@ class SiteCrawler(threading.Thread):
             except:
                 self.logger.error("Failed to ensure final switch to original window")
 
-            return posts_data
+            return self._settle(pending, posts_data)
 
         except:
             self.logger.error("General error in scanning posts")
@@ -617,52 +527,426 @@ class SiteCrawler(threading.Thread):
             except:
                 self.logger.error("Failed to return to original URL or window")
             return []
-    def run(self):
-        """Main crawling loop with pagination."""
+        finally:
+            if self.frontier is not None and candidates:
+                # Claims never attempted (stop, crash of this scan) go back to pending
+                self.frontier.release_details([record['id'] for record in candidates])
+
+    def _parse_details(self, func, source, post_id):
+        """Recruitment details parsed by `func` inline, or a future for them when the parse pool is enabled."""
+        if self.parse_pool is not None:
+            try:
+                return self.parse_pool.submit(func, source, post_id)
+            except BrokenProcessPool:
+                pass  # Logged by the pool; parse here instead
+        with self.metrics.span('parse'):
+            return func(source, post_id)
+
+    def _settle(self, pending, posts, block=True):
+        """Move fetched posts from `pending` to `posts` in order once their details are parsed; returns `posts`.
+
+        Without `block`, stops at the first post still parsing.
+        """
+        while pending:
+            post = pending[0]
+            details = post['recruitment_details']
+            if isinstance(details, Future):
+                if not block and not details.done():
+                    break
+                try:
+                    with self.metrics.span('parse_wait'):
+                        post['recruitment_details'] = self.parse_pool.result(details)
+                except Exception as e:
+                    self.logger.error(f"Post {post['id']} - Failed to parse job details: {e}")
+                    post['recruitment_details'] = {}
+            pending.popleft()
+            posts.append(post)
+            self._record_detail(post['id'], post)
+            self.logger.info(f"Post {post['id']} extracted successfully")
+        return posts
+
+    def _record_detail(self, post_id, post):
+        """Remember a fetched post in memory and, when enabled, in the durable frontier."""
+        self.metrics.inc('posts_fetched_total')
+        self.known_post_ids.add(post_id)
+        if self.frontier is not None:
+            self.frontier.complete_detail(post_id, post)
+
+    def _deliver(self, posts):
+        """Hand new posts to the GUI and mark them delivered in the frontier."""
+        if posts and self.on_new_callback:
+            with self.metrics.span('callback'):
+                self.on_new_callback(posts)
+            self.metrics.inc('posts_delivered_total', len(posts))
+        if posts and self.frontier is not None:
+            self.frontier.mark_delivered([post['id'] for post in posts])
+
+    def _fetch_post_detail_backend(self, backend, record, contact_client=None):
+        """Fetch a post's details page through a fetch backend and reveal its contact info."""
+        contact_client = contact_client or self.contact_client
+        post_id = record['id']
+        post = {
+            'id': post_id,
+            'title': record['title'],
+            'company': record['company'],
+            'details': record['details'],
+            'details_url': record['details_url'],
+            'manager_info': "Not found",
+            'recruitment_details': {}
+        }
         try:
-            driver = self.auth.login()
-            self.logger.info("Starting crawler")
-            if self.on_status_callback:
-                self.on_status_callback("Crawler started")
+            with self.metrics.span('detail_open', backend=backend.name):
+                source = backend.open_page(record['details_url'])
+        except Exception as e:
+            self.logger.error(f"Post {post_id} - Failed to fetch details page ({backend.name}): {e}")
+            return None
+        with self.metrics.span('contact_reveal', backend='http' if contact_client is not None else backend.name):
+            if contact_client is not None:
+                name, phone, email = contact_client.reveal(record)
+                if (name, phone, email) == (NOT_FOUND, NOT_FOUND, NOT_FOUND):
+                    name, phone, email = extract_contact(source)  # The page itself may show the contact
+            elif backend.interactive:
+                try:
+                    backend.click_and_wait('dd.devTplLyClick button.devOpenCharge')
+                except Exception as e:
+                    self.logger.warning(f"Post {post_id} - Contact button not revealed ({backend.name}): {e}")
+                name, phone, email = extract_contact(backend.get_html())
+            else:
+                name, phone, email = extract_contact(source)
+        if phone != NOT_FOUND or email != NOT_FOUND or name != NOT_FOUND:
+            post['manager_info'] = f"Name: {name}, Phone: {phone}, Email: {email}"
+            post['recruitment_details'] = self._parse_details(detail_parser.parse_page, source, post_id)
+        else:
+            # Not delivered and not marked seen, so a later cycle tries the post again
+            self.logger.info(f"Post {post_id} - Extracted contact info ({backend.name}): Not found")
+            return None
+        return post
+
+    def _account_fetcher(self, account):
+        """HTTP session logged in as an account, logging the account in through the pool on first use."""
+        with self._account_lock:
+            fetcher = self._account_fetchers.get(account.name)
+            if fetcher is None:
+                if account.name == DEFAULT_ACCOUNT and self.listing_fetcher is not None:
+                    fetcher = self.listing_fetcher
+                else:
+                    if not Path(account.session_file).exists():
+                        with self.driver_pool.lease(account=account):
+                            pass  # Logging in writes the account's session file
+                    fetcher = ListingFetcher(self.config_path, account.session_file)
+                self._account_fetchers[account.name] = fetcher
+            return fetcher
+
+    def _account_client(self, account):
+        """Contact client revealing contacts as an account."""
+        with self._account_lock:
+            client = self._account_clients.get(account.name)
+        if client is None:
+            client = ContactClient(self.config_path, self._account_fetcher(account))
+            with self._account_lock:
+                client = self._account_clients.setdefault(account.name, client)
+        return client
+
+    def _detail_failed(self, post_id):
+        """A post's details could not be fetched: retry it within the cycle, and keep the watermark below it."""
+        if self.frontier is not None:
+            self.frontier.fail_detail(post_id)
+        if self.watermarks is not None:
+            self.watermarks.fail(self.search_key, post_id)
+
+    def _fetch_post_detail_as(self, record, backend=None):
+        """Fetch a post's details as the least recently used account with budget left, charging it to that account."""
+        account = self.accounts.acquire(self._stop_event)
+        if account is None:
+            return None
+        post = None
+        detail = self.backend_names['detail']
+        try:
+            contact_client = self._account_client(account) if self.contact_client is not None else None
+            if self.browser_details:
+                with self.driver_pool.lease(account=account) as driver:
+                    post = self._fetch_post_detail(driver, record, driver.current_window_handle)
+            elif detail == 'selenium':
+                with self.driver_pool.lease(account=account) as driver:
+                    post = self._fetch_post_detail_backend(SeleniumBackend(driver), record, contact_client)
+            elif detail == 'http':
+                backend = HttpBackend(self._account_fetcher(account))
+                post = self._fetch_post_detail_backend(backend, record, contact_client)
+            else:
+                # Playwright keeps its own browser session; only the contact reveal switches account
+                post = self._fetch_post_detail_backend(backend or self.detail_backend, record, contact_client)
+        except Exception as e:
+            self.logger.error(f"Post {record['id']} - Detail fetch as '{account.name}' failed: {e}")
+        self.accounts.record(account, post is not None)
+        return post
+
+    def _record_contact(self, driver, post_id):
+        """Record the revealed manager block as the reply to the reveal request, so a replayed `ContactClient` finds it."""
+        try:
+            blocks = driver.find_elements(
+                By.XPATH, '//div[contains(@class, "manager")] | //dl[dd[contains(@class, "devTplLyClick")]]')
+            fragment = "\n".join(block.get_attribute('outerHTML') for block in blocks)
+            if not fragment:
+                return
+            method, url, data = reveal_request(self.config, self.base_url, post_id)
+            if method == 'GET':
+                self.recorder.add_page(f"{url}?{urlencode(data)}", fragment)
+            else:
+                self.recorder.add_page(url, fragment, method, urlencode(data))
+        except Exception as e:
+            self.logger.error(f"Post {post_id} - Failed to record the contact reveal: {e}")
+
+    def _fetch_post_detail(self, driver, record, original_window):
+        """Open a post's details URL in a new tab, reveal the contact info and extract recruitment details."""
+        post_id = record['id']
+        details_url = record['details_url']
+        post = {
+            'id': post_id,
+            'title': record['title'],
+            'company': record['company'],
+            'details': record['details'],
+            'details_url': details_url,
+            'manager_info': "Not found",
+            'recruitment_details': {}
+        }
+
+        # Open details URL in a new tab
+        open_timer = self.metrics.timer('detail_open', backend='selenium')
+        try:
+            self.logger.info(f"Post {post_id} - Opening details URL in new tab: {details_url}")
+            driver.execute_script("window.open(arguments[0], '_blank');", details_url)
+            WebDriverWait(driver, 10).until(EC.number_of_windows_to_be(2))
+            new_window = [handle for handle in driver.window_handles if handle != original_window][0]
+            driver.switch_to.window(new_window)
+            WebDriverWait(driver, 20).until(
+                EC.presence_of_element_located((By.XPATH, '//body'))
+            )
+            self.logger.info(f"Post {post_id} - Successfully switched to new tab")
+            open_timer.stop()
+            self.lean.log_page(driver, f"Post {post_id}")
+            if self.recorder is not None:
+                self.recorder.add_page(driver.current_url, driver.page_source)
+        except:
+            open_timer.stop(error=True)
+            self.logger.error(f"Post {post_id} - Failed to open or switch to new tab")
+            try:
+                driver.switch_to.window(original_window)
+                self.logger.info(f"Post {post_id} - Switched back to original window")
+            except:
+                self.logger.error(f"Post {post_id} - Failed to switch back to original window")
+            return None
+
+        contact_timer = self.metrics.timer('contact_reveal', backend='selenium')
+        try:
+            contact_section = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located(
+                    (By.XPATH,
+                     '//dd[contains(@class, "devTplLyClick") and .//button[contains(@class, "devOpenCharge")]]')
+                )
+            )
+            self.logger.info(f"Post {post_id} - Contact information section found")
+
+            # Scroll to the contact section
+            try:
+                ActionChains(driver).move_to_element(contact_section).perform()
+                self.logger.info(f"Post {post_id} - Scrolled to contact section")
+            except:
+                self.logger.error(f"Post {post_id} - Failed to scroll to contact section")
+
+            # Click the "Check your contact information" button
+            try:
+                contact_button = WebDriverWait(contact_section, 10).until(
+                    EC.element_to_be_clickable((By.XPATH, './/button[contains(@class, "devOpenCharge")]'))
+                )
+                ActionChains(driver).move_to_element(contact_button).click().perform()
+                self.logger.info(
+                    f"Post {post_id} - Clicked 'Check your contact information' button via ActionChains")
+                WebDriverWait(driver, 10).until(
+                    EC.invisibility_of_element((By.XPATH, './/button[contains(@class, "devOpenCharge")]'))
+                )
+                self.logger.info(f"Post {post_id} - Contact button hidden, assuming contact info loaded")
+            except (ElementClickInterceptedException, TimeoutException, WebDriverException) as e:
+                self.logger.error(f"Post {post_id} - ActionChains click failed: {str(e)}")
+                try:
+                    driver.execute_script("arguments[0].click();", contact_button)
+                    self.logger.info(
+                        f"Post {post_id} - Clicked 'Check your contact information' button via JavaScript")
+                    WebDriverWait(driver, 10).until(
+                        EC.invisibility_of_element(
+                            (By.XPATH, './/button[contains(@class, "devOpenCharge")]'))
+                    )
+                    self.logger.info(
+                        f"Post {post_id} - Contact button hidden, assuming contact info loaded")
+                except:
+                    self.logger.error(
+                        f"Post {post_id} - JavaScript click failed, proceeding with available data")
+
+            if self.recorder is not None:
+                self._record_contact(driver, post_id)
+
+            # Extract contact information after clicking
+            try:
+                phone = "Not found"
+                email = "Not found"
+                name = "Not found"
 
-            while not self._stop.is_set():
+                # Try to get name
                 try:
-                    driver.get("https://www.jobkorea.co.kr/recruit/joblist?menucode=local&localorder=1")
-                    self._apply_filters(driver)  # Apply sorting filter
-                    time.sleep(5)
+                    name_element = driver.find_element(By.XPATH,
+                                                       '(//div[contains(@class, "manager")]//dt)[1]/following-sibling::dd[1]')
+                    name = name_element.text.strip()
+                    self.logger.info(f"Post {post_id} - Extracted name: {name}")
+                except:
+                    self.logger.warning(f"Post {post_id} - Name not found")
 
+                # Try to get phone numbers
+                try:
+                    phone_elements = contact_section.find_elements(By.XPATH,
+                                                                   './/span[contains(@class, "tahoma") and not(contains(@class, "tplHide"))]')
+                    phone = ", ".join([elem.text.strip() for elem in phone_elements])
+                    self.logger.info(f"Post {post_id} - Extracted phone: {phone}")
+                except:
+                    self.logger.warning(f"Post {post_id} - Phone number not found")
 
+                # Try to get email
+                try:
+                    email_element = WebDriverWait(driver, 5).until(
+                        EC.presence_of_element_located((By.XPATH,
+                                                        '//dd[not(contains(@class, "tplHide"))]//a[contains(@href, "mailto:")]'))
+                    )
+                    email = email_element.text.strip()
+                    self.logger.info(f"Post {post_id} - Extracted email: {email}")
+                except:
+                    self.logger.warning(f"Post {post_id} - Email not found")
+
+                contact_timer.stop()
+                # Check if any contact info was found and extract job details if present
+                if phone != "Not found" or email != "Not found" or name != "Not found":
+                    post['manager_info'] = f"Name: {name}, Phone: {phone}, Email: {email}"
+                    try:
+                        tb_row_element = driver.find_element(By.XPATH, '(//div[@class="tbRow clear"])[1]')
+                        post['recruitment_details'] = self._parse_details(
+                            detail_parser.parse_fragment, tb_row_element.get_attribute("outerHTML"), post_id)
+                    except Exception as e:
+                        self.logger.error(f"Post {post_id} - Failed to extract job details: {str(e)}")
+                        self.logger.info(f"Post {post_id} - Appended with partial data due to error")
+                else:
+                    try:
+                        dom_snippet = driver.find_element(By.XPATH,
+                                                          '//div[contains(@class, "manager")]').get_attribute(
+                            'outerHTML')
+                        self.logger.debug(f"Post {post_id} - DOM snippet of manager section: {dom_snippet}")
+                    except:
+                        self.logger.debug(f"Post {post_id} - Failed to capture DOM snippet")
+                    self.logger.info(
+                        f"Post {post_id} - Extracted contact info (post-click): Not found")
 
-                    self._click_search_button(driver)  # Click the search button
-                    time.sleep(5)
+            except:
+                contact_timer.stop(error=True)
+                self.logger.error(f"Post {post_id} - Failed to extract contact info after clicking")
+                try:
+                    dom_snippet = driver.find_element(By.XPATH,
+                                                      '//div[contains(@class, "manager")]').get_attribute(
+                        'outerHTML')
+                    self.logger.debug(f"Post {post_id} - DOM snippet of manager section: {dom_snippet}")
+                except:
+                    self.logger.debug(f"Post {post_id} - Failed to capture DOM snippet")
 
-                    self.select_registration_date_sort(driver)
-                    time.sleep(5)
+        except:
+            self.logger.info(f"Post {post_id} - No contact information section found, closing new tab")
 
-                    self.apply_exclude_viewed_filter(driver)
-                    time.sleep(5)
+        # Close the new tab and switch back to the original window
+        try:
+            driver.close()
+            self.logger.info(f"Post {post_id} - Closed new tab")
+            driver.switch_to.window(original_window)
+            self.logger.info(f"Post {post_id} - Switched back to original window")
+        except:
+            self.logger.error(f"Post {post_id} - Failed to close new tab or switch back")
+            try:
+                driver.switch_to.window(original_window)
+                self.logger.info(f"Post {post_id} - Recovered to original window")
+            except:
+                self.logger.error(f"Post {post_id} - Failed to recover to original window")
+
+        if post['manager_info'] == NOT_FOUND:
+            # Not delivered and not marked seen, so a later cycle tries the post again
+            return None
+        return post
+
+    def run(self):
+        """Main crawling loop with pagination."""
+        try:
+            driver = self._refresh_session()
+            listing_name = self.backend_names['listing']
+            if listing_name == 'http':
+                self.listing_backend = HttpBackend(self.listing_fetcher)
+            elif listing_name == 'playwright':
+                self.listing_backend = self._create_backend(listing_name)
+            if self.detail_pool is None and not self.browser_details and (
+                    not self.multi_account or self.backend_names['detail'] == 'playwright'):
+                # A Selenium detail backend leases its own driver so the listing page stays put
+                self.detail_backend = self._create_backend(self.backend_names['detail'])
+            backends = ", ".join(f"{stage}={name}" for stage, name in self.backend_names.items())
+            self.logger.info(f"Starting crawler (backends: {backends})")
+            if self.on_status_callback:
+                self.on_status_callback("Crawler started")
+            if self.frontier is not None:
+                # Posts fetched before the last shutdown that never reached the GUI
+                pending = self.frontier.undelivered(self.search_key)
+                if pending:
+                    self.logger.info(f"Delivering {len(pending)} posts recovered from the frontier")
+                    self.known_post_ids.update(post['id'] for post in pending)
+                    self._deliver(pending)
+
+            while not self._stop_event.is_set():
+                try:
+                    if self.listing_params is not None:
+                        # The compiled condition goes with every listing request; no browser filtering needed
+                        self.logger.info(f"Using compiled search condition '{self.condition.name}'")
+                    else:
+                        # Each step moves on as soon as the page is ready instead of sleeping a fixed 5s
+                        with self.metrics.span('filters'):
+                            self.step_runner.run(driver, self._navigation_steps(), self._stop_event)
                     current_page = 1
-                    time.sleep(5)
+                    if self.frontier is not None:
+                        current_page = self.frontier.begin_cycle(self.search_key)
+                        if current_page > 1 and self.listing_backend is None:
+                            self._goto_listing_page(driver, current_page)
                     total_pages = None
+                    self.total_pages = None
+                    cycle_new_posts = 0
 
-                    while not self._stop.is_set():
+                    while not self._stop_event.is_set():
                         # Scan posts on the current page
-                        new_posts = self._scan_posts(driver)
+                        self.page_records = []
+                        new_posts = self._scan_posts(driver, current_page)
 
-                        if self._stop.is_set():
+                        if self._stop_event.is_set():
                             self.logger.info("Stop signal received, exiting scan loop")
                             break
 
                         self._stoppable_sleep(1)
-                        if new_posts and self.on_new_callback:
-                            self.on_new_callback(new_posts)
+                        cycle_new_posts += len(new_posts)
+                        if new_posts:
+                            self._deliver(new_posts)
                             self.logger.info(f"Found {len(new_posts)} new posts on page {current_page}")
 
+                        if self.watermarks is not None:
+                            older = self.watermarks.page_is_older(self.search_key, self.page_records)
+                            self.watermarks.observe(self.search_key, self.page_records)
+                            if older:
+                                self.logger.info(f"Page {current_page} is older than the watermark, stopping pagination")
+                                break
+
                         # Find the next page link
                         try:
 
                             # Get all pagination links to determine total pages
-                            if total_pages is None:
+                            if total_pages is None and self.total_pages is not None:
+                                total_pages = self.total_pages
+                                self.logger.info(f"Total pages detected: {total_pages}")
+                            elif total_pages is None:
 
                                 pagination_links = WebDriverWait(driver, 10).until(
                                     EC.presence_of_all_elements_located(
@@ -682,30 +966,21 @@ class SiteCrawler(threading.Thread):
                                 total_pages = max(page_numbers) if page_numbers else current_page
                                 self.logger.info(f"Total pages detected: {total_pages}")
 
-                            try:
-                                next_button = driver.find_element(By.CSS_SELECTOR, '#dev-gi-list .btnPgnNext')
-                                print("Next button found inside #dev-gi-list, clicking...")
-                                # next_button.click()
-                            except:
-                                print("No next page button found inside #dev-gi-list.")
-
-                            if not next_button or current_page >= total_pages:
+                            if current_page >= total_pages:
                                 self.logger.info("No more pages to crawl or reached last page")
                                 break
 
-                            time.sleep(5)
-
                             # Navigate to the next page
+                            if self.frontier is not None:
+                                self.frontier.page_done(self.search_key, current_page, current_page + 1)
                             current_page += 1
-                            next_page_url = f"https://www.jobkorea.co.kr/recruit/joblist?menucode=local&localorder=1#anchorGICnt_{current_page}"
-                            self.logger.info(f"Navigating to page {current_page}: {next_page_url}")
-                            driver.get(next_page_url)
-                            WebDriverWait(driver, 20).until(
-                                EC.presence_of_all_elements_located(
-                                    (By.XPATH,
-                                     '//div[@id="dev-gi-list"]//tr[contains(@class, "devloopArea") and .//th[@scope="row"]//input[@type="checkbox"]]')
-                                )
-                            )
+                            if self.listing_backend is not None:
+                                # The listing backend fetches the next page itself; the browser stays put
+                                self.logger.info(f"Moving to page {current_page} with the {self.listing_backend.name} backend")
+                            else:
+                                # Moves on as soon as the next page's rows are in instead of sleeping a fixed 5s
+                                with self.metrics.span('pagination'):
+                                    self.step_runner.run(driver, [self._page_step(current_page)], self._stop_event)
 
                         except Exception as e:
                             self.logger.error(f"Failed to navigate to next page: {str(e)}")
@@ -714,26 +989,47 @@ class SiteCrawler(threading.Thread):
                         # Brief pause to avoid overwhelming the server
                         self._stoppable_sleep(2)
 
-                    if self._stop.is_set():
+                    if self._stop_event.is_set():
                         self.logger.info("Stop signal received, exiting page loop")
                         break
 
+                    if self.watermarks is not None:
+                        self.watermarks.commit(self.search_key)
+                    if self.frontier is not None:
+                        self.frontier.end_cycle(self.search_key)
+                    self.metrics.inc('cycles_total')
+
                     # After all pages are crawled, wait for the refresh interval
-                    interval = self.config.getint('web', 'refresh_interval', fallback=300)
+                    interval = self._next_interval(cycle_new_posts)
                     self.logger.info(f"Finished crawling all pages, waiting {interval} seconds")
                     self._stoppable_sleep(interval)
 
                 except Exception as e:
                     self.logger.error(f"Crawler loop error: {str(e)}")
+                    self.metrics.inc('cycle_errors_total')
                     self._stoppable_sleep(10)  # Brief pause before retry
         except Exception as e:
             self.logger.error(f"Crawler initialization error: {str(e)}")
         finally:
-            self.auth.close()
+            if self.lease is not None:
+                # A stop mid-page can leave the driver anywhere; the pool health-checks it on the next lease
+                self.lease.release()
+                self.lease = None
+            if self.detail_pool is not None:
+                self.detail_pool.close()
+            for backend in (self.detail_backend, self.listing_backend):
+                if backend is not None:
+                    backend.close()
+            for fetcher in self._account_fetchers.values():
+                if fetcher is not self.listing_fetcher:
+                    fetcher.close()
+            if self.listing_fetcher is not None:
+                self.listing_fetcher.close()
+            if self.frontier is not None:
+                self.frontier.close()
             self.logger.info("Crawler stopped")
 
     def stop(self):
-        """Stop the crawler and close the WebDriver."""
-        self._stop.set()
-        self.auth.close()  # Ensure WebDriver is closed immediately
-        self.logger.info("Crawler stop requested and WebDriver closed")
+        """Stop the crawler; its WebDriver goes back to the pool once run() unwinds."""
+        self._stop_event.set()
+        self.logger.info("Crawler stop requested, WebDriver returns to the pool")
@@ -0,0 +1,183 @@
+import json
+import logging
+import re
+from pathlib import Path
+from typing import TypedDict
+
+from lxml import etree, html
+
+try:
+    from lxml.cssselect import CSSSelector
+except ImportError:  # `css` rules need the cssselect package; `label` and `xpath` rules do not
+    CSSSelector = None
+
+NOT_FOUND = "Not found"
+SCHEMA_FILE = Path(__file__).with_name('detail_fields.json')
+
+
+class RecruitmentDetails(TypedDict):
+    """Recruitment details of one post, keyed as in `detail_fields.json`; a field missing on the page is "Not found"."""
+    experience: str
+    education: str
+    employment_type: str
+    employment_info: str
+    salary: str
+    region: str
+    working_hours: str
+    industry: str
+    year_established: str
+    corporate_form: str
+
+
+_YEAR = re.compile(r'(?:19|20)\d{2}')
+
+# Normalizer name in the schema -> function applied to a field's stripped value
+NORMALIZERS = {
+    'collapse_whitespace': lambda value: ' '.join(value.split()),
+    'year': lambda value: (_YEAR.search(value) or [value])[0],
+}
+READ_MODES = ('text', 'items', 'links')
+
+
+def _has_class(name):
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+class DetailParser:
+    """Reads the `div.tbRow` recruitment block of a `GI_Read` page with the rules of a field schema.
+
+    The schema (`detail_fields.json`) is compiled once: `label` rules are answered from a
+    single pass over the `dl.tbList` lists, and `xpath`/`css` selectors only run for a field
+    whose label rules came up empty. Holds no per-call state, so one instance can serve
+    every thread or worker process.
+    """
+
+    # Compiled once at import; every parse reuses the same XPath objects.
+    _tb_row = etree.XPath('(//div[@class="tbRow clear"])[1]')
+    _lists = etree.XPath(f'.//div[{_has_class("tbCol")}]//dl[{_has_class("tbList")}]')
+    _in_company = etree.XPath(f'boolean(ancestor::div[{_has_class("tbCoInfo")}])')
+    _items = etree.XPath(f'.//ul[{_has_class("addList")}]/li')
+    _links = etree.XPath('.//a')
+
+    def __init__(self, schema_file=SCHEMA_FILE):
+        self.logger = logging.getLogger(__name__)
+        with open(schema_file, 'r', encoding='utf-8') as f:
+            self.fields = self._compile(json.load(f)['fields'])
+
+    def _compile(self, fields):
+        """Schema fields -> [(field, [rule, ...], [normalizer, ...])]; raises ValueError on an invalid rule."""
+        compiled = []
+        for field, spec in fields.items():
+            rules = []
+            for rule in spec.get('rules', []):
+                read = rule.get('read', 'text')
+                if read not in READ_MODES:
+                    raise ValueError(f"Field '{field}': unknown read mode '{read}'")
+                if 'label' in rule:
+                    rules.append(('label', rule['label'], read, rule.get('column') == 'company'))
+                elif 'xpath' in rule:
+                    try:
+                        rules.append(('select', etree.XPath(rule['xpath']), read, False))
+                    except etree.XPathSyntaxError as e:
+                        raise ValueError(f"Field '{field}': invalid xpath {rule['xpath']!r}: {e}")
+                elif 'css' in rule:
+                    if CSSSelector is None:
+                        self.logger.warning(f"Field '{field}': skipping css rule, cssselect is not installed")
+                        continue
+                    rules.append(('select', CSSSelector(rule['css']), read, False))
+                else:
+                    raise ValueError(f"Field '{field}': a rule needs 'label', 'xpath' or 'css'")
+            try:
+                normalizers = [NORMALIZERS[name] for name in spec.get('normalize', [])]
+            except KeyError as e:
+                raise ValueError(f"Field '{field}': unknown normalizer {e}")
+            compiled.append((field, rules, normalizers))
+        return compiled
+
+    def labels(self, root):
+        """(dt label, dd element, in company column) for every `dt` directly followed by a `dd`, in page order."""
+        entries = []
+        for dl in self._lists(root):
+            in_company = self._in_company(dl)
+            previous = None
+            for child in dl.iterchildren(tag=etree.Element):
+                if child.tag == 'dd' and previous is not None and previous.tag == 'dt':
+                    entries.append((previous.text_content().strip(), child, in_company))
+                previous = child
+        return entries
+
+    @classmethod
+    def _read(cls, node, mode):
+        if not isinstance(node, etree._Element):
+            return str(node).strip()  # An xpath string or attribute result
+        if mode == 'items':
+            return ", ".join(li.text_content().strip() for li in cls._items(node))
+        if mode == 'links':
+            return ", ".join(a.text_content().strip() for a in cls._links(node))
+        return node.text_content().strip()
+
+    def _apply(self, rule, root, entries):
+        kind, target, mode, company_only = rule
+        if kind == 'label':
+            for text, dd, in_company in entries:
+                if target in text and (in_company or not company_only):
+                    return self._read(dd, mode)
+            return ""
+        result = target(root)
+        if isinstance(result, list):
+            result = result[0] if result else ""
+        return self._read(result, mode)
+
+    def parse_row(self, root, post_id="", fields=None):
+        """Recruitment details from a parsed `div.tbRow` element; `fields` limits which fields are extracted."""
+        entries = self.labels(root)
+        details = {}
+        for field, rules, normalizers in self.fields:
+            if fields is not None and field not in fields:
+                continue
+            value = ""
+            for rule in rules:
+                value = self._apply(rule, root, entries)
+                if value:
+                    break
+            if not value:
+                details[field] = NOT_FOUND
+                self.logger.warning(f"Post {post_id} - {field.replace('_', ' ').capitalize()} not found")
+                continue
+            for normalize in normalizers:
+                value = normalize(value)
+            details[field] = value
+        self.logger.info(f"Post {post_id} - Extracted recruitment details: {details}")
+        return RecruitmentDetails(**details)
+
+    def parse_fragment(self, source, post_id="", fields=None):
+        """Recruitment details from the `div.tbRow` outerHTML."""
+        return self.parse_row(html.fromstring(source), post_id, fields)
+
+    def parse_page(self, source, post_id="", fields=None):
+        """Recruitment details from a whole `GI_Read` page, or {} when it has no `div.tbRow`."""
+        rows = self._tb_row(html.fromstring(source))
+        if not rows:
+            self.logger.warning(f"Post {post_id} - Recruitment details section not found")
+            return {}
+        return self.parse_row(rows[0], post_id, fields)
+
+
+_parser = None
+
+
+def _default_parser():
+    global _parser
+    if _parser is None:
+        _parser = DetailParser()
+    return _parser
+
+
+def parse_page(source, post_id=""):
+    """`DetailParser.parse_page` with this process's default parser; picklable for worker processes."""
+    return _default_parser().parse_page(source, post_id)
+
+
+def parse_fragment(source, post_id=""):
+    """`DetailParser.parse_fragment` with this process's default parser; picklable for worker processes."""
+    return _default_parser().parse_fragment(source, post_id)
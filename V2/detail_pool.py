@@ -0,0 +1,88 @@
+import logging
+import queue
+import threading
+
+
+class DetailWorkerPool:
+    """Fetches detail pages with N long-lived workers pulling post records from a shared queue.
+
+    Each worker owns one resource built by `make_worker` (a logged-in driver, an HTTP
+    session, ...) and calls `handle(resource, record)` for every record it takes. All
+    workers draw from the same rate limiter, so politeness is set once for the host.
+    """
+
+    def __init__(self, make_worker, handle, size, limiter, stop_event, close_worker=None):
+        self.make_worker = make_worker
+        self.handle = handle
+        self.size = max(1, int(size))
+        self.limiter = limiter
+        self.stop_event = stop_event
+        self.close_worker = close_worker
+        self.logger = logging.getLogger(__name__)
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        self._threads = []
+
+    def _ensure_started(self):
+        if self._threads:
+            return
+        for n in range(self.size):
+            thread = threading.Thread(target=self._work, name=f"detail-worker-{n + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self.logger.info(f"Started {self.size} detail workers")
+
+    def _work(self):
+        resource = None
+        try:
+            while True:
+                record = self._tasks.get()
+                if record is None:
+                    break
+                result = None
+                try:
+                    if self.stop_event.is_set() or not self.limiter.acquire(stop_event=self.stop_event):
+                        continue
+                    if resource is None:
+                        resource = self.make_worker()
+                    result = self.handle(resource, record)
+                except Exception as e:
+                    self.logger.error(f"Post {record.get('id')} - Detail worker failed: {e}")
+                finally:
+                    self._results.put(result)
+        finally:
+            if resource is not None and self.close_worker:
+                try:
+                    self.close_worker(resource)
+                except Exception as e:
+                    self.logger.error(f"Failed to close detail worker: {e}")
+
+    def map(self, records):
+        """Process a batch of records and return the non-empty results in completion order."""
+        if not records:
+            return []
+        self._ensure_started()
+        for record in records:
+            self._tasks.put(record)
+
+        results = []
+        pending = len(records)
+        while pending:
+            try:
+                result = self._results.get(timeout=0.5)
+            except queue.Empty:
+                if self.stop_event.is_set() and not any(t.is_alive() for t in self._threads):
+                    break
+                continue
+            pending -= 1
+            if result:
+                results.append(result)
+        return results
+
+    def close(self):
+        """Stop the workers once their current record is done and release their resources."""
+        for _ in self._threads:
+            self._tasks.put(None)
+        for thread in self._threads:
+            thread.join(timeout=30)
+        self._threads = []
@@ -0,0 +1,192 @@
+import configparser
+import logging
+import threading
+import time
+
+from accounts import DEFAULT_ACCOUNT
+from auth import AuthManager
+
+try:
+    import psutil
+except ImportError:  # RSS-based recycling is skipped without psutil
+    psutil = None
+
+
+class DriverLease:
+    """A driver borrowed from a `DriverPool`; give it back with `release()` or a `with` block."""
+
+    def __init__(self, pool, entry):
+        self._pool = pool
+        self._entry = entry
+        self.driver = entry.auth.driver
+
+    def release(self, discard=False):
+        """Return the driver to the pool, or quit it when `discard` is set."""
+        if self._entry is not None:
+            self._pool._release(self._entry, discard)
+            self._entry = None
+
+    def __enter__(self):
+        return self.driver
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+class _PooledDriver:
+    """Pool bookkeeping for one authenticated browser."""
+
+    def __init__(self, auth):
+        self.auth = auth
+        self.account = auth.account.name if auth.account else None
+        self.uses = 0
+        self.created = time.time()
+
+
+class DriverPool:
+    """Keeps authenticated Chrome instances warm and hands them out through leases."""
+
+    def __init__(self, config_path='config.ini'):
+        self.config = configparser.ConfigParser()
+        self.config.read(config_path)
+        self.config_path = config_path
+        self.size = self.config.getint('driver_pool', 'size', fallback=2)
+        self.max_uses = self.config.getint('driver_pool', 'max_uses', fallback=200)
+        self.max_rss_mb = self.config.getint('driver_pool', 'max_rss_mb', fallback=1500)
+        self.logger = logging.getLogger(__name__)
+        self._idle = []
+        self._leased = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _create(self, account=None):
+        auth = AuthManager(self.config_path, account)
+        auth.login()
+        self.logger.info(f"Pooled WebDriver logged in as '{account.name if account else 'default'}'")
+        return _PooledDriver(auth)
+
+    def _take_idle(self, name):
+        """Pop an idle driver logged in as `name`; with none, evict another account's idle driver to make room."""
+        for i, entry in enumerate(self._idle):
+            if entry.account == name:
+                return self._idle.pop(i), None
+        if self._idle and self._leased + len(self._idle) >= self.size:
+            return None, self._idle.pop(0)
+        return None, None
+
+    def _rss_mb(self, entry):
+        """Resident memory of the chromedriver process and every browser process under it."""
+        if psutil is None:
+            return 0
+        try:
+            root = psutil.Process(entry.auth.driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except Exception:
+            return 0
+
+    def _needs_recycle(self, entry):
+        if entry.uses >= self.max_uses:
+            self.logger.info(f"Recycling WebDriver after {entry.uses} uses")
+            return True
+        rss = self._rss_mb(entry)
+        if rss > self.max_rss_mb:
+            self.logger.info(f"Recycling WebDriver at {rss:.0f} MB RSS")
+            return True
+        return False
+
+    def _reset(self, entry):
+        """Close tabs a borrower left open and drop its unread performance log, so the next lease starts clean."""
+        driver = entry.auth.driver
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        entry.auth.lean.drain(driver)
+
+    def _discard(self, entry):
+        try:
+            entry.auth.close()
+        except Exception as e:
+            self.logger.error(f"Failed to close pooled WebDriver: {e}")
+
+    def lease(self, timeout=None, account=None):
+        """Borrow a driver logged in as `account` (the [web] login by default), launching one if the pool has room.
+
+        Blocks while all drivers are leased.
+        """
+        if account is not None and account.name == DEFAULT_ACCOUNT:
+            account = None  # The default account is the [web] login: share its drivers with plain leases
+        name = account.name if account else None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                entry, evicted = self._take_idle(name)
+                if entry is None and evicted is None and self._leased + len(self._idle) >= self.size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("No pooled WebDriver available")
+                    self._cond.wait(remaining)
+                    continue
+                self._leased += 1
+
+            try:
+                if evicted is not None:
+                    self._discard(evicted)
+                if entry is not None and not entry.auth.is_logged_in():
+                    self.logger.info("Pooled WebDriver lost its session, replacing it")
+                    self._discard(entry)
+                    entry = None
+                if entry is None:
+                    entry = self._create(account)
+            except Exception:
+                with self._cond:
+                    self._leased -= 1
+                    self._cond.notify()
+                raise
+            entry.uses += 1
+            return DriverLease(self, entry)
+
+    def _release(self, entry, discard):
+        if not discard:
+            try:
+                self._reset(entry)
+                discard = self._needs_recycle(entry)
+            except Exception as e:
+                self.logger.error(f"Pooled WebDriver is unusable, discarding it: {e}")
+                discard = True
+        with self._cond:
+            self._leased -= 1
+            if not discard and not self._closed:
+                self._idle.append(entry)
+                entry = None
+            self._cond.notify()
+        if entry is not None:
+            self._discard(entry)
+
+    def close(self):
+        """Quit every idle driver; leased drivers are quit as they come back."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for entry in idle:
+            self._discard(entry)
+        self.logger.info("Driver pool closed")
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(config_path='config.ini'):
+    """Return the process-wide pool for a config file, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(config_path)
+        if pool is None or pool._closed:
+            pool = _pools[config_path] = DriverPool(config_path)
+        return pool
@@ -1,17 +1,56 @@
-import pandas as pd
+import json
 import os
 import logging
+import threading
+from datetime import datetime
 from pathlib import Path
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %= (levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('crawler.log', encoding='utf-8'),
-        logging.StreamHandler()
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+# Column header -> recruitment detail key; the first six columns come from the post itself
+DETAIL_COLUMNS = [
+    ('Experience', 'experience'),
+    ('Education', 'education'),
+    ('Employment Type', 'employment_type'),
+    ('Employment Info', 'employment_info'),
+    ('Salary', 'salary'),
+    ('Region', 'region'),
+    ('Working Hours', 'working_hours'),
+    ('Industry', 'industry'),
+    ('Year Established', 'year_established'),
+    ('Corporate Form', 'corporate_form'),
+]
+COLUMNS = ['ID', 'Title', 'Company', 'Details', 'Details URL', 'Manager Info'] + [h for h, _ in DETAIL_COLUMNS]
+
+
+def post_row(post):
+    """One spreadsheet row for a post, in `COLUMNS` order."""
+    job_details = post.get('recruitment_details', {})
+    row = [
+        post.get('id', ''),
+        post.get('title', ''),
+        post.get('company', ''),
+        '; '.join(post.get('details', [])),  # Join list of details
+        post.get('details_url', ''),
+        post.get('manager_info', ''),
     ]
-)
+    row.extend(job_details.get(key, 'Not found') for _, key in DETAIL_COLUMNS)
+    # Control characters scraped from a page would make openpyxl refuse the row
+    return [ILLEGAL_CHARACTERS_RE.sub('', value) if isinstance(value, str) else value for value in row]
+
+
+def write_workbook(path, rows):
+    """Write a header plus `rows` with a streaming (write-only) workbook, replacing `path` atomically."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Posts')
+    sheet.append(COLUMNS)
+    for row in rows:
+        sheet.append(row)
+    tmp_path = path.with_name(f'~{path.name}')
+    workbook.save(tmp_path)
+    os.replace(tmp_path, path)
+
 
 class DataExporter:
     """Handles exporting crawled data to Excel."""
@@ -25,36 +64,144 @@ class DataExporter:
         try:
             # Ensure output folder exists
             self.output_folder.mkdir(parents=True, exist_ok=True)
-
-            # Prepare data for Excel
-            data = []
-            for post in posts:
-                job_details = post.get('recruitment_details', {})
-                data.append({
-                    'ID': post.get('id', ''),
-                    'Title': post.get('title', ''),
-                    'Company': post.get('company', ''),
-                    'Details': '; '.join(post.get('details', [])),  # Join list of details
-                    'Details URL': post.get('details_url', ''),
-                    'Manager Info': post.get('manager_info', ''),
-                    'Experience': job_details.get('experience', 'Not found'),
-                    'Education': job_details.get('education', 'Not found'),
-                    'Employment Type': job_details.get('employment_type', 'Not found'),
-                    'Employment Info': job_details.get('employment_info', 'Not found'),
-                    'Salary': job_details.get('salary', 'Not found'),
-                    'Region': job_details.get('region', 'Not found'),
-                    'Working Hours': job_details.get('working_hours', 'Not found'),
-                    'Industry': job_details.get('industry', 'Not found'),
-                    'Year Established': job_details.get('year_established', 'Not found'),
-                    'Corporate Form': job_details.get('corporate_form', 'Not found')
-                })
-
-            # Create DataFrame and save to Excel
-            df = pd.DataFrame(data)
             output_path = self.output_folder / filename
-            df.to_excel(output_path, index=False, engine='openpyxl')
+            write_workbook(output_path, (post_row(post) for post in posts))
             self.logger.info(f"Exported {len(posts)} posts to {output_path}")
             return str(output_path)
         except Exception as e:
             self.logger.error(f"Failed to export to Excel: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+class StreamingExport:
+    """Appends posts to Excel as they arrive, in rolling part workbooks, so export cost follows new data only.
+
+    Each batch is appended to the open part's row journal (`.journal/<part>.jsonl`) at once.
+    Finalizing, every `finalize_interval` seconds on a background thread, rewrites only the
+    open part's workbook from its journal. A part is sealed at `part_rows` rows or when
+    `filename_template` names a new file (a new day), and is never written again.
+    """
+
+    def __init__(self, output_folder='output', filename_template='jobkorea_data_%Y%m%d.xlsx', part_rows=5000,
+                 finalize_interval=60):
+        self.output_folder = Path(output_folder)
+        self.journal_folder = self.output_folder / '.journal'
+        self.journal_folder.mkdir(parents=True, exist_ok=True)
+        self.filename_template = filename_template
+        self.part_rows = part_rows
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._base = None  # Template file name the open part belongs to
+        self._index = 0  # Part number within `_base`
+        self._part = None  # Path of the open part's workbook
+        self._rows = 0  # Rows in the open part
+        self._dirty = set()  # Parts whose journal has rows the workbook lacks
+        self._write_lock = threading.Lock()  # One finalize at a time (background thread or Export button)
+        self._stop_event = threading.Event()
+        self._finalizer = None
+        if finalize_interval > 0:
+            self._finalizer = threading.Thread(target=self._finalize_loop, args=(finalize_interval,),
+                                               name='export-finalizer', daemon=True)
+            self._finalizer.start()
+
+    @classmethod
+    def from_config(cls, config, output_folder):
+        """The streaming export configured in [export], or None when `streaming` is off."""
+        if not config.getboolean('export', 'streaming', fallback=False):
+            return None
+        return cls(output_folder,
+                   config.get('export', 'filename_template', fallback='jobkorea_data_%Y%m%d.xlsx'),
+                   config.getint('export', 'part_rows', fallback=5000),
+                   config.getint('export', 'finalize_interval', fallback=60))
+
+    def _journal(self, part):
+        return self.journal_folder / f'{part.stem}.jsonl'
+
+    def _part_path(self, base, index):
+        base = Path(base)
+        name = base.name if index == 1 else f'{base.stem}_{index}{base.suffix}'
+        return self.output_folder / name
+
+    def _open_part(self):
+        self._part = self._part_path(self._base, self._index)
+        journal = self._journal(self._part)
+        self._rows = 0
+        if journal.exists():
+            with open(journal, 'rb+') as f:
+                data = f.read()
+                end = data.rfind(b'\n') + 1
+                if end < len(data):
+                    # A crash mid-append left a partial last row; new rows must start on a line of their own
+                    f.truncate(end)
+                    self.logger.warning(f"Dropped a partial row at the end of {journal}")
+                self._rows = data.count(b'\n', 0, end)
+
+    def _roll(self):
+        """Point at the part new rows go to: the latest part of the current file while it has room, else the next."""
+        base = datetime.now().strftime(self.filename_template)
+        if base != self._base:
+            # A new file (or a restart): resume from the journals already on disk
+            self._base, self._index = base, 1
+            while self._journal(self._part_path(base, self._index + 1)).exists():
+                self._index += 1
+            self._open_part()
+        while self._rows >= self.part_rows:
+            self._index += 1
+            self._open_part()
+
+    def append(self, posts):
+        """Journal a batch of posts; the workbook picks them up at the next finalize."""
+        if not posts:
+            return
+        with self._lock:
+            remaining = list(posts)
+            while remaining:
+                self._roll()
+                batch, remaining = remaining[:self.part_rows - self._rows], remaining[self.part_rows - self._rows:]
+                with open(self._journal(self._part), 'a', encoding='utf-8') as f:
+                    for post in batch:
+                        f.write(json.dumps(post_row(post), ensure_ascii=False) + '\n')
+                self._rows += len(batch)
+                self._dirty.add(self._part)
+        self.logger.info(f"Journaled {len(posts)} posts for {self._part.name}")
+
+    def finalize(self):
+        """Rewrite the workbooks of parts with new rows; returns the paths of the current file's parts."""
+        with self._write_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, set()
+            for part in sorted(dirty):
+                try:
+                    rows = []
+                    with self._lock:  # No half-written journal lines
+                        with open(self._journal(part), 'r', encoding='utf-8', errors='replace') as f:
+                            for number, line in enumerate(f, 1):
+                                try:
+                                    rows.append(json.loads(line))
+                                except ValueError:
+                                    # One damaged row must not keep the whole part from ever being written
+                                    self.logger.warning(f"Skipping undecodable row {number} of {self._journal(part)}")
+                    write_workbook(part, rows)
+                    self.logger.info(f"Finalized {len(rows)} rows to {part}")
+                except Exception as e:
+                    # Typically the workbook is open in Excel; the next finalize retries it
+                    self.logger.error(f"Failed to finalize {part}: {e}")
+                    with self._lock:
+                        self._dirty.add(part)
+        with self._lock:
+            if self._base is None:
+                return []
+            parts = [self._part_path(self._base, index) for index in range(1, self._index + 1)]
+        return [str(part) for part in parts if part.exists()]
+
+    def _finalize_loop(self, interval):
+        while not self._stop_event.wait(interval):
+            if self._dirty:
+                self.finalize()
+
+    def close(self):
+        """Stop the background finalizer and write any pending rows."""
+        self._stop_event.set()
+        if self._finalizer is not None:
+            self._finalizer.join(timeout=30)
+        self.finalize()
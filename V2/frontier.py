@@ -0,0 +1,164 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    search_key TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (search_key, page)
+);
+CREATE TABLE IF NOT EXISTS details (
+    post_id TEXT PRIMARY KEY,
+    search_key TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    record TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS details_state ON details (search_key, state);
+"""
+
+# Detail states: pending -> claimed -> done -> delivered, or failed once attempts run out
+PENDING, CLAIMED, DONE, DELIVERED, FAILED = 'pending', 'claimed', 'done', 'delivered', 'failed'
+
+
+class Frontier:
+    """Durable crawl frontier: listing pages and detail posts with their states, in an SQLite WAL database."""
+
+    def __init__(self, path='frontier.db', max_attempts=3, retention_days=7):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retention = retention_days * 86400
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(_SCHEMA)
+        # Claims held when the last run died are up for grabs again
+        reclaimed = self._db.execute('UPDATE details SET state = ? WHERE state = ?', (PENDING, CLAIMED)).rowcount
+        if reclaimed:
+            self.logger.info(f"Frontier: {reclaimed} interrupted detail fetches returned to pending")
+
+    @classmethod
+    def from_config(cls, config):
+        """The frontier named by `frontier_file` in [crawling], or None when unset."""
+        path = config.get('crawling', 'frontier_file', fallback='')
+        if not path:
+            return None
+        return cls(path,
+                   config.getint('crawling', 'frontier_max_attempts', fallback=3),
+                   config.getint('crawling', 'frontier_retention_days', fallback=7))
+
+    @contextmanager
+    def _transaction(self):
+        """Hold the lock and run the block in one write transaction, rolled back if it raises.
+
+        The connection is in autocommit mode, so `with self._db:` alone would not group statements.
+        """
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute('ROLLBACK')
+                raise
+            self._db.execute('COMMIT')
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def begin_cycle(self, search_key):
+        """Page to start the cycle from: the first pending page of an interrupted cycle, else page 1."""
+        with self._transaction():
+            row = self._db.execute('SELECT MIN(page) FROM pages WHERE search_key = ? AND state = ?',
+                                   (search_key, PENDING)).fetchone()
+            if row[0] is not None:
+                self.logger.info(f"Frontier: resuming '{search_key}' at page {row[0]}")
+                return row[0]
+            self._db.execute('DELETE FROM pages WHERE search_key = ?', (search_key,))
+            self._db.execute('INSERT INTO pages VALUES (?, 1, ?, ?)', (search_key, PENDING, time.time()))
+            return 1
+
+    def page_done(self, search_key, page, next_page=None):
+        """Mark a listing page scanned and queue the next one, in one transaction."""
+        now = time.time()
+        with self._transaction():
+            self._db.execute('UPDATE pages SET state = ?, updated = ? WHERE search_key = ? AND page = ?',
+                             ('done', now, search_key, page))
+            if next_page is not None:
+                self._db.execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)',
+                                 (search_key, next_page, PENDING, now))
+
+    def end_cycle(self, search_key):
+        """Forget the cycle's pages and prune delivered posts past the retention period."""
+        with self._transaction():
+            self._db.execute('DELETE FROM pages WHERE search_key = ?', (search_key,))
+            self._db.execute('DELETE FROM details WHERE state IN (?, ?) AND updated < ?',
+                             (DELIVERED, FAILED, time.time() - self.retention))
+
+    def claim_details(self, search_key, page, records):
+        """Add a page's detail records and claim the ones still to fetch; returns them in listing order."""
+        now = time.time()
+        with self._transaction():
+            self._db.executemany(
+                'INSERT OR IGNORE INTO details (post_id, search_key, page, record, state, updated) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(r['id'], search_key, page, json.dumps(r, ensure_ascii=False), PENDING, now) for r in records])
+            pending = {post_id for (post_id,) in self._db.execute(
+                f"SELECT post_id FROM details WHERE state = ? AND post_id IN ({','.join('?' * len(records))})",
+                [PENDING] + [r['id'] for r in records])} if records else set()
+            self._db.executemany('UPDATE details SET state = ?, updated = ? WHERE post_id = ?',
+                                 [(CLAIMED, now, post_id) for post_id in pending])
+        return [r for r in records if r['id'] in pending]
+
+    def complete_detail(self, post_id, post):
+        """Store a fetched post; it stays undelivered until `mark_delivered`."""
+        self._execute('UPDATE details SET state = ?, result = ?, updated = ? WHERE post_id = ?',
+                      (DONE, json.dumps(post, ensure_ascii=False), time.time(), post_id))
+
+    def fail_detail(self, post_id):
+        """Count a failed fetch; the post goes back to pending until `max_attempts` is reached."""
+        with self._transaction():
+            self._db.execute('UPDATE details SET attempts = attempts + 1, updated = ? WHERE post_id = ?',
+                             (time.time(), post_id))
+            self._db.execute('UPDATE details SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END '
+                             'WHERE post_id = ?', (self.max_attempts, FAILED, PENDING, post_id))
+
+    def release_details(self, post_ids):
+        """Return claimed posts that were never attempted (e.g. on stop) to pending."""
+        now = time.time()
+        with self._transaction():
+            self._db.executemany('UPDATE details SET state = ?, updated = ? WHERE post_id = ? AND state = ?',
+                                 [(PENDING, now, post_id, CLAIMED) for post_id in post_ids])
+
+    def mark_delivered(self, post_ids):
+        """Mark posts as handed to the GUI."""
+        now = time.time()
+        with self._transaction():
+            self._db.executemany('UPDATE details SET state = ?, updated = ? WHERE post_id = ?',
+                                 [(DELIVERED, now, post_id) for post_id in post_ids])
+
+    def undelivered(self, search_key):
+        """Posts fetched before an interruption but never handed to the GUI."""
+        rows = self._execute('SELECT result FROM details WHERE search_key = ? AND state = ? ORDER BY updated',
+                             (search_key, DONE))
+        return [json.loads(result) for (result,) in rows]
+
+    def counts(self, search_key):
+        """Number of detail posts per state for a search."""
+        return dict(self._execute('SELECT state, COUNT(*) FROM details WHERE search_key = ? GROUP BY state',
+                                  (search_key,)))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
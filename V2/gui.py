@@ -1,22 +1,18 @@
 import sys
 import configparser
 import logging
+import multiprocessing
 from PySide6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout,
                               QPushButton, QTextEdit, QLineEdit, QCheckBox, QLabel,
                               QTableWidget, QTableWidgetItem, QHeaderView)
 from PySide6.QtCore import Qt, QThread, Signal
 from crawler import SiteCrawler
-from auth import AuthManager
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('crawler.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+from async_crawler import AsyncSiteCrawler
+from coordinator import ShardCoordinator
+from driver_pool import get_pool
+from log_setup import CallbackHandler, add_handler, remove_handler, setup_logging
+from parse_pool import close_parse_pool
+from seen_index import get_seen_index
 
 class CrawlerThread(QThread):
     """Thread to run SiteCrawler and emit signals for GUI updates."""
@@ -29,12 +25,21 @@ class CrawlerThread(QThread):
         self.config_path = config_path
 
     def run(self):
-        """Run the SiteCrawler."""
-        self.crawler = SiteCrawler(
-            config_path=self.config_path,
-            on_new_callback=self.on_new_posts,
-            on_status_callback=self.on_status
-        )
+        """Run the crawl engine selected by `engine` in config.ini (SiteCrawler, AsyncSiteCrawler or ShardCoordinator)."""
+        config = configparser.ConfigParser()
+        config.read(self.config_path)
+        engines = {'async': AsyncSiteCrawler, 'sharded': ShardCoordinator}
+        engine = engines.get(config.get('crawling', 'engine', fallback='thread'), SiteCrawler)
+        try:
+            self.crawler = engine(
+                config_path=self.config_path,
+                on_new_callback=self.on_new_posts,
+                on_status_callback=self.on_status
+            )
+        except ValueError as e:  # A config the engine refuses, e.g. a search condition that cannot be compiled
+            logging.getLogger(__name__).error(f"Failed to start crawler: {e}")
+            self.on_status(f"Error - {e}")
+            return
         self.crawler.join()
 
     def on_new_posts(self, posts):
@@ -52,10 +57,11 @@ class CrawlerThread(QThread):
             self.crawler.join()  # Wait for crawler to fully stop
         self.quit()  # Stop the QThread
 
-from export import DataExporter
+from export import DataExporter, StreamingExport
 
 class MainWindow(QMainWindow):
     """Main GUI window for JOBKOREA crawler."""
+    log_signal = Signal(str)
 
     def __init__(self):
         super().__init__()
@@ -63,11 +69,12 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 900, 650)
         self.config = configparser.ConfigParser()
         self.config.read('config.ini')
-        self.auth = AuthManager(config_path='config.ini')
+        self.driver_pool = get_pool('config.ini')
         self.crawler_thread = None
         self.logger = logging.getLogger(__name__)
         self.all_posts = []  # Store cumulative list of posts
-        self.post_ids = set()  # Track post IDs to avoid duplicates
+        # Shared with the crawler, which skips every ID in it, so posts arrive unique
+        self.seen_index = get_seen_index('config.ini')
 
         # Set up tabs
         self.tabs = QTabWidget()
@@ -78,6 +85,9 @@ class MainWindow(QMainWindow):
         self.setup_settings_tab()
         self.setup_logs_tab()
         self.exporter = DataExporter(self.config.get('crawling', 'output_folder', fallback='output'))
+        # With [export] streaming, each batch is appended to the workbook as it arrives
+        self.stream_export = StreamingExport.from_config(
+            self.config, self.config.get('crawling', 'output_folder', fallback='output'))
 
         # Apply modern dark theme stylesheet
         self.setStyleSheet("""
@@ -257,7 +267,11 @@ class MainWindow(QMainWindow):
                 self.status_label.setText("Status: No posts to export")
                 return
 
-            output_path = self.exporter.export_to_excel(self.all_posts)
+            if self.stream_export is not None:
+                # Posts are already journaled; only the open part needs writing
+                output_path = ", ".join(self.stream_export.finalize())
+            else:
+                output_path = self.exporter.export_to_excel(self.all_posts)
             self.logger.info(f"Exported posts to {output_path}")
             self.status_label.setText(f"Status: Exported to {output_path}")
         except Exception as e:
@@ -303,12 +317,11 @@ class MainWindow(QMainWindow):
         self.log_display.setReadOnly(True)
         layout.addWidget(self.log_display)
 
-        # Load initial logs
-        try:
-            with open('crawler.log', 'r', encoding='utf-8') as f:
-                self.log_display.setText(f.read())
-        except FileNotFoundError:
-            self.log_display.setText("No logs found.")
+        # Records arrive as text lines from the logging listener thread; the signal hands them to the GUI thread
+        self.log_display.document().setMaximumBlockCount(5000)
+        self.log_signal.connect(self.log_display.append)
+        self.log_handler = CallbackHandler(self.log_signal.emit)
+        add_handler(self.log_handler)
 
         logs_tab.setLayout(layout)
         self.tabs.addTab(logs_tab, "Logs")
@@ -316,10 +329,9 @@ class MainWindow(QMainWindow):
     def start_crawler(self):
         """Start the crawler in a background thread."""
         try:
-            # Verify login
-            driver = self.auth.login()
-            driver.quit()  # Close test driver
-            self.logger.info("Login verified, starting crawler")
+            # Verify login; the driver stays warm in the pool for the crawler
+            with self.driver_pool.lease():
+                self.logger.info("Login verified, starting crawler")
 
             # Start crawler thread
             self.crawler_thread = CrawlerThread(config_path='config.ini')
@@ -351,16 +363,17 @@ class MainWindow(QMainWindow):
 
     def update_posts(self, posts):
         """Append new posts to the table, preserving existing posts."""
-        # Filter out duplicates based on post ID
-        new_posts = [post for post in posts if post['id'] not in self.post_ids]
-        if not new_posts:
+        if not posts:
             self.logger.info("No new unique posts to append")
             return
 
-        # Add new posts to cumulative list and ID set
-        self.all_posts.extend(new_posts)
-        for post in new_posts:
-            self.post_ids.add(post['id'])
+        # Add new posts to cumulative list
+        self.all_posts.extend(posts)
+        if self.stream_export is not None:
+            try:
+                self.stream_export.append(posts)
+            except Exception as e:
+                self.logger.error(f"Streaming export failed: {e}")
 
         # Update table with all posts
         self.posts_table.setRowCount(len(self.all_posts))
@@ -369,25 +382,22 @@ class MainWindow(QMainWindow):
             self.posts_table.setItem(i, 1, QTableWidgetItem(post['title']))
             self.posts_table.setItem(i, 2, QTableWidgetItem(post['company']))
 
-        self.logger.info(f"Appended {len(new_posts)} new posts to GUI (total: {len(self.all_posts)})")
+        self.logger.info(f"Appended {len(posts)} new posts to GUI (total: {len(self.all_posts)}, "
+                         f"known: {len(self.seen_index)})")
 
     def update_status(self, message):
-        """Update the status label and logs."""
+        """Update the status label."""
         self.status_label.setText(f"Status: {message}")
-        try:
-            with open('crawler.log', 'r', encoding='utf-8') as f:
-                self.log_display.setText(f.read())
-        except FileNotFoundError:
-            self.log_display.setText("No logs found.")
         self.logger.info(f"Status updated: {message}")
 
     def save_settings(self):
         """Save settings to config.ini."""
         try:
-            self.config['crawling'] = {
-                'headless': str(self.headless_check.isChecked()),
-                'output_folder': self.output_folder_input.text()
-            }
+            # Update keys in place so other [crawling] options survive a save
+            if not self.config.has_section('crawling'):
+                self.config.add_section('crawling')
+            self.config['crawling']['headless'] = str(self.headless_check.isChecked())
+            self.config['crawling']['output_folder'] = self.output_folder_input.text()
             with open('config.ini', 'w') as f:
                 self.config.write(f)
             self.logger.info("Settings saved to config.ini")
@@ -402,13 +412,20 @@ class MainWindow(QMainWindow):
             if self.crawler_thread:
                 self.crawler_thread.stop()
                 self.crawler_thread.wait()
-            self.auth.close()
+            self.driver_pool.close()
+            close_parse_pool('config.ini')
+            if self.stream_export is not None:
+                self.stream_export.close()
+            self.seen_index.close()
             self.logger.info("Application closed")
         except Exception as e:
             self.logger.error(f"Error closing application: {e}")
+        remove_handler(self.log_handler)
         event.accept()
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # Shard workers re-enter this module in frozen (PyInstaller) builds
+    setup_logging()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
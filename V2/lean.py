@@ -0,0 +1,98 @@
+import json
+import logging
+
+# Analytics, ad and tracking hosts seen in session.json, plus static assets the crawler never reads
+DEFAULT_BLOCKED_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*facebook.net*', '*facebook.com/tr*', '*criteo.com*', '*criteo.net*', '*braze.com*', '*appboycdn.com*',
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4',
+]
+
+# Typical transfer size per resource type, used to estimate what a blocked request would have cost
+_TYPICAL_BYTES = {
+    'Image': 30_000,
+    'Font': 40_000,
+    'Script': 25_000,
+    'Media': 150_000,
+    'Stylesheet': 15_000,
+}
+_OTHER_BYTES = 5_000
+
+
+class LeanProfile:
+    """Blocks images, fonts, trackers and ad scripts in Chrome and reports what each page saved."""
+
+    def __init__(self, config):
+        self.enabled = config.getboolean('lean', 'enabled', fallback=False)
+        self.block_images = config.getboolean('lean', 'block_images', fallback=True)
+        # Page reports need Chrome's performance log, which buffers every network event until read
+        self.report = self.enabled and config.getboolean('lean', 'report', fallback=False)
+        extra = config.get('lean', 'blocked_url_patterns', fallback='')
+        self.patterns = DEFAULT_BLOCKED_PATTERNS + [p.strip() for p in extra.split(',') if p.strip()]
+        self.logger = logging.getLogger(__name__)
+
+    def apply_options(self, options):
+        """Set Chrome options before launch: no images, and performance logs when page reports are on."""
+        if not self.enabled:
+            return
+        if self.block_images:
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+            options.add_argument('--blink-settings=imagesEnabled=false')
+        if self.report:
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    def apply(self, driver):
+        """Install the URL blocklist on a running driver through CDP."""
+        if not self.enabled:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.patterns})
+            self.logger.info(f"Lean mode enabled: blocking {len(self.patterns)} URL patterns")
+        except Exception as e:
+            self.logger.error(f"Failed to enable lean mode: {e}")
+
+    def page_report(self, driver):
+        """Summarise network activity since the last report: bytes transferred, requests blocked, bytes saved."""
+        report = {'transferred': 0, 'blocked': 0, 'saved_estimate': 0}
+        if not self.report:
+            return report
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            return report
+        request_types = {}
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                request_types[params.get('requestId')] = params.get('type', 'Other')
+            elif method == 'Network.loadingFinished':
+                report['transferred'] += int(params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                report['blocked'] += 1
+                resource_type = params.get('type') or request_types.get(params.get('requestId'), 'Other')
+                report['saved_estimate'] += _TYPICAL_BYTES.get(resource_type, _OTHER_BYTES)
+        return report
+
+    def log_page(self, driver, label):
+        """Log the page report for one page load."""
+        if not self.report:
+            return
+        report = self.page_report(driver)
+        self.logger.info(f"{label} - Lean mode: {report['transferred'] / 1024:.0f} KB transferred, "
+                         f"{report['blocked']} requests blocked, ~{report['saved_estimate'] / 1024:.0f} KB saved")
+
+    def drain(self, driver):
+        """Discard the performance log a borrower left unread, so it does not pile up in a pooled driver."""
+        if not self.report:
+            return
+        try:
+            driver.get_log('performance')
+        except Exception:
+            pass
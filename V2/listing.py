@@ -0,0 +1,165 @@
+import configparser
+import json
+import logging
+from pathlib import Path
+from urllib.parse import urlencode, urljoin
+
+import requests
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from page_cache import PageCache
+from replay import get_recorder
+
+BASE_URL = 'https://www.jobkorea.co.kr'
+LIST_PATH = '/recruit/_GI_List'
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36')
+
+
+def listing_url(base_url, page, params=None):
+    """Absolute `_GI_List` URL for a page, with optional extra query parameters."""
+    query = [('Page', page)]
+    if params:
+        query.extend(params.items() if isinstance(params, dict) else params)
+    return f"{urljoin(base_url, LIST_PATH)}?{urlencode(query)}"
+
+
+class ListingParser:
+    """Parses `tr.devloopArea` job rows out of `_GI_List` listing HTML."""
+
+    # Compiled once at import; every parse reuses the same XPath objects.
+    _rows = etree.XPath(
+        '//tr[contains(@class, "devloopArea") and .//th[@scope="row"]//input[@type="checkbox"]]')
+    _link = etree.XPath('(.//a[contains(@href, "GI_Read")])[1]/@href')
+    _title = etree.XPath('(.//a[contains(@class, "link normalLog") and contains(@href, "GI_Read")])[1]/@title')
+    _company = etree.XPath('(.//a[contains(@href, "Co_Read")])[1]')
+    _details = etree.XPath('.//p[@class="etc"]/span[@class="cell"]')
+    _contact = etree.XPath('boolean(.//button[contains(@class, "tplBtn_1")])')
+    _registered = etree.XPath('string((.//span[contains(@class, "time")])[1])')
+    _pages = etree.XPath('//*[contains(@class, "tplPagination")]//a[contains(@href, "_GI_List?Page=")]/@href')
+
+    def __init__(self, base_url=BASE_URL):
+        self.base_url = base_url
+
+    def parse(self, source):
+        """Return one record per listing row: id, title, company, details, details_url, has_contact, registered."""
+        if not source or not source.strip():
+            return []
+        tree = html.fromstring(source)
+        records = []
+        for row in self._rows(tree):
+            hrefs = self._link(row)
+            if not hrefs:
+                continue
+            href = hrefs[0]
+            try:
+                post_id = href.split('GI_Read/')[1].split('?')[0]
+            except IndexError:
+                continue
+            titles = self._title(row)
+            companies = self._company(row)
+            records.append({
+                'id': post_id,
+                'title': titles[0].strip() if titles else "",
+                'company': companies[0].text_content().strip() if companies else "",
+                'details': [cell.text_content().strip() for cell in self._details(row)],
+                'details_url': urljoin(self.base_url, href),
+                'has_contact': bool(self._contact(row)),
+                'registered': self._registered(row).strip(),
+            })
+        return records
+
+    def total_pages(self, source, current_page=1):
+        """Return the highest page number linked from the pagination block."""
+        if not source or not source.strip():
+            return current_page
+        page_numbers = []
+        for href in self._pages(html.fromstring(source)):
+            try:
+                page_numbers.append(int(href.split('_GI_List?Page=')[1].split('&')[0]))
+            except ValueError:
+                continue
+        return max(page_numbers + [current_page])
+
+
+class ListingFetcher:
+    """Fetches listing pages over a pooled HTTP session using the saved login cookies."""
+
+    def __init__(self, config_path='config.ini', session_file='session.json'):
+        self.config = configparser.ConfigParser()
+        self.config.read(config_path)
+        self.base_url = self.config.get('web', 'base_url', fallback=BASE_URL)
+        self.session_file = Path(session_file)
+        self.parser = ListingParser(self.base_url)
+        self.logger = logging.getLogger(__name__)
+
+        pool_size = self.config.getint('crawling', 'http_pool_size', fallback=4)
+        retries = Retry(total=2, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Referer': f"{self.base_url}/recruit/joblist?menucode=local&localorder=1",
+            'X-Requested-With': 'XMLHttpRequest',
+        })
+        self.load_cookies()
+        recorder = get_recorder(self.config)
+        if recorder is not None:
+            self.session.hooks['response'].append(recorder.response_hook)
+        # Detail and company pages are answered from disk or revalidated when [cache] is enabled;
+        # not while recording, since disk hits and 304s would leave those pages out of the archive
+        self.cache = PageCache.from_config(self.config) if recorder is None else None
+
+    def load_cookies(self, cookies=None):
+        """Load cookies from a Selenium cookie list, or from session.json when none are given."""
+        if cookies is None:
+            if not self.session_file.exists():
+                self.logger.warning("No session.json found, listing requests will be anonymous")
+                return False
+            try:
+                with open(self.session_file, 'r') as f:
+                    cookies = json.load(f)
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Failed to read session cookies: {e}")
+                return False
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        self.logger.info(f"Loaded {len(cookies)} cookies into listing session")
+        return True
+
+    def fetch_page(self, page, params=None, timeout=15):
+        """Return the raw `_GI_List` HTML for a page."""
+        query = [('Page', page)]
+        if params:
+            query.extend(params.items() if isinstance(params, dict) else params)
+        response = self.session.get(urljoin(self.base_url, LIST_PATH), params=query, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
+    def fetch_url(self, url, timeout=15):
+        """Return the HTML of any page (e.g. a `GI_Read` details page) through the same session."""
+        url = urljoin(self.base_url, url)
+        if self.cache is not None:
+            return self.cache.fetch(self.session, url, timeout)
+        response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
+    def fetch_posts(self, page, params=None):
+        """Fetch and parse one listing page; returns (records, total_pages)."""
+        source = self.fetch_page(page, params)
+        records = self.parser.parse(source)
+        total_pages = self.parser.total_pages(source, page)
+        self.logger.info(f"Fetched listing page {page} over HTTP: {len(records)} posts, {total_pages} pages")
+        return records, total_pages
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
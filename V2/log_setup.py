@@ -0,0 +1,160 @@
+import atexit
+import configparser
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_listener = None
+_listener_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, thread (and process outside the main one), message."""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.processName != 'MainProcess':
+            entry['process'] = record.processName
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _gzip_rotator(source, dest):
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def _file_handler(config):
+    handler = logging.handlers.RotatingFileHandler(
+        config.get('logging', 'file', fallback='crawler.log'),
+        maxBytes=config.getint('logging', 'max_mb', fallback=10) * 1024 * 1024,
+        backupCount=config.getint('logging', 'backups', fallback=5),
+        encoding='utf-8'
+    )
+    if config.getboolean('logging', 'compress', fallback=True):
+        # Rotated files become crawler.log.1.gz, ...; compression runs on the listener thread
+        handler.namer = lambda name: name + '.gz'
+        handler.rotator = _gzip_rotator
+    if config.getboolean('logging', 'json', fallback=True):
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    return handler
+
+
+def _apply_levels(config):
+    """Root level from [logging] `level`; per-subsystem levels (logger name = level) from [log_levels]."""
+    logging.getLogger().setLevel(config.get('logging', 'level', fallback='INFO').upper())
+    if config.has_section('log_levels'):
+        for name, level in config.items('log_levels'):
+            logging.getLogger(name).setLevel(level.upper())
+
+
+def _install_queue_handler(log_queue):
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def setup_logging(config_path='config.ini', log_queue=None):
+    """Route every logger through a `QueueHandler` so callers never block on file or console writes.
+
+    In the main process a background `QueueListener` writes JSON lines to a rotating,
+    gzip-compressed log file (and plain text to the console). A shard worker passes the
+    coordinator's `log_queue` instead and only enqueues; see `forward_logs`. Safe to call twice.
+    """
+    global _listener
+    config = configparser.ConfigParser()
+    config.optionxform = str  # Logger names are case-sensitive
+    config.read(config_path)
+    _apply_levels(config)
+    if log_queue is not None:
+        _install_queue_handler(log_queue)
+        return
+    with _listener_lock:
+        if _listener is not None:
+            return
+        handlers = [_file_handler(config)]
+        if config.getboolean('logging', 'console', fallback=True):
+            console = logging.StreamHandler()
+            console.setFormatter(logging.Formatter(TEXT_FORMAT))
+            handlers.append(console)
+        log_queue = queue.SimpleQueue()
+        _install_queue_handler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+
+class CallbackHandler(logging.Handler):
+    """Hands each record, formatted with `TEXT_FORMAT`, to a callback such as a GUI log view."""
+
+    def __init__(self, callback, level=logging.NOTSET):
+        super().__init__(level)
+        self.callback = callback
+        self.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    def emit(self, record):
+        try:
+            self.callback(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def add_handler(handler):
+    """Send every record to `handler` too: on the listener thread once `setup_logging` ran, else from the root logger."""
+    with _listener_lock:
+        if _listener is not None:
+            _listener.handlers = _listener.handlers + (handler,)
+            return
+    logging.getLogger().addHandler(handler)
+
+
+def remove_handler(handler):
+    """Undo `add_handler`."""
+    with _listener_lock:
+        if _listener is not None and handler in _listener.handlers:
+            _listener.handlers = tuple(h for h in _listener.handlers if h is not handler)
+            return
+    logging.getLogger().removeHandler(handler)
+
+
+class _Forward(logging.Handler):
+    """Re-emits a record from another process through this process's loggers."""
+
+    def emit(self, record):
+        logging.getLogger(record.name).handle(record)
+
+
+def forward_logs(log_queue):
+    """Started listener that moves worker-process records from `log_queue` into this process's logging."""
+    listener = logging.handlers.QueueListener(log_queue, _Forward())
+    listener.start()
+    return listener
@@ -0,0 +1,199 @@
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Histogram buckets in seconds, from a parsed row up to a slow page load
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _label_text(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels) + '}'
+
+
+class _Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # Last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+
+
+class Timer:
+    """A started span; `stop()` records it (once) and returns the elapsed seconds."""
+
+    def __init__(self, metrics, name, labels):
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+        self._started = time.perf_counter()
+        self.elapsed = None
+
+    def stop(self, error=False):
+        if self.elapsed is None:
+            self.elapsed = time.perf_counter() - self._started
+            self._metrics.observe_span(self._name, self.elapsed, error, **self._labels)
+        return self.elapsed
+
+
+class Metrics:
+    """Counters and latency histograms for crawl stages, rendered in Prometheus text format or as JSON."""
+
+    def __init__(self, prefix='crawler'):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters = {}  # (name, labels) -> value
+        self._histograms = {}  # (span, labels) -> _Histogram
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe_span(self, name, seconds, error=False, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._histograms.setdefault(key, _Histogram()).observe(seconds)
+        if error:
+            self.inc('span_errors_total', span=name, **labels)
+
+    def timer(self, name, **labels):
+        """Start a span that is recorded when its `stop()` is called."""
+        return Timer(self, name, labels)
+
+    @contextmanager
+    def span(self, name, **labels):
+        """Time a block as a span; an exception counts as a span error and propagates."""
+        timer = self.timer(name, **labels)
+        try:
+            yield timer
+        except BaseException:
+            timer.stop(error=True)
+            raise
+        timer.stop()
+
+    def render_prometheus(self):
+        """Prometheus text exposition of every counter and span histogram."""
+        lines = []
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (list(h.counts), h.total, h.count) for key, h in self._histograms.items()}
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {self.prefix}_{name} counter")
+            for (counter, labels), value in sorted(counters.items()):
+                if counter == name:
+                    lines.append(f"{self.prefix}_{name}{_label_text(labels)} {value}")
+        metric = f"{self.prefix}_span_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        for (span, labels), (counts, total, count) in sorted(histograms.items()):
+            base = (('span', span),) + labels
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS + ('+Inf',), counts):
+                cumulative += bucket
+                lines.append(f"{metric}_bucket{_label_text(base + (('le', bound),))} {cumulative}")
+            lines.append(f"{metric}_sum{_label_text(base)} {total:.6f}")
+            lines.append(f"{metric}_count{_label_text(base)} {count}")
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self):
+        """Counters and per-span count/total/mean seconds as plain data for the JSON dump."""
+        with self._lock:
+            counters = {name + _label_text(labels): value for (name, labels), value in self._counters.items()}
+            spans = {span + _label_text(labels): {'count': h.count, 'total_s': round(h.total, 6),
+                                                 'mean_s': round(h.total / h.count, 6) if h.count else 0}
+                     for (span, labels), h in self._histograms.items()}
+        return {'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'counters': counters, 'spans': spans}
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        metrics = self.server.metrics
+        if self.path.startswith('/metrics.json'):
+            body, content_type = json.dumps(metrics.snapshot()).encode('utf-8'), 'application/json'
+        elif self.path.startswith('/metrics'):
+            body, content_type = metrics.render_prometheus().encode('utf-8'), 'text/plain; version=0.0.4'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MetricsExporter:
+    """Serves `/metrics` (Prometheus) and `/metrics.json` on localhost and dumps JSON snapshots periodically."""
+
+    def __init__(self, metrics, port=0, dump_file='', dump_interval=60, host='127.0.0.1'):
+        self.metrics = metrics
+        self.dump_file = dump_file
+        self.dump_interval = dump_interval
+        self.logger = logging.getLogger(__name__)
+        self._stop_event = threading.Event()
+        self.server = None
+        if port:
+            self.server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            self.server.daemon_threads = True
+            self.server.metrics = metrics
+            threading.Thread(target=self.server.serve_forever, name='metrics-http', daemon=True).start()
+            self.logger.info(f"Metrics endpoint on http://{host}:{port}/metrics")
+        if dump_file:
+            threading.Thread(target=self._dump_loop, name='metrics-dump', daemon=True).start()
+
+    def _dump_loop(self):
+        while not self._stop_event.wait(self.dump_interval):
+            self.dump()
+
+    def dump(self):
+        """Write the current snapshot to `dump_file`."""
+        try:
+            with open(self.dump_file, 'w', encoding='utf-8') as f:
+                json.dump(self.metrics.snapshot(), f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            self.logger.error(f"Failed to dump metrics: {e}")
+
+    def close(self):
+        self._stop_event.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        if self.dump_file:
+            self.dump()
+
+
+_metrics = Metrics()
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+def get_metrics(config=None):
+    """The process-wide metrics registry; the first call with a config starts its [metrics] exporter."""
+    global _exporter
+    if config is not None and config.getboolean('metrics', 'enabled', fallback=False):
+        with _exporter_lock:
+            if _exporter is None:
+                try:
+                    _exporter = MetricsExporter(_metrics,
+                                                config.getint('metrics', 'port', fallback=9108),
+                                                config.get('metrics', 'dump_file', fallback='metrics.json'),
+                                                config.getint('metrics', 'dump_interval', fallback=60))
+                except OSError as e:
+                    logging.getLogger(__name__).error(f"Failed to start metrics exporter: {e}")
+    return _metrics
@@ -0,0 +1,217 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:  # Bodies fall back to zlib without the zstandard package
+    zstandard = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    encoding TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    url_class TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+"""
+
+# URL class -> substring that identifies it; checked in order
+URL_CLASSES = (
+    ('detail', 'GI_Read'),
+    ('company', 'Co_Read'),
+    ('listing', '_GI_List'),
+)
+DEFAULT_TTLS = {'detail': 3600, 'company': 7 * 86400, 'listing': 0, 'other': 0}
+# Markup a page of a class must contain to be cached: the recruitment block of a detail page, the rows of a listing
+EXPECTED_MARKERS = {'detail': b'tbRow', 'listing': b'devloopArea'}
+# Login form fields; a page showing them is a login wall, whatever its status
+LOGIN_MARKERS = (b'M_PWD', b'M_ID')
+
+
+def url_class(url):
+    """Cache class of a URL: `detail`, `company`, `listing` or `other`."""
+    for name, marker in URL_CLASSES:
+        if marker in url:
+            return name
+    return 'other'
+
+
+class PageCache:
+    """Content-addressed on-disk HTTP cache with ETag/Last-Modified revalidation, per-class TTLs and LRU eviction.
+
+    The index (URL -> body digest, validators, timestamps) lives in SQLite; bodies are
+    stored once per SHA-256 under `objects/`, compressed with zstd (zlib without it).
+    A class with a TTL of 0 is always revalidated; one below 0 is never cached.
+    """
+
+    def __init__(self, directory='cache', max_bytes=200 * 1024 * 1024, ttls=None):
+        self.directory = Path(directory)
+        self.objects = self.directory / 'objects'
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.codec = 'zstd' if zstandard is not None else 'zlib'
+        self.logger = logging.getLogger(__name__)
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'rejected': 0}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.directory / 'index.db'), check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config):
+        """The cache configured in [cache], or None when it is disabled."""
+        if not config.getboolean('cache', 'enabled', fallback=False):
+            return None
+        ttls = {name: config.getint('cache', f'ttl_{name}', fallback=default) for name, default in DEFAULT_TTLS.items()}
+        return cls(config.get('cache', 'directory', fallback='cache'),
+                   config.getint('cache', 'max_mb', fallback=200) * 1024 * 1024,
+                   ttls)
+
+    def _blob_path(self, digest):
+        return self.objects / digest[:2] / digest
+
+    def _compress(self, body):
+        if self.codec == 'zstd':
+            return zstandard.ZstdCompressor(level=3).compress(body)
+        return zlib.compress(body, 6)
+
+    @staticmethod
+    def _decompress(codec, data):
+        if codec == 'zstd':
+            if zstandard is None:
+                raise ValueError("zstandard is needed to read this cache entry")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def _lookup(self, url):
+        with self._lock:
+            row = self._db.execute('SELECT digest, codec, encoding, etag, last_modified, fetched FROM entries '
+                                   'WHERE url = ?', (url,)).fetchone()
+        if row is None:
+            return None
+        digest, codec, encoding, etag, last_modified, fetched = row
+        try:
+            body = self._decompress(codec, self._blob_path(digest).read_bytes())
+        except (OSError, ValueError, zlib.error) as e:
+            self.logger.warning(f"Dropping unreadable cache entry for {url}: {e}")
+            self._forget(url)
+            return None
+        return {'body': body, 'encoding': encoding, 'etag': etag, 'last_modified': last_modified, 'fetched': fetched}
+
+    def _forget(self, url):
+        with self._lock:
+            self._db.execute('DELETE FROM entries WHERE url = ?', (url,))
+
+    def _touch(self, url, revalidated=False):
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self._db.execute('UPDATE entries SET fetched = ?, accessed = ? WHERE url = ?', (now, now, url))
+            else:
+                self._db.execute('UPDATE entries SET accessed = ? WHERE url = ?', (now, url))
+
+    def _count(self, stat):
+        with self._lock:  # Detail workers fetch through one cache concurrently
+            self.stats[stat] += 1
+
+    @staticmethod
+    def cacheable(url, body):
+        """False for a body that is not the page its URL asks for: a login wall or error page served with 200."""
+        if any(marker in body for marker in LOGIN_MARKERS):
+            return False
+        marker = EXPECTED_MARKERS.get(url_class(url))
+        return marker is None or marker in body
+
+    def _store(self, url, body, encoding, etag, last_modified):
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            # Identical bodies (e.g. the same company page under two URLs) share one blob
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            tmp_path.write_bytes(self._compress(body))
+            os.replace(tmp_path, path)
+        size = path.stat().st_size
+        now = time.time()
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                             (url, digest, self.codec, encoding, etag, last_modified, url_class(url), size, now, now))
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries, and blobs no entry points to, until the cache fits `max_bytes`."""
+        with self._lock:
+            total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM '
+                                     '(SELECT DISTINCT digest, size FROM entries)').fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            rows = self._db.execute('SELECT url, digest FROM entries ORDER BY accessed').fetchall()
+            removed = []
+            for url, digest in rows:
+                if total <= self.max_bytes:
+                    break
+                self._db.execute('DELETE FROM entries WHERE url = ?', (url,))
+                still_used = self._db.execute('SELECT 1 FROM entries WHERE digest = ? LIMIT 1', (digest,)).fetchone()
+                if not still_used:
+                    path = self._blob_path(digest)
+                    try:
+                        total -= path.stat().st_size
+                        path.unlink()
+                    except OSError:
+                        pass
+                removed.append(url)
+        self.logger.info(f"Page cache evicted {len(removed)} entries")
+
+    def fetch(self, session, url, timeout=15):
+        """GET a URL through `session`, answering from disk while fresh and revalidating with 304s after that."""
+        ttl = self.ttls.get(url_class(url), 0)
+        if ttl < 0:
+            response = session.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.text
+        entry = self._lookup(url)
+        headers = {}
+        if entry is not None:
+            if time.time() - entry['fetched'] < ttl:
+                self._count('hits')
+                self._touch(url)
+                return entry['body'].decode(entry['encoding'] or 'utf-8', errors='replace')
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            self._count('revalidated')
+            self._touch(url, revalidated=True)
+            return entry['body'].decode(entry['encoding'] or 'utf-8', errors='replace')
+        response.raise_for_status()
+        self._count('misses')
+        if not self.cacheable(url, response.content):
+            self._count('rejected')
+            self.logger.warning(f"Not caching {url}: the page lacks the expected markup or shows a login form")
+            return response.text
+        self._store(url, response.content, response.encoding,
+                    response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response.text
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+        self.logger.info(f"Page cache closed: {self.stats['hits']} hits, {self.stats['revalidated']} revalidated, "
+                         f"{self.stats['misses']} misses, {self.stats['rejected']} not cached")
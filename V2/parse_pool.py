@@ -0,0 +1,108 @@
+import configparser
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from log_setup import forward_logs, setup_logging
+
+
+class ParsePool:
+    """Parses captured page HTML on worker processes so the browser stage can move on to the next post.
+
+    At most `max_pending` pages are queued or being parsed at once; `submit` blocks
+    beyond that, which keeps a catch-up crawl from piling up page sources in memory.
+    A page not parsed within `timeout` seconds, or any page once the pool is broken
+    (a worker died or could not start), is parsed on the calling thread instead.
+    """
+
+    def __init__(self, processes, max_pending=32, config_path='config.ini', timeout=30):
+        self.logger = logging.getLogger(__name__)
+        # Spawn everywhere, as for the shard workers: forking a process with Qt/Chrome threads is unsafe
+        context = multiprocessing.get_context('spawn')
+        self._log_queue = context.Queue()
+        self._log_listener = forward_logs(self._log_queue)
+        self.executor = ProcessPoolExecutor(max_workers=processes, mp_context=context, initializer=setup_logging,
+                                            initargs=(config_path, self._log_queue))
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self.timeout = timeout
+        self.broken = False
+        self.logger.info(f"Parse pool ready ({processes} processes, {max_pending} pages in flight)")
+
+    @classmethod
+    def from_config(cls, config_path='config.ini'):
+        """The pool configured in [parse], or None when `processes` is 0 (parse on the calling thread)."""
+        config = configparser.ConfigParser()
+        config.read(config_path)
+        processes = config.getint('parse', 'processes', fallback=0)
+        if processes < 0:
+            processes = max(1, (os.cpu_count() or 2) - 1)  # -1: every core but the one driving the browser
+        if processes == 0:
+            return None
+        return cls(processes, config.getint('parse', 'max_pending', fallback=32), config_path,
+                   config.getfloat('parse', 'timeout', fallback=30))
+
+    def submit(self, func, *args):
+        """Queue `func(*args)` on a worker process and return its future; blocks while the pool is full.
+
+        Raises `BrokenProcessPool` once the pool is broken; the caller parses inline.
+        """
+        if self.broken:
+            raise BrokenProcessPool("Parse pool is broken")
+        self._slots.acquire()
+        try:
+            future = self.executor.submit(func, *args)
+        except Exception as e:
+            self._slots.release()
+            if isinstance(e, BrokenProcessPool):
+                self.mark_broken(e)
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        future.inline = lambda: func(*args)
+        return future
+
+    def result(self, future):
+        """Result of a `submit` future, parsed inline when the pool breaks or the worker takes longer than `timeout`."""
+        try:
+            return future.result(timeout=self.timeout)
+        except BrokenProcessPool as e:
+            self.mark_broken(e)
+        except FutureTimeoutError:
+            future.cancel()
+            self.logger.warning(f"Parse took over {self.timeout:.0f}s on the pool, parsing inline")
+        return future.inline()
+
+    def mark_broken(self, error):
+        """Stop using the worker processes; every later page is parsed inline."""
+        if not self.broken:
+            self.broken = True
+            self.logger.error(f"Parse pool is broken, parsing inline from now on: {error}")
+
+    def close(self):
+        """Drop queued pages, wait for the ones being parsed and stop the workers."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self._log_listener.stop()
+        self.logger.info("Parse pool closed")
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_parse_pool(config_path='config.ini'):
+    """The process-wide parse pool for a config file, or None when parsing stays inline."""
+    with _pools_lock:
+        if config_path not in _pools:
+            _pools[config_path] = ParsePool.from_config(config_path)
+        return _pools[config_path]
+
+
+def close_parse_pool(config_path='config.ini'):
+    """Close the process-wide parse pool of a config file if one was started; never starts one."""
+    with _pools_lock:
+        pool = _pools.pop(config_path, None)
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,52 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every worker that hits the same host."""
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)  # Tokens added per second
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, section='crawling'):
+        """Build a bucket from `detail_rate_per_minute` / `detail_burst` in config.ini."""
+        per_minute = config.getfloat(section, 'detail_rate_per_minute', fallback=6)
+        burst = config.getint(section, 'detail_burst', fallback=1)
+        return cls(per_minute / 60.0, burst)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens=1):
+        """Take tokens without waiting; returns False when the bucket is short."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1, stop_event=None):
+        """Block until tokens are available; returns False if stop_event is set first."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            # Wake up in small increments so a stop request is honoured promptly
+            if stop_event is not None:
+                if stop_event.wait(min(wait, 0.1)):
+                    return False
+            else:
+                time.sleep(min(wait, 0.1))
@@ -0,0 +1,302 @@
+"""Record JobKorea responses to an archive and replay them from a local stand-in server.
+
+    python replay.py serve recordings.zip --port 8765 --latency-ms 80 --error-rate 0.02
+
+Recording is switched on with [replay] `record` in config.ini; pointing [web] `base_url`
+(and `url`) at the server makes the crawler run against the archive instead of the live site.
+"""
+import argparse
+import atexit
+import configparser
+import json
+import logging
+import multiprocessing
+import random
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from log_setup import setup_logging
+
+LIVE_ORIGIN = 'https://www.jobkorea.co.kr'
+LOGOUT_TEXT = '로그아웃'
+SESSION_COOKIE = 'replay_session'
+# Response headers kept in recordings, by lower-case name
+_KEPT_HEADERS = {'content-type': 'Content-Type', 'etag': 'ETag', 'last-modified': 'Last-Modified', 'location': 'Location'}
+
+# Stand-in login and home pages with the elements `AuthManager` waits for
+_LOGIN_PAGE = """<html><body>
+<ul><li data-tab="tab1"><a data-m-type="M" href="#">개인회원</a></li></ul>
+<form method="post" action="/Login/Login_Tot.asp">
+<input id="M_ID" name="M_ID"><input id="M_PWD" name="M_PWD" type="password">
+<button class="login-button" type="submit">로그인</button>
+</form></body></html>"""
+_HOME_PAGE = f"""<html><body><a href="/Login/Logout.asp">{LOGOUT_TEXT}</a></body></html>"""
+
+
+def request_key(method, url, body=b''):
+    """Match key for a request: method, path and sorted query, plus the sorted form body for POSTs."""
+    parts = urlsplit(url)
+    key = f"{method.upper()} {parts.path}"
+    query = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    if query:
+        key += f"?{urlencode(query)}"
+    if body:
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        form = sorted(parse_qsl(body.decode('utf-8', errors='replace'), keep_blank_values=True))
+        key += f" {urlencode(form)}"
+    return key
+
+
+def path_key(method, url):
+    """Looser match key: method and path only."""
+    return f"{method.upper()} {urlsplit(url).path}"
+
+
+class Recorder:
+    """Appends responses to a zip archive: `responses/<n>.json` metadata next to `responses/<n>.body`.
+
+    The archive stays open while recording; `close()` (run at exit) writes its central directory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._archive = zipfile.ZipFile(self.path, 'a', compression=zipfile.ZIP_DEFLATED)
+        self._count = sum(1 for name in self._archive.namelist() if name.endswith('.json'))
+
+    def add(self, method, url, status, headers, body, request_body=b''):
+        """Store one exchange; `headers` keeps only what replay needs."""
+        meta = {
+            'key': request_key(method, url, request_body),
+            'method': method.upper(),
+            'url': url,
+            'status': status,
+            'headers': {_KEPT_HEADERS[k.lower()]: v for k, v in headers.items() if k.lower() in _KEPT_HEADERS},
+            'recorded': time.time(),
+        }
+        with self._lock:
+            if self._archive is None:
+                return
+            name = f"responses/{self._count:06d}"
+            self._count += 1
+            self._archive.writestr(f"{name}.json", json.dumps(meta, ensure_ascii=False))
+            self._archive.writestr(f"{name}.body", body)
+
+    def response_hook(self, response, *args, **kwargs):
+        """`requests` response hook: record every exchange of a session except 304 revalidations.
+
+        A 304 has no body; stored under the page's key it would replace the recorded 200.
+        """
+        if response.status_code == 304:
+            return response
+        try:
+            self.add(response.request.method, response.url, response.status_code, response.headers,
+                     response.content, response.request.body or b'')
+        except Exception as e:
+            self.logger.error(f"Failed to record {response.url}: {e}")
+        return response
+
+    def add_page(self, url, source, method='GET', request_body=b''):
+        """Record a page the browser rendered (login, home, detail page) as a 200 HTML response."""
+        self.add(method, url, 200, {'Content-Type': 'text/html; charset=utf-8'}, source.encode('utf-8'),
+                 request_body)
+
+    def close(self):
+        with self._lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+                self.logger.info(f"Recorded {self._count} responses to {self.path}")
+
+
+_recorders = {}
+_recorders_lock = threading.Lock()
+
+
+def get_recorder(config):
+    """The process-wide recorder for [replay] `record`, or None when recording is off.
+
+    Only the main process records: shard workers appending to the same zip would corrupt it.
+    """
+    path = config.get('replay', 'record', fallback='')
+    if not path:
+        return None
+    if multiprocessing.parent_process() is not None:
+        logging.getLogger(__name__).warning(
+            f"Not recording in {multiprocessing.current_process().name}: only the main process writes {path}")
+        return None
+    with _recorders_lock:
+        if path not in _recorders:
+            _recorders[path] = Recorder(path)
+            atexit.register(_recorders[path].close)
+        return _recorders[path]
+
+
+class Archive:
+    """Recorded exchanges indexed by request key; the newest recording of a key wins."""
+
+    def __init__(self, path):
+        self.logger = logging.getLogger(__name__)
+        self.exchanges = {}
+        self.by_path = {}  # Path -> request keys recorded under it
+        with zipfile.ZipFile(path) as archive:
+            for name in sorted(archive.namelist()):
+                if not name.endswith('.json'):
+                    continue
+                meta = json.loads(archive.read(name))
+                meta['body'] = archive.read(name[:-5] + '.body')
+                self.exchanges[meta['key']] = meta
+                self.by_path.setdefault(path_key(meta['method'], meta['url']), set()).add(meta['key'])
+
+    def find(self, method, url, body=b''):
+        """The recording of a request, or None.
+
+        A request whose query or form differs from every recording (e.g. a cache-busting parameter)
+        falls back to its path only when exactly one request was recorded under that path, so an
+        unrecorded listing page is a miss rather than some other page.
+        """
+        key = request_key(method, url, body)
+        meta = self.exchanges.get(key)
+        if meta is None:
+            keys = self.by_path.get(path_key(method, url), ())
+            if len(keys) == 1:
+                meta = self.exchanges[next(iter(keys))]
+                self.logger.warning(f"Replay: {key} not recorded, serving the only recording of its path: {meta['key']}")
+        return meta
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Local JobKorea stand-in serving an `Archive`, with injected latency and errors."""
+
+    daemon_threads = True
+
+    def __init__(self, archive, host='127.0.0.1', port=8765, latency_ms=0, jitter_ms=0, error_rate=0.0,
+                 seed=None):
+        self.archive = archive
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.logger = logging.getLogger(__name__)
+        self.stats = {'served': 0, 'missing': 0, 'errors': 0}
+        super().__init__((host, port), _ReplayHandler)
+        self.origin = f"http://{host}:{self.server_address[1]}"
+
+    @classmethod
+    def from_config(cls, archive_path, config):
+        return cls(Archive(archive_path),
+                   config.get('replay', 'host', fallback='127.0.0.1'),
+                   config.getint('replay', 'port', fallback=8765),
+                   config.getint('replay', 'latency_ms', fallback=0),
+                   config.getint('replay', 'jitter_ms', fallback=0),
+                   config.getfloat('replay', 'error_rate', fallback=0.0))
+
+    def start_background(self):
+        """Serve on a daemon thread (for benchmarks and smoke scripts); returns the thread."""
+        thread = threading.Thread(target=self.serve_forever, name='replay-server', daemon=True)
+        thread.start()
+        return thread
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        self.server.logger.debug(f"Replay: {format % args}")
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        delay = server.latency_ms + server.random.uniform(0, server.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+        if server.error_rate and server.random.random() < server.error_rate:
+            server.stats['errors'] += 1
+            self._send(503, b'Injected error')
+            return
+
+        path = urlsplit(self.path).path
+        if path.startswith('/Login/'):
+            # Login stand-in: any credentials work and get a session cookie
+            if self.command == 'POST':
+                self._send(302, b'', headers={'Location': '/', 'Set-Cookie': f'{SESSION_COOKIE}=1; Path=/'})
+            else:
+                self._send(200, _LOGIN_PAGE.encode('utf-8'))
+            return
+
+        meta = server.archive.find(self.command, self.path, body)
+        if meta is None:
+            if path == '/':
+                self._send(200, _HOME_PAGE.encode('utf-8'))
+                return
+            server.stats['missing'] += 1
+            server.logger.warning(f"Replay: no recording for {self.command} {self.path}")
+            self._send(404, b'Not recorded')
+            return
+
+        server.stats['served'] += 1
+        payload = meta['body']
+        content_type = meta['headers'].get('Content-Type', 'text/html; charset=utf-8')
+        if 'html' in content_type or 'json' in content_type:
+            # Absolute links in recorded pages point back at this server
+            payload = payload.replace(LIVE_ORIGIN.encode(), server.origin.encode())
+        extra = {k: v for k, v in meta['headers'].items() if k in ('ETag', 'Last-Modified')}
+        if extra.get('ETag') and self.headers.get('If-None-Match') == extra['ETag']:
+            self._send(304, b'', content_type, extra)
+            return
+        self._send(meta['status'], payload, content_type, extra)
+
+    do_GET = do_POST = do_HEAD = _handle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded JobKorea responses from a local server.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    serve = sub.add_parser('serve', help="Serve an archive")
+    serve.add_argument('archive')
+    serve.add_argument('--config', default='config.ini')
+    serve.add_argument('--host')
+    serve.add_argument('--port', type=int)
+    serve.add_argument('--latency-ms', type=int)
+    serve.add_argument('--jitter-ms', type=int)
+    serve.add_argument('--error-rate', type=float)
+    args = parser.parse_args()
+
+    setup_logging(args.config)
+    config = configparser.ConfigParser()
+    config.read(args.config)
+    if not config.has_section('replay'):
+        config.add_section('replay')
+    for option in ('host', 'port', 'latency_ms', 'jitter_ms', 'error_rate'):
+        value = getattr(args, option)
+        if value is not None:
+            config.set('replay', option, str(value))
+    server = ReplayServer.from_config(args.archive, config)
+    server.logger.info(f"Replaying {len(server.archive.exchanges)} recorded responses on {server.origin}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.logger.info(f"Replay stats: {server.stats}")
+
+
+if __name__ == '__main__':
+    main()
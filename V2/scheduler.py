@@ -0,0 +1,73 @@
+import logging
+import threading
+import time
+from collections import deque
+
+
+class AdaptiveScheduler:
+    """Chooses each search's next refresh interval from the observed arrival rate of new posts.
+
+    While posts are flowing the interval is the time expected for `target_posts` new posts
+    to arrive; every cycle that finds nothing multiplies it by `backoff`. The result is
+    always clamped to [min_interval, max_interval].
+    """
+
+    def __init__(self, min_interval=30, max_interval=1800, target_posts=1.0, backoff=2.0, window=20):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.target_posts = target_posts
+        self.backoff = backoff
+        self.logger = logging.getLogger(__name__)
+        self._history = {}  # search key -> deque of (timestamp, new posts) per cycle
+        self._window = window
+        self._intervals = {}
+        self._empty_streak = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a scheduler from the [scheduler] section, defaulting to `refresh_interval` as the floor."""
+        floor = config.getint('web', 'refresh_interval', fallback=300)
+        return cls(
+            min_interval=config.getint('scheduler', 'min_interval', fallback=floor),
+            max_interval=config.getint('scheduler', 'max_interval', fallback=1800),
+            target_posts=config.getfloat('scheduler', 'target_posts', fallback=1.0),
+            backoff=config.getfloat('scheduler', 'backoff', fallback=2.0),
+            window=config.getint('scheduler', 'window', fallback=20),
+        )
+
+    def record(self, search_key, new_posts, now=None):
+        """Log the number of new posts a finished cycle found."""
+        with self._lock:
+            history = self._history.setdefault(search_key, deque(maxlen=self._window))
+            history.append((now if now is not None else time.time(), new_posts))
+            self._empty_streak[search_key] = 0 if new_posts else self._empty_streak.get(search_key, 0) + 1
+
+    def arrival_rate(self, search_key):
+        """New posts per second over the recorded window, or 0.0 before two cycles exist."""
+        history = self._history.get(search_key)
+        if not history or len(history) < 2:
+            return 0.0
+        elapsed = history[-1][0] - history[0][0]
+        if elapsed <= 0:
+            return 0.0
+        # The first cycle's posts arrived before the window opened
+        return sum(count for _, count in list(history)[1:]) / elapsed
+
+    def next_interval(self, search_key):
+        """Seconds to wait before the next cycle of a search."""
+        with self._lock:
+            previous = self._intervals.get(search_key, self.min_interval)
+            streak = self._empty_streak.get(search_key, 0)
+            if streak:
+                interval = previous * self.backoff
+            else:
+                rate = self.arrival_rate(search_key)
+                interval = self.target_posts / rate if rate > 0 else self.min_interval
+            interval = int(min(self.max_interval, max(self.min_interval, interval)))
+            self._intervals[search_key] = interval
+            return interval
+
+    def expected_latency(self, search_key):
+        """Mean delay between a post appearing and the next cycle seeing it (half the interval)."""
+        return self._intervals.get(search_key, self.min_interval) / 2
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import logging
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urljoin
+
+from lxml import etree, html
+
+from listing import BASE_URL, LIST_PATH
+
+SearchCondition = namedtuple('SearchCondition', ['name', 'condition'])
+SearchCondition.__doc__ = """A saved search: a stable name and the `data-value-json` condition dict."""
+
+_condition_cells = etree.XPath('//td[contains(@class, "dev-condition-select")]/@data-value-json')
+
+logger = logging.getLogger(__name__)
+
+
+def condition_key(condition):
+    """Stable short name for a condition, derived from its canonical JSON."""
+    canonical = json.dumps(condition, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:10]
+
+
+def load_conditions(path):
+    """Load saved searches from a JSON file or from a saved `devSearchedTermsLayer.html`.
+
+    The JSON file holds a list of `{"name": ..., "condition": {...}}` objects; the HTML
+    layer yields one condition per `td.dev-condition-select` row, named by its hash.
+    """
+    path = Path(path)
+    if not path.exists():
+        logger.warning(f"Search conditions file not found: {path}")
+        return []
+    text = path.read_text(encoding='utf-8')
+    if path.suffix.lower() in ('.html', '.htm'):
+        conditions = [json.loads(value) for value in _condition_cells(html.fromstring(text))]
+        return [SearchCondition(condition_key(c), c) for c in conditions]
+    return [SearchCondition(item.get('name') or condition_key(item['condition']), item['condition'])
+            for item in json.loads(text)]
+
+
+def select_condition(config):
+    """The saved search named by `condition` in [search] (the first one when unset), or None."""
+    conditions = load_conditions(config.get('search', 'conditions_file', fallback='search_conditions.json'))
+    name = config.get('search', 'condition', fallback='')
+    for condition in conditions:
+        if not name or condition.name == name:
+            return condition
+    if conditions:
+        logger.warning(f"Search condition '{name}' not found")
+    return None
+
+
+def _flatten(prefix, value):
+    """Serialise nested values the way jQuery's `$.param` does (`a[b]=1`, `a[list][]=x`); nulls are dropped."""
+    if value is None:
+        return []
+    if isinstance(value, bool):
+        return [(prefix, 'true' if value else 'false')]
+    if isinstance(value, dict):
+        pairs = []
+        for key, item in value.items():
+            pairs.extend(_flatten(f"{prefix}[{key}]", item))
+        return pairs
+    if isinstance(value, (list, tuple)):
+        pairs = []
+        for item in value:
+            pairs.extend(_flatten(f"{prefix}[]", item))
+        return pairs
+    return [(prefix, str(value))]
+
+
+@lru_cache(maxsize=256)
+def _compile_condition(canonical):
+    # Cached per canonical condition, shared by every compiler; compiling is pure, so repeated cycles pay nothing
+    return tuple(_flatten('condition', json.loads(canonical)))
+
+
+# Listing controls the browser path applies on top of the saved condition (see `SiteCrawler._navigation_steps`),
+# by [search] key prefix -> step name. A compiled condition must map each one to request parameters or skip it.
+BROWSER_CONTROLS = {
+    'sort': 'sort by registration date',
+    'exclude_viewed': 'exclude viewed posts',
+}
+
+
+class SearchCompiler:
+    """Compiles saved search conditions straight into `_GI_List` request parameters."""
+
+    def __init__(self, base_url=BASE_URL, extra_params=''):
+        self.base_url = base_url
+        # Listing controls outside the condition (sort order, exclude-viewed, ...) as a query string
+        self.extra_params = tuple(parse_qsl(extra_params))
+
+    @classmethod
+    def from_config(cls, config):
+        """Compiler for [search]; raises ValueError for a browser listing control that is neither mapped nor skipped.
+
+        `<control>_params` holds the query string that applies a control of `BROWSER_CONTROLS`, and
+        `skip_controls` lists the controls the compiled listing knowingly goes without.
+        """
+        params = parse_qsl(config.get('search', 'extra_params', fallback=''))
+        skipped = {name.strip() for name in config.get('search', 'skip_controls', fallback='').split(',')}
+        for control, step in BROWSER_CONTROLS.items():
+            mapped = config.get('search', f'{control}_params', fallback='')
+            if mapped.strip():
+                params.extend(parse_qsl(mapped))
+            elif control in skipped:
+                logger.warning(f"Compiled search listing skips the browser's '{step}' step ([search] skip_controls)")
+            else:
+                raise ValueError(f"Cannot compile the browser's '{step}' step: set [search] {control}_params "
+                                 f"to its request parameters, or add '{control}' to [search] skip_controls")
+        return cls(config.get('web', 'base_url', fallback=BASE_URL), urlencode(params))
+
+    def compile(self, condition):
+        """Return the request parameters for a condition as a tuple of (name, value) pairs."""
+        return _compile_condition(json.dumps(condition, sort_keys=True, ensure_ascii=False)) + self.extra_params
+
+    def listing_url(self, condition, page=1):
+        """Full listing URL for one page of a condition."""
+        query = [('Page', page)] + list(self.compile(condition))
+        return f"{urljoin(self.base_url, LIST_PATH)}?{urlencode(query)}"
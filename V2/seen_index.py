@@ -0,0 +1,356 @@
+import bisect
+import configparser
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+
+# Index file: header, then the seen `GI_Read` numbers as sorted native-order (little-endian on x86/ARM) uint32s
+_HEADER = struct.Struct('<4sIQ')  # magic, version, count
+_MAGIC = b'SEEN'
+_VERSION = 1
+# Bloom sidecar: header, then the bit array
+_BLOOM_HEADER = struct.Struct('<4sIQ')  # magic, hash count, bit count
+_BLOOM_MAGIC = b'BLMF'
+_MAX_ID = 0xFFFFFFFF
+
+
+def _bloom_positions(value, hashes, bits):
+    """Bit positions for an ID, by double hashing two 32-bit mixes of it."""
+    h1 = (value * 0x9E3779B1) & 0xFFFFFFFF
+    h2 = (((value ^ (value >> 16)) * 0x85EBCA6B) & 0xFFFFFFFF) | 1
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+
+def _merge(base, added):
+    """Merge the sorted array `base` with the sorted IDs `added`, dropping IDs already in `base`.
+
+    The runs between insertion points are block-copied, so the cost is a memcpy of `base`
+    plus a binary search per added ID rather than a Python step per ID.
+    """
+    if not len(base):
+        return array('I', added)
+    merged = array('I')
+    start = 0
+    with memoryview(base).cast('B') as raw:
+        for value in added:
+            i = bisect.bisect_left(base, value, start)
+            merged.frombytes(raw[start * 4:i * 4])
+            start = i
+            if i < len(base) and base[i] == value:
+                continue  # Already merged (the log outlived a compaction)
+            merged.append(value)
+        merged.frombytes(raw[start * 4:])
+    return merged
+
+
+class SeenIndex:
+    """Persistent set of seen post IDs: a sorted, mmapped uint32 array plus an append log for recent IDs.
+
+    Lookups check the recent IDs, then an optional Bloom filter (a miss there is a definite no),
+    then binary-search the mapped array. `compact()` folds the log into a new array file.
+
+    A read-only view (a shard worker process) holds no file open: it loads a snapshot of the
+    files into memory and reloads it every `refresh_seconds`, picking up IDs other processes
+    added through the writer, and never blocks the writer from replacing the files.
+    """
+
+    def __init__(self, path='seen.idx', bloom=True, bloom_bits_per_id=10, compact_every=5000, readonly=False,
+                 refresh_seconds=30):
+        self.path = path
+        self.log_path = f"{path}.log"
+        self.bloom_path = f"{path}.bloom"
+        self.use_bloom = bloom
+        self.bloom_bits_per_id = bloom_bits_per_id
+        self.compact_every = compact_every
+        # Read-only views (shard worker processes) keep their own additions in memory; one writer owns the files
+        self.readonly = readonly
+        self.refresh_seconds = refresh_seconds
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._recent = set()  # IDs added since the last compaction (also in the log file)
+        self._other = set()  # Non-numeric IDs; kept in memory only
+        self._local = set()  # A read-only view's own additions, kept across refreshes
+        self._refreshed = time.monotonic()
+        self._retry_compact = 0  # Monotonic time before which a failed compaction is not retried
+        self._file = self._map = self._ids = None
+        self._bloom_file = self._bloom_map = self._bloom = None
+        self._bloom_hashes = self._bloom_size = 0
+        self._closed = False
+        self._replay_log()
+        self._open_maps()
+        self._drop_merged()
+        self._log = None if readonly else open(self.log_path, 'ab')
+        self._compact_lock = threading.Lock()  # One compaction at a time
+        self._compact_wanted = threading.Event()
+        self._stopping = False
+        self._compactor = None
+        if not readonly:
+            self._compactor = threading.Thread(target=self._compact_loop, name='seen-compactor', daemon=True)
+            self._compactor.start()
+        self.logger.info(f"Seen index loaded: {len(self)} IDs from {self.path}")
+
+    @classmethod
+    def from_config(cls, config_path='config.ini', readonly=False):
+        config = configparser.ConfigParser()
+        config.read(config_path)
+        return cls(config.get('seen_index', 'path', fallback='seen.idx'),
+                   config.getboolean('seen_index', 'bloom', fallback=True),
+                   config.getint('seen_index', 'bloom_bits_per_id', fallback=10),
+                   config.getint('seen_index', 'compact_every', fallback=5000),
+                   readonly,
+                   config.getint('seen_index', 'refresh_seconds', fallback=30))
+
+    def _load_snapshot(self):
+        """Read-only view: copy the array and Bloom filter into memory and close the files again."""
+        if os.path.exists(self.path) and os.path.getsize(self.path) > _HEADER.size:
+            with open(self.path, 'rb') as f:
+                magic, version, count = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC or version != _VERSION:
+                    raise ValueError(f"{self.path} is not a seen index (version {_VERSION})")
+                ids = array('I')
+                ids.frombytes(f.read(count * 4))
+            self._ids = ids
+        if self.use_bloom and os.path.exists(self.bloom_path) and os.path.getsize(self.bloom_path) > _BLOOM_HEADER.size:
+            with open(self.bloom_path, 'rb') as f:
+                magic, self._bloom_hashes, self._bloom_size = _BLOOM_HEADER.unpack(f.read(_BLOOM_HEADER.size))
+                if magic == _BLOOM_MAGIC:
+                    self._bloom = f.read()
+                else:
+                    self.logger.warning(f"Ignoring unreadable Bloom filter {self.bloom_path}")
+
+    def _open_maps(self):
+        self._ids = ()
+        if self.readonly:
+            self._load_snapshot()
+            return
+        if os.path.exists(self.path) and os.path.getsize(self.path) > _HEADER.size:
+            self._file = open(self.path, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count = _HEADER.unpack_from(self._map)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{self.path} is not a seen index (version {_VERSION})")
+            # Zero-copy view over the mapped file; bisect works on it directly
+            self._ids = memoryview(self._map)[_HEADER.size:_HEADER.size + count * 4].cast('I')
+        if self.use_bloom and os.path.exists(self.bloom_path) and os.path.getsize(self.bloom_path) > _BLOOM_HEADER.size:
+            self._bloom_file = open(self.bloom_path, 'rb')
+            self._bloom_map = mmap.mmap(self._bloom_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self._bloom_hashes, self._bloom_size = _BLOOM_HEADER.unpack_from(self._bloom_map)
+            if magic == _BLOOM_MAGIC:
+                self._bloom = memoryview(self._bloom_map)[_BLOOM_HEADER.size:]
+            else:
+                self.logger.warning(f"Ignoring unreadable Bloom filter {self.bloom_path}")
+
+    def _close_maps(self):
+        # Views must be released before their maps close (and before the files are replaced on Windows)
+        for view in (self._ids, self._bloom):
+            if isinstance(view, memoryview):
+                view.release()
+        for handle in (self._map, self._file, self._bloom_map, self._bloom_file):
+            if handle is not None:
+                handle.close()
+        self._file = self._map = self._bloom_file = self._bloom_map = self._bloom = None
+        self._ids = ()
+
+    def _replay_log(self):
+        if not os.path.exists(self.log_path):
+            return
+        with open(self.log_path, 'rb') as f:
+            data = f.read()
+        usable = len(data) - len(data) % 4  # A torn last write is dropped
+        self._recent.update(array('I', data[:usable]))
+
+    def _drop_merged(self):
+        """Forget log IDs the array already holds, so each ID is counted once.
+
+        A crash between the array replace and the log truncation, or a read-only refresh that
+        replays the log before a compaction lands, leaves the same IDs in both.
+        """
+        self._recent = {value for value in self._recent if not self._in_base(value)}
+
+    def refresh(self):
+        """Read-only view: reload the writer's files, keeping this view's own additions."""
+        with self._lock:
+            # The log before the array: a compaction in between then shows up in the array
+            self._recent = set(self._local)
+            self._replay_log()
+            self._close_maps()
+            self._open_maps()
+            self._drop_merged()
+            self._refreshed = time.monotonic()
+
+    def _maybe_refresh(self):
+        if self.readonly and time.monotonic() - self._refreshed >= self.refresh_seconds:
+            try:
+                self.refresh()
+            except (OSError, ValueError) as e:
+                # Caught mid-replace; the previous snapshot is still complete
+                self.logger.warning(f"Seen index refresh failed, keeping the previous snapshot: {e}")
+                self._refreshed = time.monotonic()
+
+    @staticmethod
+    def _key(post_id):
+        try:
+            value = int(post_id)
+        except (TypeError, ValueError):
+            return None
+        return value if 0 <= value <= _MAX_ID else None
+
+    def _in_base(self, value):
+        if self._bloom is not None:
+            for position in _bloom_positions(value, self._bloom_hashes, self._bloom_size):
+                if not self._bloom[position >> 3] & (1 << (position & 7)):
+                    return False
+        i = bisect.bisect_left(self._ids, value)
+        return i < len(self._ids) and self._ids[i] == value
+
+    def __contains__(self, post_id):
+        value = self._key(post_id)
+        with self._lock:
+            self._maybe_refresh()
+            if value is None:
+                return post_id in self._other
+            return value in self._recent or self._in_base(value)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._ids) + len(self._recent) + len(self._other)
+
+    def add(self, post_id):
+        """Mark an ID seen; returns False when it already was."""
+        value = self._key(post_id)
+        with self._lock:
+            if value is None:
+                if post_id in self._other:
+                    return False
+                self._other.add(post_id)
+                return True
+            if value in self._recent or self._in_base(value):
+                return False
+            self._recent.add(value)
+            if self.readonly:
+                self._local.add(value)
+                return True
+            self._log.write(struct.pack('<I', value))
+            self._log.flush()
+            if len(self._recent) >= self.compact_every and time.monotonic() >= self._retry_compact:
+                self._compact_wanted.set()  # Merged on the compactor thread, off the add path
+            return True
+
+    def update(self, post_ids):
+        for post_id in post_ids:
+            self.add(post_id)
+
+    def _bloom_bytes(self, merged, added):
+        """Bloom filter over `merged`: the current filter plus the bits of `added` while it has room, else rebuilt.
+
+        A rebuilt filter is sized for twice the IDs, so the following compactions only hash their new IDs.
+        """
+        hashes = max(1, round(self.bloom_bits_per_id * 0.693))
+        if (self._bloom is not None and self._bloom_hashes == hashes
+                and len(merged) * self.bloom_bits_per_id <= self._bloom_size):
+            bits, filter_bytes, values = self._bloom_size, bytearray(self._bloom), added
+        else:
+            bits = max(64, 2 * len(merged) * self.bloom_bits_per_id)
+            filter_bytes, values = bytearray((bits + 7) // 8), merged
+        for value in values:
+            for position in _bloom_positions(value, hashes, bits):
+                filter_bytes[position >> 3] |= 1 << (position & 7)
+        return hashes, bits, filter_bytes
+
+    def _compact_loop(self):
+        while True:
+            self._compact_wanted.wait()
+            self._compact_wanted.clear()
+            if self._stopping:
+                return
+            try:
+                self.compact()
+            except Exception as e:
+                self.logger.error(f"Seen index compaction failed: {e}")
+                self._retry_compact = time.monotonic() + 60
+
+    def compact(self):
+        """Merge the recent IDs into a new sorted array file, update the Bloom filter and truncate the log.
+
+        The merge and the filter are built outside the index lock, so adds and lookups carry on;
+        IDs added meanwhile stay in the log for the next compaction.
+        """
+        with self._compact_lock:
+            with self._lock:
+                if not self._recent or self.readonly or self._log is None:
+                    return
+                added = sorted(self._recent)
+                base = self._ids  # Only a compaction replaces the maps, and this one holds `_compact_lock`
+            merged = _merge(base, added)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, len(merged)))
+                merged.tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+            bloom_tmp = None
+            if self.use_bloom:
+                bloom_tmp = f"{self.bloom_path}.tmp"
+                hashes, bits, filter_bytes = self._bloom_bytes(merged, added)
+                with open(bloom_tmp, 'wb') as f:
+                    f.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, hashes, bits))
+                    f.write(filter_bytes)
+            with self._lock:
+                del base
+                self._close_maps()
+                try:
+                    # The filter first: a new filter over the old array only adds false positives,
+                    # an old filter over the new array would hide the merged IDs
+                    if bloom_tmp:
+                        os.replace(bloom_tmp, self.bloom_path)
+                    os.replace(tmp_path, self.path)
+                except PermissionError as e:
+                    # Another process has a file open (Windows); the log still holds every recent ID
+                    self.logger.warning(f"Seen index compaction postponed, files are in use: {e}")
+                    for leftover in (tmp_path, bloom_tmp):
+                        if leftover and os.path.exists(leftover):
+                            os.remove(leftover)
+                    self._retry_compact = time.monotonic() + 60
+                    self._open_maps()
+                    return
+                # The array now holds everything the log did, except IDs added during the merge
+                self._recent.difference_update(added)
+                self._log.close()
+                self._log = open(self.log_path, 'wb')
+                if self._recent:
+                    self._log.write(array('I', sorted(self._recent)).tobytes())
+                    self._log.flush()
+                self._open_maps()
+            self.logger.info(f"Seen index compacted: {len(merged)} IDs")
+
+    def close(self):
+        with self._lock:
+            if self._closed or self._stopping:
+                return
+            self._stopping = True
+        if self._compactor is not None:
+            self._compact_wanted.set()
+            self._compactor.join()
+        self.compact()
+        with self._compact_lock, self._lock:
+            if self._log is not None:
+                self._log.close()
+            self._close_maps()
+            self._closed = True
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_seen_index(config_path='config.ini'):
+    """Return the process-wide seen index for a config file, shared by the GUI and the crawlers."""
+    with _indexes_lock:
+        index = _indexes.get(config_path)
+        if index is None or index._closed:
+            index = _indexes[config_path] = SeenIndex.from_config(config_path)
+        return index
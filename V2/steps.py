@@ -0,0 +1,66 @@
+import logging
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+Step = namedtuple('Step', ['name', 'action', 'ready', 'timeout'])
+Step.__doc__ = """One navigation step: run `action(driver)`, then wait up to `timeout` seconds for `ready(driver)`."""
+
+
+class listing_refreshed:
+    """Readiness condition: the rows present before the action were replaced by a fresh listing."""
+
+    def __init__(self, locator):
+        self.locator = locator
+        self._old_row = None
+
+    def prepare(self, driver):
+        """Remember the current first row so its staleness marks the reload."""
+        rows = driver.find_elements(*self.locator)
+        self._old_row = rows[0] if rows else None
+
+    def __call__(self, driver):
+        if self._old_row is not None:
+            try:
+                self._old_row.is_enabled()
+                return False
+            except StaleElementReferenceException:
+                self._old_row = None
+        rows = driver.find_elements(*self.locator)
+        return rows or False
+
+
+class StepRunner:
+    """Runs declarative navigation steps, moving on as soon as each readiness condition holds."""
+
+    def __init__(self, poll_frequency=0.2):
+        self.poll_frequency = poll_frequency
+        self.timings = {}  # Step name -> seconds taken on the last run
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, driver, steps, stop_event=None):
+        """Run steps in order; a step whose condition times out is logged and the sequence continues."""
+        self.timings = {}
+        for step in steps:
+            if stop_event is not None and stop_event.is_set():
+                break
+            started = time.monotonic()
+            prepare = getattr(step.ready, 'prepare', None)
+            try:
+                if prepare:
+                    prepare(driver)
+                step.action(driver)
+                WebDriverWait(driver, step.timeout, poll_frequency=self.poll_frequency).until(step.ready)
+                outcome = "ready"
+            except TimeoutException:
+                outcome = f"not ready after {step.timeout}s"
+            except Exception as e:
+                outcome = f"failed: {e}"
+            elapsed = time.monotonic() - started
+            self.timings[step.name] = elapsed
+            self.logger.info(f"Step '{step.name}' {outcome} in {elapsed:.2f}s")
+        total = sum(self.timings.values())
+        self.logger.info(f"Navigation steps finished in {total:.2f}s")
+        return self.timings
@@ -1,9 +1,9 @@
-from auth import AuthManager
+from driver_pool import get_pool
 
 try:
-    auth = AuthManager()
-    driver = auth.login()
-    print("Login successful, page title:", driver.title)
-    auth.close()
+    pool = get_pool()
+    with pool.lease() as driver:
+        print("Login successful, page title:", driver.title)
+    pool.close()
 except Exception as e:
     print("Error:", str(e))
@@ -0,0 +1,26 @@
+from contact import NOT_FOUND, parse_contact_response
+
+# A reveal reply that is a whole page (login wall, error page) must not yield the footer's phone and email
+FULL_PAGE = """<!DOCTYPE html>
+<html><head><title>JOBKOREA</title></head><body>
+<form id="loginForm"><input id="M_ID"><input id="M_PWD" type="password"></form>
+<div class="footer">고객센터 02-565-9351 · helpdesk@jobkorea.co.kr</div>
+</body></html>"""
+FRAGMENT = """<div class="manager"><dl><dt>담당자</dt><dd>김담당</dd></dl></div>
+<dl><dd class="devTplLyClick"><span class="tahoma">02-123-4567</span></dd>
+<dd><a href="mailto:hr@example.com">hr@example.com</a></dd></dl>"""
+JSON = '{"Data": {"ChargeName": "김담당", "ChargeTel": "02-123-4567", "HotelName": "x"}}'
+
+contact = parse_contact_response(FULL_PAGE)
+print(f"Full page: {contact}")
+assert contact == (NOT_FOUND, NOT_FOUND, NOT_FOUND), "full page taken for a contact"
+contact = parse_contact_response('<p>로그인이 필요합니다 1588-9350</p>')
+print(f"Error fragment: {contact}")
+assert contact == (NOT_FOUND, NOT_FOUND, NOT_FOUND), "fragment without manager markup taken for a contact"
+contact = parse_contact_response(FRAGMENT)
+print(f"Manager fragment: {contact}")
+assert contact == ('김담당', '02-123-4567', 'hr@example.com')
+contact = parse_contact_response(JSON)
+print(f"JSON: {contact}")
+assert contact == ('김담당', '02-123-4567', NOT_FOUND)
+print("Contact responses OK")
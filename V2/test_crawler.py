@@ -1,4 +1,5 @@
 from crawler import SiteCrawler
+from log_setup import setup_logging
 
 
 def on_new(posts):
@@ -11,11 +12,14 @@ def on_status(message):
     print(f"Status: {message}")
 
 
-try:
-    crawler = SiteCrawler(on_new_callback=on_new, on_status_callback=on_status)
-    crawler.join()  # Run until manually stopped (Ctrl+C)
-except KeyboardInterrupt:
-    crawler.stop()
-    print("Crawler stopped")
-except Exception as e:
-    print("Error:", str(e))
+# Parse pool workers are spawned and re-import this script; only the main process may start a crawler
+if __name__ == '__main__':
+    setup_logging()
+    try:
+        crawler = SiteCrawler(on_new_callback=on_new, on_status_callback=on_status)
+        crawler.join()  # Run until manually stopped (Ctrl+C)
+    except KeyboardInterrupt:
+        crawler.stop()
+        print("Crawler stopped")
+    except Exception as e:
+        print("Error:", str(e))
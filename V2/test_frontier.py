@@ -0,0 +1,29 @@
+import os
+import tempfile
+
+from frontier import Frontier
+
+# A statement that fails mid-transaction must leave no trace of the ones before it
+path = os.path.join(tempfile.mkdtemp(), 'frontier.db')
+frontier = Frontier(path)
+records = [{'id': '1001', 'title': 'a'}, {'id': '1002', 'title': 'b'}]
+try:
+    with frontier._transaction() as db:
+        db.execute('INSERT INTO pages VALUES (?, ?, ?, ?)', ('smoke', 1, 'pending', 0))
+        db.execute('INSERT INTO details (post_id, search_key, page, record, state, updated) VALUES (?, ?, ?, ?, ?, ?)',
+                   ('1001', 'smoke', 1, '{}', 'claimed', 0))
+        raise RuntimeError("crash mid-transaction")
+except RuntimeError as e:
+    print(f"Raised: {e}")
+pages = frontier._execute('SELECT COUNT(*) FROM pages')[0][0]
+details = frontier._execute('SELECT COUNT(*) FROM details')[0][0]
+print(f"Rows after rollback: pages={pages}, details={details}")
+assert pages == 0 and details == 0, "transaction was not rolled back"
+
+claimed = frontier.claim_details('smoke', 1, records)
+print(f"Claimed {len(claimed)} posts: {frontier.counts('smoke')}")
+assert frontier.begin_cycle('smoke') == 1
+frontier.page_done('smoke', 1, 2)
+assert frontier.begin_cycle('smoke') == 2
+frontier.close()
+print("Frontier transactions OK")
@@ -0,0 +1,11 @@
+from listing import ListingFetcher
+
+try:
+    fetcher = ListingFetcher()
+    posts, total_pages = fetcher.fetch_posts(1)
+    print(f"Page 1: {len(posts)} posts, {total_pages} pages")
+    for post in posts[:5]:
+        print(f"ID: {post['id']}, Title: {post['title']}, Company: {post['company']}")
+    fetcher.close()
+except Exception as e:
+    print("Error:", str(e))
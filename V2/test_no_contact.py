@@ -0,0 +1,54 @@
+import asyncio
+import logging
+
+from async_crawler import _DONE, AsyncSiteCrawler
+from contact import NOT_FOUND
+from crawler import SiteCrawler
+from metrics import get_metrics
+
+# A post whose contact could not be extracted must be neither delivered nor remembered as seen
+RECORD = {'id': '48000001', 'title': 'No contact', 'company': 'Acme', 'details': [],
+          'details_url': 'https://www.jobkorea.co.kr/Recruit/GI_Read/48000001', 'has_contact': True}
+PAGE = "<html><body><div class='tbRow clear'></div><p>No manager section here</p></body></html>"
+
+
+class StubBackend:
+    name = 'stub'
+    interactive = False
+
+    def open_page(self, url):
+        return PAGE
+
+
+# Crawlers built without __init__, so no browser, login or thread is started
+crawler = SiteCrawler.__new__(SiteCrawler)
+crawler.logger = logging.getLogger('crawler')
+crawler.metrics = get_metrics()
+crawler.contact_client = None
+crawler.known_post_ids = set()
+post = crawler._fetch_post_detail_backend(StubBackend(), RECORD)
+print(f"SiteCrawler: post={post}, seen={crawler.known_post_ids}")
+assert post is None and not crawler.known_post_ids, "SiteCrawler kept a post without contact"
+
+delivered = []
+engine = AsyncSiteCrawler.__new__(AsyncSiteCrawler)
+engine.logger = logging.getLogger('async_crawler')
+engine.metrics = get_metrics()
+engine.parse_pool = None
+engine.known_post_ids = set()
+engine.cycle_new_posts = 0
+engine.sink_batch_size = 10
+engine.on_new_callback = delivered.extend
+
+
+async def run_stages():
+    sink = asyncio.Queue()
+    await engine._parse_stage((RECORD, PAGE, NOT_FOUND, NOT_FOUND, NOT_FOUND), sink)
+    await sink.put(_DONE)
+    await engine._sink(sink)
+
+
+asyncio.run(run_stages())
+print(f"AsyncSiteCrawler: delivered={delivered}, seen={engine.known_post_ids}")
+assert not delivered and not engine.known_post_ids, "AsyncSiteCrawler kept a post without contact"
+print("Posts without contact are skipped OK")
@@ -0,0 +1,23 @@
+import configparser
+import sys
+
+from listing import ListingFetcher
+from replay import ReplayServer
+
+# Usage: python test_replay.py recordings.zip  (config.ini [web] base_url must point at the [replay] port)
+try:
+    config = configparser.ConfigParser()
+    config.read('config.ini')
+    server = ReplayServer.from_config(sys.argv[1] if len(sys.argv) > 1 else 'recordings.zip', config)
+    server.start_background()
+    print(f"Replaying {len(server.archive.exchanges)} responses on {server.origin}")
+    fetcher = ListingFetcher()
+    posts, total_pages = fetcher.fetch_posts(1)
+    print(f"Page 1: {len(posts)} posts, {total_pages} pages")
+    for post in posts[:5]:
+        print(f"ID: {post['id']}, Title: {post['title']}, Company: {post['company']}")
+    fetcher.close()
+    server.shutdown()
+    print("Replay stats:", server.stats)
+except Exception as e:
+    print("Error:", str(e))
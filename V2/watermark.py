@@ -0,0 +1,143 @@
+import json
+import logging
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_MINUTES_AGO = re.compile(r'(\d+)\s*분\s*전')
+_HOURS_AGO = re.compile(r'(\d+)\s*시간\s*전')
+_DAYS_AGO = re.compile(r'(\d+)\s*일\s*전')
+_MONTH_DAY = re.compile(r'(\d{1,2})/(\d{1,2})')
+
+
+def parse_registered(text, now=None):
+    """Turn a listing's registration label ("3시간 전 등록", "07/01(화) 등록", ...) into a datetime."""
+    if not text:
+        return None
+    now = now or datetime.now()
+    if '방금' in text:
+        return now
+    match = _MINUTES_AGO.search(text)
+    if match:
+        return now - timedelta(minutes=int(match.group(1)))
+    match = _HOURS_AGO.search(text)
+    if match:
+        return now - timedelta(hours=int(match.group(1)))
+    match = _DAYS_AGO.search(text)
+    if match:
+        return now - timedelta(days=int(match.group(1)))
+    if '어제' in text:
+        return now - timedelta(days=1)
+    if '오늘' in text:
+        return now
+    match = _MONTH_DAY.search(text)
+    if match:
+        try:
+            registered = now.replace(month=int(match.group(1)), day=int(match.group(2)))
+        except ValueError:
+            return None
+        # A date later than today belongs to last year
+        return registered.replace(year=now.year - 1) if registered > now else registered
+    return None
+
+
+def _post_number(post_id):
+    try:
+        return int(post_id)
+    except (TypeError, ValueError):
+        return None
+
+
+class WatermarkStore:
+    """Per-search high-water marks (newest post ID and registration time) kept in a JSON file."""
+
+    def __init__(self, path='watermarks.json'):
+        self.path = Path(path)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._marks = {}
+        self._pending = {}  # Newest post seen per search during the current cycle
+        self._failed = {}  # Oldest post per search whose details failed this cycle
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._marks = json.load(f)
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Failed to load watermarks, starting fresh: {e}")
+
+    def get(self, search_key):
+        """Return the committed mark for a search as (post_id, registered datetime or None)."""
+        mark = self._marks.get(search_key)
+        if not mark:
+            return None, None
+        registered = mark.get('registered')
+        return mark.get('post_id'), datetime.fromisoformat(registered) if registered else None
+
+    def page_is_older(self, search_key, records):
+        """True when every post on a page is at or below the committed mark."""
+        mark_id, mark_registered = self.get(search_key)
+        if mark_id is None or not records:
+            return False
+        for record in records:
+            number = _post_number(record.get('id'))
+            if number is None or number > mark_id:
+                return False
+            registered = parse_registered(record.get('registered'))
+            if registered and mark_registered and registered > mark_registered:
+                return False
+        return True
+
+    def observe(self, search_key, records):
+        """Remember the newest post on a page; it becomes the mark when the cycle is committed."""
+        with self._lock:
+            pending = self._pending.setdefault(search_key, {'post_id': None, 'registered': None})
+            for record in records:
+                number = _post_number(record.get('id'))
+                if number is None:
+                    continue
+                if pending['post_id'] is None or number > pending['post_id']:
+                    pending['post_id'] = number
+                registered = parse_registered(record.get('registered'))
+                if registered and (pending['registered'] is None or registered > pending['registered']):
+                    pending['registered'] = registered
+
+    def fail(self, search_key, post_id):
+        """Note a post whose details could not be fetched; the mark will stay below it so a later cycle retries it."""
+        number = _post_number(post_id)
+        if number is None:
+            return
+        with self._lock:
+            failed = self._failed.get(search_key)
+            if failed is None or number < failed:
+                self._failed[search_key] = number
+
+    def commit(self, search_key):
+        """Advance the stored mark to the newest post seen this cycle, but not past a failed post, and persist it."""
+        with self._lock:
+            pending = self._pending.pop(search_key, None)
+            failed = self._failed.pop(search_key, None)
+            if not pending or pending['post_id'] is None:
+                return
+            post_id, registered = pending['post_id'], pending['registered']
+            if failed is not None and failed <= post_id:
+                # Registration labels are too coarse to place the mark just below the failed post
+                post_id, registered = failed - 1, None
+            mark_id, mark_registered = self.get(search_key)
+            if mark_id is not None and post_id <= mark_id:
+                return
+            registered = registered or mark_registered
+            self._marks[search_key] = {
+                'post_id': post_id,
+                'registered': registered.isoformat(timespec='seconds') if registered else None,
+                'updated': datetime.now().isoformat(timespec='seconds'),
+            }
+            try:
+                tmp_path = self.path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._marks, f, ensure_ascii=False, indent=2)
+                tmp_path.replace(self.path)
+            except OSError as e:
+                self.logger.error(f"Failed to save watermarks: {e}")
+                return
+            self.logger.info(f"Watermark for '{search_key}' advanced to post {post_id}")